@@ -0,0 +1,82 @@
+"""Per-call overhead of building an opportunity search request body.
+
+Times ``Opportunities._search_request`` (filter classification plus body
+assembly) for a few representative calls, next to the same call followed by the
+``OpportunitySearchRequest`` validate-and-dump round trip the body used to go
+through. No request is sent.
+
+Run with: poetry run python benchmarks/search_request.py [iterations]
+"""
+
+import sys
+import timeit
+from typing import Any
+
+from common_grants_sdk.client import Client
+from common_grants_sdk.client.config import Config
+from common_grants_sdk.extensions import f
+from common_grants_sdk.schemas.pydantic.models.opp_status import OppStatusOptions
+from common_grants_sdk.schemas.pydantic.requests import OpportunitySearchRequest
+from common_grants_sdk.schemas.pydantic.sorting import OppSortBy, OppSorting
+
+CASES: dict[str, dict[str, Any]] = {
+    "no filters": {},
+    "status shorthand": {"status": [OppStatusOptions.OPEN]},
+    "standard filters": {
+        "filters": {
+            "status": f.in_(["open", "forecasted"]),
+            "closeDateRange": f.between("2026-01-01", "2026-12-31"),
+        },
+    },
+    "mixed filters, sorted": {
+        "filters": {
+            "status": f.in_(["open"]),
+            "maxAwardAmountRange": {
+                "operator": "between",
+                "value": {
+                    "min": {"amount": "1000", "currency": "USD"},
+                    "max": {"amount": "50000", "currency": "USD"},
+                },
+            },
+            "legacyTag": f.eq("priority"),
+            "applicantType": f.in_(["nonprofit", "tribal"]),
+        },
+        "sorting": OppSorting(sortBy=OppSortBy.CLOSE_DATE, sortOrder="asc"),
+    },
+}
+
+
+def main(iterations: int) -> None:
+    """Print microseconds per call for each case, with and without the round trip."""
+    client = Client(Config(base_url="http://localhost:8000", api_key="benchmark"))
+    opportunities = client.opportunities
+
+    def direct(case: dict[str, Any]) -> dict[str, Any]:
+        body, _ = opportunities._search_request(
+            "education",
+            case.get("status"),
+            case.get("filters"),
+            case.get("sorting"),
+        )
+        return body
+
+    def round_trip(case: dict[str, Any]) -> dict[str, Any]:
+        return OpportunitySearchRequest.model_validate(direct(case)).model_dump(
+            by_alias=True, exclude_unset=True, mode="json"
+        )
+
+    print(f"{'case':<24}{'round trip':>14}{'direct':>10}{'speedup':>10}")
+    for name, case in CASES.items():
+        assert direct(case) == round_trip(case), name
+        before = timeit.timeit(lambda: round_trip(case), number=iterations)
+        after = timeit.timeit(lambda: direct(case), number=iterations)
+        print(
+            f"{name:<24}"
+            f"{before / iterations * 1e6:>11.1f} us"
+            f"{after / iterations * 1e6:>7.1f} us"
+            f"{before / after:>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
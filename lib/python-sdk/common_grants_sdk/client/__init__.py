@@ -1,17 +1,47 @@
 """Client module for the CommonGrants API."""
 
-from .auth import Auth
-from .client import BaseClient, Client
+from .auth import Auth, BearerToken
+from .checkpoint import PageCheckpoint
+from .client import AsyncBaseClient, AsyncClient, BaseClient, Client
 from .config import Config
-from .results import ListResult, ParseFailure, SearchResult, parse_batch
+from .federation import AsyncFederatedClient, FederatedClient
+from .prepared import PreparedSearch
+from .results import (
+    FederatedSearchResult,
+    GetManyResult,
+    LazyListResult,
+    LazyRows,
+    LazySearchResult,
+    ListResult,
+    ParseFailure,
+    SearchResult,
+    SyncResult,
+    parse_batch,
+)
+from .transport import build_async_transport, build_transport
 
 __all__ = [
+    "AsyncBaseClient",
+    "AsyncClient",
+    "AsyncFederatedClient",
     "Auth",
     "BaseClient",
+    "BearerToken",
     "Client",
     "Config",
+    "FederatedClient",
+    "FederatedSearchResult",
+    "GetManyResult",
+    "LazyListResult",
+    "LazyRows",
+    "LazySearchResult",
     "ListResult",
+    "PageCheckpoint",
     "ParseFailure",
+    "PreparedSearch",
     "SearchResult",
+    "SyncResult",
+    "build_async_transport",
+    "build_transport",
     "parse_batch",
 ]
@@ -1,8 +1,22 @@
 """Authentication classes for the CommonGrants HTTP client."""
 
+import hashlib
+import json
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Callable, Mapping, Optional
+
 
 class Auth:
-    """Authentication configuration for API requests."""
+    """Authentication configuration for API requests.
+
+    Attributes:
+        scope: Identifies the credentials in response cache and request
+            coalescing keys, so responses are never shared across credentials
+    """
 
     def __init__(self, headers: dict[str, str]):
         """Initialize auth with custom headers.
@@ -12,6 +26,8 @@ class Auth:
         """
         self._headers = headers.copy()
         self._headers["Accept"] = "application/json"
+        self._frozen: Mapping[str, str] = MappingProxyType(self._headers)
+        self.scope = _digest(self._headers)
 
     @classmethod
     def api_key(cls, key: str) -> "Auth":
@@ -37,10 +53,132 @@ class Auth:
         """
         return cls(headers={"Authorization": f"Bearer {token}"})
 
+    @classmethod
+    def refreshing(
+        cls,
+        provider: Callable[[], "BearerToken"],
+        refresh_ahead: float = 60.0,
+        scope: Optional[str] = None,
+    ) -> "RefreshingAuth":
+        """Create auth using bearer tokens fetched from ``provider``.
+
+        Args:
+            provider: Returns a fresh ``BearerToken``; called on first use and
+                again whenever the current token is about to expire
+            refresh_ahead: Seconds before expiry to start refreshing
+            scope: Names the principal the tokens are issued to, so processes
+                sharing a ``FileCache`` share entries; defaults to an ID unique
+                to this instance
+
+        Returns:
+            RefreshingAuth instance
+        """
+        return RefreshingAuth(provider, refresh_ahead, scope)
+
+    def headers(self) -> Mapping[str, str]:
+        """Get the headers for API requests, without copying.
+
+        Returns:
+            Read-only mapping of headers
+        """
+        return self._frozen
+
     def get_headers(self) -> dict[str, str]:
         """Get headers for API requests.
 
         Returns:
             Dictionary of headers
         """
-        return self._headers.copy()
+        return dict(self.headers())
+
+
+@dataclass(frozen=True)
+class BearerToken:
+    """A bearer token and when it expires.
+
+    Attributes:
+        token: The token value sent as ``Authorization: Bearer <token>``
+        expires_at: Expiry as a Unix timestamp; None if it never expires
+    """
+
+    token: str
+    expires_at: Optional[float] = None
+
+
+class RefreshingAuth(Auth):
+    """Bearer auth whose token is refreshed from a provider before it expires.
+
+    Requests keep using the cached headers until the token is within
+    ``refresh_ahead`` seconds of expiring. Then one caller refreshes it while
+    the others carry on with the still-valid token; only once the token has
+    actually expired do they wait for the refresh. Either way a burst of
+    requests calls the provider once.
+
+    The provider is called synchronously, including from ``AsyncClient``, so it
+    should return quickly.
+
+    The token rotates but the principal does not, so ``scope`` leaves the token
+    out: a refresh keeps cached responses and in-flight requests shared.
+
+    Args:
+        provider: Returns a fresh ``BearerToken``
+        refresh_ahead: Seconds before expiry to start refreshing
+        scope: Names the principal the tokens are issued to; defaults to an ID
+            unique to this instance
+    """
+
+    def __init__(
+        self,
+        provider: Callable[[], BearerToken],
+        refresh_ahead: float = 60.0,
+        scope: Optional[str] = None,
+    ):
+        super().__init__(headers={})
+        self.scope = _digest(self._headers, scope or f"refreshing:{uuid.uuid4()}")
+        self._provider = provider
+        self.refresh_ahead = refresh_ahead
+        self._token: Optional[BearerToken] = None
+        self._refresh_lock = threading.Lock()
+
+    def headers(self) -> Mapping[str, str]:
+        now = time.time()
+        token = self._token
+        if token is not None and not self._due(token, now):
+            return self._frozen
+        if token is not None and not self._expired(token, now):
+            # Still valid: refresh if nobody else is, otherwise keep using it. A
+            # failed early refresh is retried on the next request.
+            if self._refresh_lock.acquire(blocking=False):
+                try:
+                    if self._token is token:
+                        self._refresh()
+                except Exception:
+                    pass
+                finally:
+                    self._refresh_lock.release()
+            return self._frozen
+        with self._refresh_lock:
+            if self._token is token:
+                self._refresh()
+        return self._frozen
+
+    def _due(self, token: BearerToken, now: float) -> bool:
+        return token.expires_at is not None and now >= (
+            token.expires_at - self.refresh_ahead
+        )
+
+    def _expired(self, token: BearerToken, now: float) -> bool:
+        return token.expires_at is not None and now >= token.expires_at
+
+    def _refresh(self) -> None:
+        """Fetch a new token and swap in headers carrying it."""
+        token = self._provider()
+        headers = {**self._headers, "Authorization": f"Bearer {token.token}"}
+        self._frozen = MappingProxyType(headers)
+        self._token = token
+
+
+def _digest(headers: Mapping[str, str], *extra: str) -> str:
+    """A fingerprint of ``headers`` (and ``extra``) that does not reveal them."""
+    material = json.dumps([sorted(headers.items()), *extra])
+    return hashlib.sha256(material.encode()).hexdigest()
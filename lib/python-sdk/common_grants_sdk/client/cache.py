@@ -0,0 +1,319 @@
+"""Client-side HTTP response cache for the CommonGrants client.
+
+A ``ResponseCache`` on ``Config.cache`` stores successful GET and search
+responses keyed by method, URL, query params, request body and the credentials'
+``Auth.scope`` (not the raw headers, so a token refresh keeps the entries).
+Within ``ttl`` a repeated request is answered from the cache without a round
+trip; after that the client revalidates with ``If-None-Match`` /
+``If-Modified-Since`` and, on ``304 Not Modified``, reuses the stored entry.
+
+Parsed results are memoized on the stored entry, so a cache hit also skips
+pydantic validation (``FileCache`` keeps recently used entries loaded for this).
+Those models are shared between calls: treat results served from the cache as
+read-only.
+
+Entries live in a pluggable backend: ``MemoryCache`` (an in-process LRU, the
+default) or ``FileCache`` (one JSON file per entry, shared across processes).
+"""
+
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Hashable, Mapping, Optional, Protocol, TypeVar
+
+import httpx
+
+T = TypeVar("T")
+
+# httpx.Response.extensions key carrying the CachedResponse a response came from.
+CACHE_ENTRY = "commongrants.cache_entry"
+
+# Headers describing the body as it was sent over the wire. Entries store the
+# decoded body, so these would make httpx decode it a second time.
+_WIRE_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+def _stored_headers(headers: Mapping[str, str]) -> dict[str, str]:
+    return {
+        name: value
+        for name, value in headers.items()
+        if name.lower() not in _WIRE_HEADERS
+    }
+
+
+@dataclass
+class CachedResponse:
+    """A stored response and the validators used to revalidate it."""
+
+    method: str
+    url: str
+    status_code: int
+    headers: dict[str, str]
+    content: bytes
+    stored_at: float = field(default_factory=time.time)
+
+    @classmethod
+    def from_response(cls, response: httpx.Response) -> "CachedResponse":
+        """Capture ``response`` (already read) for storage."""
+        return cls(
+            method=response.request.method,
+            url=str(response.request.url),
+            status_code=response.status_code,
+            headers=_stored_headers(response.headers),
+            content=response.content,
+        )
+
+    def is_fresh(self, ttl: float, now: float) -> bool:
+        """Whether the entry may be served without contacting the server."""
+        return now - self.stored_at < ttl
+
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers that revalidate this entry."""
+        headers: dict[str, str] = {}
+        if etag := self.headers.get("etag"):
+            headers["If-None-Match"] = etag
+        if last_modified := self.headers.get("last-modified"):
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def to_response(self) -> httpx.Response:
+        """Rebuild an ``httpx.Response`` carrying this entry in its extensions."""
+        # Entries written before wire headers were dropped may still carry them.
+        return httpx.Response(
+            self.status_code,
+            headers=_stored_headers(self.headers),
+            content=self.content,
+            request=httpx.Request(self.method, self.url),
+            extensions={CACHE_ENTRY: self},
+        )
+
+
+class CacheBackend(Protocol):
+    """Storage for cached responses. Implementations must be thread-safe."""
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """The entry stored under ``key``, or None."""
+        ...
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        """Store ``entry`` under ``key``, replacing any previous entry."""
+        ...
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        ...
+
+
+class MemoryCache:
+    """In-process LRU backend holding at most ``max_entries`` responses."""
+
+    def __init__(self, max_entries: int = 256):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class FileCache:
+    """On-disk backend storing one JSON file per entry under ``directory``.
+
+    Entries survive restarts and can be shared by processes on one host. Each
+    write goes to a temporary file that is then renamed over the entry, so
+    readers never see a partial entry. An unreadable or corrupt entry is a miss.
+
+    The last ``max_loaded`` entries read or written are kept in memory and
+    returned as the same object while their file is unchanged, so results
+    parsed from an entry are reused across hits as with ``MemoryCache``.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str], max_loaded: int = 256):
+        self.directory = os.fspath(directory)
+        os.makedirs(self.directory, exist_ok=True)
+        self.max_loaded = max_loaded
+        # key -> (file version, entry loaded from or written to that version)
+        self._loaded: OrderedDict[str, tuple[tuple[int, int, int], CachedResponse]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        path = self._path(key)
+        try:
+            version = _file_version(path)
+            with self._lock:
+                loaded = self._loaded.get(key)
+            if loaded is not None and loaded[0] == version:
+                self._remember(key, version, loaded[1])
+                return loaded[1]
+            with open(path, encoding="utf-8") as file:
+                data = json.load(file)
+            data["content"] = base64.b64decode(data["content"], validate=True)
+            entry = CachedResponse(**data)
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+        self._remember(key, version, entry)
+        return entry
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        data = asdict(entry)
+        data["content"] = base64.b64encode(entry.content).decode("ascii")
+        path = self._path(key)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+        os.replace(temp_path, path)
+        self._remember(key, _file_version(path), entry)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._loaded.clear()
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                os.remove(os.path.join(self.directory, name))
+
+    def _remember(
+        self, key: str, version: tuple[int, int, int], entry: CachedResponse
+    ) -> None:
+        with self._lock:
+            self._loaded[key] = (version, entry)
+            self._loaded.move_to_end(key)
+            while len(self._loaded) > self.max_loaded:
+                self._loaded.popitem(last=False)
+
+
+def _file_version(path: str) -> tuple[int, int, int]:
+    """Identifies one write of ``path``: each write renames a new file over it."""
+    stat = os.stat(path)
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+@dataclass
+class CacheLookup:
+    """The cache's view of one outgoing request."""
+
+    key: str
+    entry: Optional[CachedResponse] = None
+    # Set when the entry is fresh and the request need not be sent.
+    response: Optional[httpx.Response] = None
+
+
+class ResponseCache:
+    """Caching policy for the client: a backend plus the freshness window.
+
+    Args:
+        backend: Where entries are stored; defaults to a ``MemoryCache``
+        ttl: Seconds a stored response is served without revalidation
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None, ttl: float = 60.0):
+        self.backend: CacheBackend = backend if backend is not None else MemoryCache()
+        self.ttl = ttl
+
+    @staticmethod
+    def key(method: str, url: str, scope: str, kwargs: dict[str, Any]) -> str:
+        """A stable key for a request: method, URL, params, body and ``Auth.scope``.
+
+        A body already serialized (``content``) is keyed on its bytes.
+        """
+        content = kwargs.get("content")
+        material = json.dumps(
+            [
+                method,
+                url,
+                kwargs.get("params"),
+                kwargs.get("json"),
+                hashlib.sha256(content).hexdigest() if content is not None else None,
+                scope,
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(material.encode()).hexdigest()
+
+    def lookup(
+        self, method: str, url: str, scope: str, kwargs: dict[str, Any]
+    ) -> CacheLookup:
+        """Find the stored entry for a request and whether it can be served as is."""
+        lookup = CacheLookup(key=self.key(method, url, scope, kwargs))
+        lookup.entry = self.backend.get(lookup.key)
+        if lookup.entry is not None and lookup.entry.is_fresh(self.ttl, time.time()):
+            lookup.response = lookup.entry.to_response()
+        return lookup
+
+    def conditional_headers(self, lookup: CacheLookup) -> dict[str, str]:
+        """Headers that turn the request into a revalidation of a stale entry."""
+        return lookup.entry.validators() if lookup.entry is not None else {}
+
+    def store(self, lookup: CacheLookup, response: httpx.Response) -> httpx.Response:
+        """Record the server's answer and return the response the caller sees.
+
+        A ``304`` refreshes the stored entry and returns it; a ``200`` (unless
+        marked ``no-store``) replaces it. Anything else passes through unstored.
+        """
+        if response.status_code == 304 and lookup.entry is not None:
+            entry = lookup.entry
+            entry.stored_at = time.time()
+            self.backend.set(lookup.key, entry)
+            return entry.to_response()
+        if response.status_code == 200 and "no-store" not in response.headers.get(
+            "cache-control", ""
+        ):
+            entry = CachedResponse.from_response(response)
+            self.backend.set(lookup.key, entry)
+            response.extensions = {**response.extensions, CACHE_ENTRY: entry}
+        return response
+
+
+_memos: dict[int, dict[Hashable, Any]] = {}
+_memos_lock = threading.Lock()
+
+
+def memoized(owner: object, key: Hashable, build: Callable[[], T]) -> T:
+    """``build()``'s result, computed once per ``owner`` and ``key``.
+
+    The memo lives as long as ``owner`` does, so results parsed from a cached
+    entry are reused for as long as the entry stays cached.
+    """
+    with _memos_lock:
+        memo = _memos.get(id(owner))
+        if memo is not None and key in memo:
+            return memo[key]
+    value = build()
+    with _memos_lock:
+        memo = _memos.get(id(owner))
+        if memo is None:
+            memo = _memos[id(owner)] = {}
+            weakref.finalize(owner, _memos.pop, id(owner), None)
+        memo.setdefault(key, value)
+        return memo[key]
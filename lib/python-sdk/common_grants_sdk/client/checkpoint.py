@@ -0,0 +1,196 @@
+"""Resumable page streams for the CommonGrants client.
+
+``iter_list`` / ``iter_search`` report a ``PageCheckpoint`` after each page they
+finish streaming. Persist it (``checkpoint.to_token()`` is a compact string) and
+pass it back as ``checkpoint=`` to pick an interrupted stream up where it left
+off instead of starting again from page 1.
+
+Resuming re-fetches the checkpoint's page and skips the rows up to and including
+the last ID seen. If that row is no longer on the page, rows ahead of it were
+removed (or inserted) in the meantime, so the stream walks back a page at a time
+to find it and continues after it. If it is on no earlier page either, the
+stream restarts from page 1. A resumed stream may repeat rows, but inserts and
+deletions do not make it skip rows it had not reached yet.
+"""
+
+import base64
+import hashlib
+import json
+from collections.abc import AsyncIterator, Awaitable, Iterator
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Optional
+
+from .pagination import _following_page, aiter_pages, iter_pages
+from ..schemas.pydantic.responses import Paginated
+
+
+@dataclass(frozen=True)
+class PageCheckpoint:
+    """How far a page stream got: enough to resume it later.
+
+    Attributes:
+        page: The last page fully streamed
+        page_size: The page size the stream was fetched with
+        request_hash: Fingerprint of the request (path and body), so a
+            checkpoint can't resume a different query
+        rows_seen: Rows streamed so far, including parse failures
+        last_id: ID of the last row streamed
+        last_modified_at: ``lastModifiedAt`` of the last row streamed, for
+            the caller's records (resuming locates the stream by ``last_id``)
+    """
+
+    page: int
+    page_size: int
+    request_hash: str
+    rows_seen: int
+    last_id: Optional[str] = None
+    last_modified_at: Optional[str] = None
+
+    def to_token(self) -> str:
+        """Serialize to an opaque, URL-safe string."""
+        payload = json.dumps(asdict(self), separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(payload).decode("ascii")
+
+    @classmethod
+    def from_token(cls, token: str) -> "PageCheckpoint":
+        """Parse a token made by :meth:`to_token`.
+
+        Raises:
+            ValueError: If the token is not a valid checkpoint
+        """
+        try:
+            return cls(**json.loads(base64.urlsafe_b64decode(token.encode("ascii"))))
+        except (TypeError, ValueError) as exc:
+            raise ValueError(f"Invalid checkpoint token: {token!r}") from exc
+
+
+def request_hash(path: str, request_data: Optional[dict[str, Any]] = None) -> str:
+    """Fingerprint of a paged request, stored in its checkpoints."""
+    material = json.dumps([path, request_data], sort_keys=True, default=str)
+    return hashlib.sha256(material.encode()).hexdigest()[:16]
+
+
+class PageCursor:
+    """Tracks a page stream's position and produces its checkpoints.
+
+    Args:
+        request_hash: Fingerprint of the request being streamed
+        page_size: The caller's page size, or None for the default
+        default_page_size: The client's configured page size
+        checkpoint: A checkpoint (or its token) to resume from
+
+    Raises:
+        ValueError: If the checkpoint belongs to a different request or was
+            taken with a different page size
+    """
+
+    def __init__(
+        self,
+        request_hash: str,
+        page_size: Optional[int],
+        default_page_size: int,
+        checkpoint: PageCheckpoint | str | None = None,
+    ):
+        if isinstance(checkpoint, str):
+            checkpoint = PageCheckpoint.from_token(checkpoint)
+        self.request_hash = request_hash
+        self.start_page = 1
+        self.rows_seen = 0
+        self._skip_through: Optional[str] = None
+        self._last_id: Optional[str] = None
+        self._last_modified_at: Optional[str] = None
+        if checkpoint is None:
+            self.page_size = page_size or default_page_size
+            return
+        if checkpoint.request_hash != request_hash:
+            raise ValueError("checkpoint was taken for a different request")
+        if page_size is not None and page_size != checkpoint.page_size:
+            raise ValueError(
+                f"checkpoint was taken with page_size={checkpoint.page_size}"
+            )
+        self.page_size = checkpoint.page_size
+        self.start_page = checkpoint.page
+        self.rows_seen = checkpoint.rows_seen
+        self._skip_through = checkpoint.last_id
+        self._last_id = checkpoint.last_id
+        self._last_modified_at = checkpoint.last_modified_at
+
+    def pages(
+        self, fetch_page: Callable[[int], Paginated[Any]]
+    ) -> Iterator[Paginated[Any]]:
+        """Yield the stream's pages, starting where the checkpoint left off."""
+        page = fetch_page(self.start_page)
+        while (earlier := self._earlier_page(page)) is not None:
+            page = fetch_page(earlier)
+        yield page
+        if (following := _following_page(page)) is not None:
+            yield from iter_pages(fetch_page, following)
+
+    async def apages(
+        self, fetch_page: Callable[[int], Awaitable[Paginated[Any]]]
+    ) -> AsyncIterator[Paginated[Any]]:
+        """Async counterpart of :meth:`pages`."""
+        page = await fetch_page(self.start_page)
+        while (earlier := self._earlier_page(page)) is not None:
+            page = await fetch_page(earlier)
+        yield page
+        if (following := _following_page(page)) is not None:
+            async for page in aiter_pages(fetch_page, following):
+                yield page
+
+    def _earlier_page(self, page: Paginated[Any]) -> Optional[int]:
+        """The page to look for the checkpoint's last row on next, if not ``page``.
+
+        Returns None once the stream should start at ``page``: the row is on it,
+        the stream is not resuming, or page 1 was reached without finding it (in
+        which case page 1 is streamed in full).
+        """
+        if self._skip_through is None or self._skip_through in _row_ids(page.items):
+            return None
+        if page.pagination_info.page > 1:
+            return page.pagination_info.page - 1
+        self._skip_through = None
+        return None
+
+    def unseen_rows(self, page: Paginated[Any]) -> list[Any]:
+        """The rows of ``page`` not yet streamed.
+
+        Only the first page of a resumed stream can hold rows already streamed:
+        those up to and including the checkpoint's last ID.
+        """
+        rows = list(page.items)
+        skip_through, self._skip_through = self._skip_through, None
+        if skip_through is not None:
+            ids = _row_ids(rows)
+            if skip_through in ids:
+                return rows[ids.index(skip_through) + 1 :]
+        return rows
+
+    def advance(self, page: Paginated[Any], rows: list[Any]) -> PageCheckpoint:
+        """Record that ``rows`` of ``page`` were streamed; return the checkpoint."""
+        self.rows_seen += len(rows)
+        if rows:
+            self._last_id = _row_value(rows[-1], "id", "id")
+            self._last_modified_at = _row_value(
+                rows[-1], "lastModifiedAt", "last_modified_at"
+            )
+        return PageCheckpoint(
+            page=page.pagination_info.page,
+            page_size=self.page_size,
+            request_hash=self.request_hash,
+            rows_seen=self.rows_seen,
+            last_id=self._last_id,
+            last_modified_at=self._last_modified_at,
+        )
+
+
+def _row_ids(rows: list[Any]) -> list[Optional[str]]:
+    return [_row_value(row, "id", "id") for row in rows]
+
+
+def _row_value(row: Any, key: str, attr: str) -> Optional[str]:
+    """A field of a raw (dict) or already-parsed row, as a string."""
+    value = row.get(key) if isinstance(row, dict) else getattr(row, attr, None)
+    if value is None:
+        return None
+    return value.isoformat() if hasattr(value, "isoformat") else str(value)
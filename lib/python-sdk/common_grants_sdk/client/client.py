@@ -7,29 +7,49 @@ with ``plugin.get_client(...)``: that binds the plugin's route filters
 ``client.opportunities.search(filters=...)`` is typed and responses parse with the
 plugin's custom fields by default. Constructing ``Client`` directly gives an
 unscoped client (standard filters only, base ``OpportunityBase`` rows).
+
+``AsyncBaseClient`` / ``AsyncClient`` are the ``asyncio`` counterparts, built on
+``httpx.AsyncClient``. They share the same ``Config``, ``Auth``, plugin binding and
+result shapes; build a scoped one with ``plugin.get_async_client(...)``.
 """
 
 from __future__ import annotations
 
 import httpx
-from typing import Any, Generic, Optional, cast
+from typing import Any, Callable, Generic, Hashable, Mapping, Optional, TypeVar, cast
 from uuid import UUID
 
 import typing_extensions as te
+from pydantic import BaseModel, ValidationError
 
 from .auth import Auth
+from .cache import CACHE_ENTRY, ResponseCache, memoized
+from .coalesce import AsyncSingleFlight, SingleFlight
+from .compression import (
+    COMPRESSED_BODY_HEADERS,
+    JSON_BODY_HEADERS,
+    BodyCompressor,
+    record_transfer,
+)
 from .config import Config
+from .hedge import asend_hedged, send_hedged
+from .instrumentation import Instrumentation
 from .response import SuccessResponse
+from .retry import asend_with_retry, send_with_retry
 from .exceptions import raise_api_error
-from .opportunities import Opportunities
-from .pagination import pagination
+from .opportunities import AsyncOpportunities, Opportunities
+from .pagination import async_pagination, pagination
+from .transport import async_client_options, client_options
 from .types import ItemsT
-from ..extensions.filters import validate_routes
+from ..extensions.filters import FilterClassifier, compile_classifier, validate_routes
 from ..extensions.plugin import PluginSchemas
 from ..extensions.types import FiltersT, PluginRoutes, ResourceRoutes
 from ..schemas.pydantic.models import OpportunityBase
 from ..schemas.pydantic.responses import Filtered, Paginated
 
+T = TypeVar("T")
+M = TypeVar("M", bound=BaseModel)
+
 # Bound is OpportunityBase[Any] (the custom-fields parameter is invariant, so a
 # bare OpportunityBase bound would reject OpportunityBase[OppCustomFields]).
 ItemT = te.TypeVar(
@@ -51,7 +71,124 @@ def _resolve_opportunity_schema(
     return common if isinstance(common, type) else OpportunityBase
 
 
-class BaseClient:
+def _search_body(request_data: dict[str, Any] | bytes) -> dict[str, Any]:
+    """The ``post`` kwargs carrying a search body: JSON, or bytes sent as is."""
+    if isinstance(request_data, bytes):
+        return {"content": request_data, "headers": JSON_BODY_HEADERS}
+    return {"json": request_data}
+
+
+class _ClientCore:
+    """Config, auth and request shaping shared by the sync and async transports."""
+
+    def __init__(
+        self,
+        config: Optional[Config] = None,
+        auth: Optional[Auth] = None,
+    ):
+        self.config = config or Config()
+        self.auth = auth or Auth.api_key(self.config.api_key)
+        self.instrumentation = Instrumentation(self.config.observers)
+        # Headers sent on every request on top of the auth headers.
+        self._extra_headers: dict[str, str] = {}
+        if self.config.accept_encoding is not None:
+            self._extra_headers["Accept-Encoding"] = self.config.accept_encoding
+        self._compressor = (
+            BodyCompressor(self.config.compress_requests_over)
+            if self.config.compress_requests_over is not None
+            else None
+        )
+
+    def _page_size(self, page_size: int | None) -> int:
+        """The page size to request: the caller's, else the config default."""
+        page_size = page_size or self.config.page_size
+        if page_size < 1:
+            page_size = self.config.page_size
+        return page_size
+
+    def _parsed(
+        self, response: httpx.Response, key: Hashable, parse: Callable[[], T]
+    ) -> T:
+        """``parse()``, reused across calls sharing ``response``.
+
+        Responses are shared when served from the cache or coalesced with an
+        identical request in flight.
+        """
+        entry = response.extensions.get(CACHE_ENTRY)
+        if entry is not None:
+            return memoized(entry, key, parse)
+        if self.config.coalesce:
+            return memoized(response, key, parse)
+        return parse()
+
+    def _decode_page(
+        self,
+        response: httpx.Response,
+        envelope: type[Paginated[Any]],
+        typed_envelope: type[Paginated[Any]] | None,
+    ) -> Paginated[Any]:
+        """Validate a page body into ``envelope`` (rows left as dicts).
+
+        With ``config.fast_decode`` and a ``typed_envelope``, the envelope and its
+        rows are validated in one pass straight from the raw bytes, skipping the
+        intermediate dict tree. If any row fails that pass, the body is decoded
+        the dict way instead, so the resource layer can localize the bad rows.
+        """
+        if self.config.fast_decode and typed_envelope is not None:
+            try:
+                with self.instrumentation.timed("validate.envelope", fast=True):
+                    return typed_envelope.model_validate_json(response.content)
+            except ValidationError:
+                pass
+        return self._validate_body(response, envelope)
+
+    def _validate_body(self, response: httpx.Response, model: type[M]) -> M:
+        """Decode a JSON response body and validate it into ``model``."""
+        with self.instrumentation.timed("decode"):
+            body = response.json()
+        with self.instrumentation.timed("validate.envelope", fast=False):
+            return model.model_validate(body)
+
+    def _memoized(self, owner: object, key: Hashable, parse: Callable[[], T]) -> T:
+        """``parse()``, reused for the same ``owner`` while caching or coalescing.
+
+        Lets the resource layer keep the rows it parsed from a shared envelope.
+        """
+        if self.config.cache is None and not self.config.coalesce:
+            return parse()
+        return memoized(owner, key, parse)
+
+    def _request_headers(
+        self,
+        conditional: dict[str, str],
+        compressed: bool,
+        request: Optional[Mapping[str, str]] = None,
+    ) -> Mapping[str, str]:
+        """The headers for one attempt: auth, then any configured or per-request.
+
+        Read per attempt, so a retry picks up a refreshed token.
+        """
+        headers = self.auth.headers()
+        if self._extra_headers or conditional or compressed or request:
+            headers = {**headers, **self._extra_headers, **(request or {})}
+            headers.update(conditional)
+            if compressed:
+                headers.update(COMPRESSED_BODY_HEADERS)
+        return headers
+
+    def _received(self, response: httpx.Response, compressed: bool) -> None:
+        """Account for a response and learn whether compressed bodies are taken."""
+        record_transfer(response)
+        if self._compressor is not None:
+            self._compressor.observe(response, compressed)
+
+    def url(self, path: str) -> str:
+        """Construct a full URL from base URL and path (trailing slash stripped)."""
+        base = self.config.base_url.rstrip("/")
+        return f"{base}{path}"
+
+
+class BaseClient(_ClientCore):
     """Transport plumbing for the CommonGrants API (auth + paginated GET/POST)."""
 
     def __init__(
@@ -66,26 +203,108 @@ class BaseClient:
             auth: Optional Auth instance. If None, API key authentication is used
                 with the key from config.
         """
-        self.config = config or Config()
-        self.auth = auth or Auth.api_key(self.config.api_key)
-        self.http = httpx.Client(timeout=self.config.timeout)
-
-    def post(self, path: str, **kwargs) -> httpx.Response:
-        """Wrapper around ``self.http.post`` that adds auth headers."""
-        return self.http.post(
-            self.url(path),
-            headers=self.auth.get_headers(),
-            **kwargs,
-        )
+        super().__init__(config=config, auth=auth)
+        self.http = httpx.Client(**client_options(self.config))
+        self._flights = SingleFlight() if self.config.coalesce else None
+
+    def post(self, path: str, *, idempotent: bool = False, **kwargs) -> httpx.Response:
+        """Wrapper around ``self.http.post`` that adds auth headers.
+
+        POSTs are only retried under ``config.retry`` (and cached under
+        ``config.cache``) when ``idempotent`` is True, e.g. search, which reads
+        without side effects.
+        """
+        return self._request("POST", path, kwargs, idempotent=idempotent)
 
     def get(self, path: str, **kwargs) -> httpx.Response:
-        """Wrapper around ``self.http.get`` that adds auth headers."""
-        return self.http.get(
-            self.url(path),
-            headers=self.auth.get_headers(),
-            **kwargs,
+        """Wrapper around ``self.http.get`` that adds auth headers.
+
+        Retried under ``config.retry`` and cached under ``config.cache``.
+        """
+        return self._request("GET", path, kwargs, idempotent=True)
+
+    def _request(
+        self, method: str, path: str, kwargs: dict[str, Any], idempotent: bool
+    ) -> httpx.Response:
+        """Send one request, coalesced with an identical one already in flight."""
+        url = self.url(path)
+        if self._flights is None or not idempotent:
+            return self._send(method, url, kwargs, idempotent)
+        key = ResponseCache.key(method, url, self.auth.scope, kwargs)
+        return self._flights.do(
+            key, lambda: self._send(method, url, kwargs, idempotent)
+        )
+
+    def _send(
+        self, method: str, url: str, kwargs: dict[str, Any], idempotent: bool
+    ) -> httpx.Response:
+        """Send one request through the cache, retry, hedge and rate-limit policies."""
+        cache = self.config.cache if idempotent else None
+        lookup = cache.lookup(method, url, self.auth.scope, kwargs) if cache else None
+        if lookup is not None and lookup.response is not None:
+            return lookup.response
+        conditional = (
+            cache.conditional_headers(lookup)
+            if cache is not None and lookup is not None
+            else {}
         )
 
+        request_headers = kwargs.get("headers")
+        if request_headers is not None:
+            kwargs = {key: value for key, value in kwargs.items() if key != "headers"}
+
+        instrumentation = self.instrumentation
+        attempt = 0
+
+        limiter = self.config.rate_limit
+        hedge = self.config.hedge
+        compressed = self._compressor.compress(kwargs) if self._compressor else None
+
+        def send() -> httpx.Response:
+            return send_hedged(hedge, send_paced, idempotent=idempotent)
+
+        def send_paced() -> httpx.Response:
+            if limiter is None:
+                return send_once()
+            with limiter.acquire():
+                response = send_once()
+            limiter.observe(response)
+            return response
+
+        def send_once() -> httpx.Response:
+            nonlocal attempt
+            attempt += 1
+            http_send = self.http.get if method == "GET" else self.http.post
+            headers = self._request_headers(
+                conditional, compressed is not None, request_headers
+            )
+            send_kwargs = kwargs if compressed is None else compressed
+            if not instrumentation.observers:
+                response = http_send(url, headers=headers, **send_kwargs)
+            else:
+                with instrumentation.timed(
+                    "http.request", method=method, url=url, attempt=attempt
+                ) as attributes:
+                    response = http_send(
+                        url,
+                        headers=headers,
+                        extensions={"trace": instrumentation.tracer()},
+                        **send_kwargs,
+                    )
+                    attributes["status_code"] = response.status_code
+                    attributes["bytes"] = len(response.content)
+            self._received(response, compressed is not None)
+            return response
+
+        response = send_with_retry(self.config.retry, send, idempotent=idempotent)
+        if compressed is not None and response.status_code == 415:
+            # The server refused the gzipped body: send it as is.
+            compressed = None
+            response = send_with_retry(self.config.retry, send, idempotent=idempotent)
+        if cache is not None and lookup is not None:
+            return cache.store(lookup, response)
+        return response
+
     def get_item(
         self,
         path: str,
@@ -99,7 +318,11 @@ class BaseClient:
         try:
             api_response = self.get(f"{path}/{item_id}")
             api_response.raise_for_status()
-            result = SuccessResponse.model_validate(api_response.json())
+            result = self._parsed(
+                api_response,
+                SuccessResponse,
+                lambda: self._validate_body(api_response, SuccessResponse),
+            )
 
         except httpx.HTTPError as e:
             raise_api_error(e)
@@ -113,17 +336,18 @@ class BaseClient:
         page: int | None = None,
         page_size: int | None = None,
         params: dict[str, Any] | None = None,
+        schema: type[BaseModel] | None = None,
     ) -> Paginated[ItemsT]:
         """Fetch a set of items via GET, with pagination.
 
         When page is None, aggregates all pages up to ``config.list_items_limit``.
+        ``schema`` is the row model; with ``config.fast_decode`` rows are
+        validated into it while decoding (otherwise they are left as dicts).
 
         Raises:
             APIError: If the API request fails
         """
-        page_size = page_size or self.config.page_size
-        if page_size < 1:
-            page_size = self.config.page_size
+        page_size = self._page_size(page_size)
 
         try:
             request_params = {"page": page, "pageSize": page_size}
@@ -131,7 +355,15 @@ class BaseClient:
                 request_params.update(params)
             api_response = self.get(path, params=request_params)
             api_response.raise_for_status()
-            result_dict = Paginated[dict].model_validate(api_response.json())
+            result_dict = self._parsed(
+                api_response,
+                (Paginated, schema),
+                lambda: self._decode_page(
+                    api_response,
+                    Paginated[dict],
+                    Paginated[schema] if schema is not None else None,
+                ),
+            )
             result = cast(Paginated[ItemsT], result_dict)
 
         except httpx.HTTPError as e:
@@ -143,31 +375,49 @@ class BaseClient:
     def search(
         self,
         path: str,
-        request_data: dict[str, Any],
+        request_data: dict[str, Any] | bytes,
         page: int | None = None,
         page_size: int | None = None,
+        params: dict[str, Any] | None = None,
+        schema: type[BaseModel] | None = None,
     ) -> Paginated[ItemsT]:
         """Fetch a set of items via POST, with pagination.
 
         When page is None, aggregates all pages up to ``config.list_items_limit``.
+        ``params`` are extra query parameters and ``schema`` is the row model,
+        as for :meth:`list`. ``request_data`` may be an already serialized JSON
+        body, which is sent byte for byte.
 
         Raises:
             APIError: If the API request fails
         """
-        page_size = page_size or self.config.page_size
-        if page_size < 1:
-            page_size = self.config.page_size
+        page_size = self._page_size(page_size)
 
         try:
+            request_params = {"page": page, "pageSize": page_size}
+            if params:
+                request_params.update(params)
             # request_data already includes any filters assembled by the resource method.
+            # Search only reads, so it is safe to retry like a GET.
             api_response = self.post(
-                path, json=request_data, params={"page": page, "pageSize": page_size}
+                path,
+                params=request_params,
+                idempotent=True,
+                **_search_body(request_data),
             )
             api_response.raise_for_status()
             # Validate into Filtered so the server's sortInfo/filterInfo (incl.
             # filterInfo.errors) survive instead of being dropped.
             # Filtered IS-A Paginated, so the existing cast still holds.
-            result_dict = Filtered[dict, dict].model_validate(api_response.json())
+            result_dict = self._parsed(
+                api_response,
+                (Filtered, schema),
+                lambda: self._decode_page(
+                    api_response,
+                    Filtered[dict, dict],
+                    Filtered[schema, dict] if schema is not None else None,
+                ),
+            )
             result = cast(Paginated[ItemsT], result_dict)
 
         except httpx.HTTPError as e:
@@ -175,11 +425,6 @@ class BaseClient:
 
         return result
 
-    def url(self, path: str) -> str:
-        """Construct a full URL from base URL and path (trailing slash stripped)."""
-        base = self.config.base_url.rstrip("/")
-        return f"{base}{path}"
-
     def close(self):
         """Close the HTTP client and release resources."""
         self.http.close()
@@ -193,15 +438,11 @@ class BaseClient:
         self.close()
 
 
-class Client(BaseClient, Generic[FiltersT, ItemT]):
-    """Typed resource facade over :class:`BaseClient`.
+class AsyncBaseClient(_ClientCore):
+    """Async transport plumbing for the CommonGrants API, on ``httpx.AsyncClient``.
 
-    Binds a plugin's route filters and Opportunity schema, exposing the typed
-    ``opportunities`` resource. Construct one via ``plugin.get_client(...)``: that
-    binds the plugin's registered filters (``FiltersT``) and Opportunity schema
-    (``ItemT``) so ``opportunities.search`` is typed and responses parse with the
-    plugin's custom fields. Constructing ``Client`` directly leaves those generics
-    unbound (standard filters only, base ``OpportunityBase`` rows).
+    Mirrors :class:`BaseClient` method for method; every request method is a
+    coroutine, so one event loop can drive many requests concurrently.
     """
 
     def __init__(
@@ -209,25 +450,270 @@ class Client(BaseClient, Generic[FiltersT, ItemT]):
         config: Optional[Config] = None,
         auth: Optional[Auth] = None,
     ):
-        """Initialize the client.
+        """Initialize the async transport layer.
 
         Args:
-            config: Optional Config instance.
-            auth: Optional Auth instance.
+            config: Optional Config instance. If None, a default Config is created.
+            auth: Optional Auth instance. If None, API key authentication is used
+                with the key from config.
         """
         super().__init__(config=config, auth=auth)
+        self.http = httpx.AsyncClient(**async_client_options(self.config))
+        self._flights = AsyncSingleFlight() if self.config.coalesce else None
+
+    async def post(
+        self, path: str, *, idempotent: bool = False, **kwargs
+    ) -> httpx.Response:
+        """Wrapper around ``self.http.post`` that adds auth headers.
+
+        POSTs are only retried and cached when ``idempotent`` is True.
+        """
+        return await self._request("POST", path, kwargs, idempotent=idempotent)
+
+    async def get(self, path: str, **kwargs) -> httpx.Response:
+        """Wrapper around ``self.http.get`` that adds auth headers.
+
+        Retried under ``config.retry`` and cached under ``config.cache``.
+        """
+        return await self._request("GET", path, kwargs, idempotent=True)
+
+    async def _request(
+        self, method: str, path: str, kwargs: dict[str, Any], idempotent: bool
+    ) -> httpx.Response:
+        """Send one request, coalesced with an identical one already in flight."""
+        url = self.url(path)
+        if self._flights is None or not idempotent:
+            return await self._send(method, url, kwargs, idempotent)
+        key = ResponseCache.key(method, url, self.auth.scope, kwargs)
+        return await self._flights.do(
+            key, lambda: self._send(method, url, kwargs, idempotent)
+        )
+
+    async def _send(
+        self, method: str, url: str, kwargs: dict[str, Any], idempotent: bool
+    ) -> httpx.Response:
+        """Send one request through the cache, retry, hedge and rate-limit policies."""
+        cache = self.config.cache if idempotent else None
+        lookup = cache.lookup(method, url, self.auth.scope, kwargs) if cache else None
+        if lookup is not None and lookup.response is not None:
+            return lookup.response
+        conditional = (
+            cache.conditional_headers(lookup)
+            if cache is not None and lookup is not None
+            else {}
+        )
+
+        request_headers = kwargs.get("headers")
+        if request_headers is not None:
+            kwargs = {key: value for key, value in kwargs.items() if key != "headers"}
+
+        instrumentation = self.instrumentation
+        attempt = 0
+
+        limiter = self.config.rate_limit
+        hedge = self.config.hedge
+        compressed = self._compressor.compress(kwargs) if self._compressor else None
+
+        async def send() -> httpx.Response:
+            return await asend_hedged(hedge, send_paced, idempotent=idempotent)
+
+        async def send_paced() -> httpx.Response:
+            if limiter is None:
+                return await send_once()
+            async with limiter.aacquire():
+                response = await send_once()
+            limiter.observe(response)
+            return response
+
+        async def send_once() -> httpx.Response:
+            nonlocal attempt
+            attempt += 1
+            http_send = self.http.get if method == "GET" else self.http.post
+            headers = self._request_headers(
+                conditional, compressed is not None, request_headers
+            )
+            send_kwargs = kwargs if compressed is None else compressed
+            if not instrumentation.observers:
+                response = await http_send(url, headers=headers, **send_kwargs)
+            else:
+                with instrumentation.timed(
+                    "http.request", method=method, url=url, attempt=attempt
+                ) as attributes:
+                    response = await http_send(
+                        url,
+                        headers=headers,
+                        extensions={"trace": instrumentation.async_tracer()},
+                        **send_kwargs,
+                    )
+                    attributes["status_code"] = response.status_code
+                    attributes["bytes"] = len(response.content)
+            self._received(response, compressed is not None)
+            return response
+
+        response = await asend_with_retry(
+            self.config.retry, send, idempotent=idempotent
+        )
+        if compressed is not None and response.status_code == 415:
+            # The server refused the gzipped body: send it as is.
+            compressed = None
+            response = await asend_with_retry(
+                self.config.retry, send, idempotent=idempotent
+            )
+        if cache is not None and lookup is not None:
+            return cache.store(lookup, response)
+        return response
+
+    async def get_item(
+        self,
+        path: str,
+        item_id: str | UUID,
+    ) -> SuccessResponse:
+        """Get a specific item by ID (GET ``{path}/{item_id}``).
+
+        Raises:
+            APIError: If the API request fails
+        """
+        try:
+            api_response = await self.get(f"{path}/{item_id}")
+            api_response.raise_for_status()
+            result = self._parsed(
+                api_response,
+                SuccessResponse,
+                lambda: self._validate_body(api_response, SuccessResponse),
+            )
+
+        except httpx.HTTPError as e:
+            raise_api_error(e)
+
+        return result
+
+    @async_pagination
+    async def list(
+        self,
+        path: str,
+        page: int | None = None,
+        page_size: int | None = None,
+        params: dict[str, Any] | None = None,
+        schema: type[BaseModel] | None = None,
+    ) -> Paginated[ItemsT]:
+        """Fetch a set of items via GET, with pagination.
+
+        When page is None, aggregates all pages up to ``config.list_items_limit``.
+        ``schema`` is the row model; with ``config.fast_decode`` rows are
+        validated into it while decoding (otherwise they are left as dicts).
+
+        Raises:
+            APIError: If the API request fails
+        """
+        page_size = self._page_size(page_size)
+
+        try:
+            request_params = {"page": page, "pageSize": page_size}
+            if params:
+                request_params.update(params)
+            api_response = await self.get(path, params=request_params)
+            api_response.raise_for_status()
+            result_dict = self._parsed(
+                api_response,
+                (Paginated, schema),
+                lambda: self._decode_page(
+                    api_response,
+                    Paginated[dict],
+                    Paginated[schema] if schema is not None else None,
+                ),
+            )
+            result = cast(Paginated[ItemsT], result_dict)
+
+        except httpx.HTTPError as e:
+            raise_api_error(e)  # Always raises, never returns
+
+        return result
+
+    @async_pagination
+    async def search(
+        self,
+        path: str,
+        request_data: dict[str, Any] | bytes,
+        page: int | None = None,
+        page_size: int | None = None,
+        params: dict[str, Any] | None = None,
+        schema: type[BaseModel] | None = None,
+    ) -> Paginated[ItemsT]:
+        """Fetch a set of items via POST, with pagination.
+
+        When page is None, aggregates all pages up to ``config.list_items_limit``.
+        ``params`` are extra query parameters and ``schema`` is the row model,
+        as for :meth:`list`. ``request_data`` may be an already serialized JSON
+        body, which is sent byte for byte.
+
+        Raises:
+            APIError: If the API request fails
+        """
+        page_size = self._page_size(page_size)
+
+        try:
+            request_params = {"page": page, "pageSize": page_size}
+            if params:
+                request_params.update(params)
+            api_response = await self.post(
+                path,
+                params=request_params,
+                idempotent=True,
+                **_search_body(request_data),
+            )
+            api_response.raise_for_status()
+            result_dict = self._parsed(
+                api_response,
+                (Filtered, schema),
+                lambda: self._decode_page(
+                    api_response,
+                    Filtered[dict, dict],
+                    Filtered[schema, dict] if schema is not None else None,
+                ),
+            )
+            result = cast(Paginated[ItemsT], result_dict)
+
+        except httpx.HTTPError as e:
+            raise_api_error(e)  # Always raises, never returns
+
+        return result
+
+    async def aclose(self):
+        """Close the HTTP client and release resources."""
+        await self.http.aclose()
+
+    async def __aenter__(self):
+        """Async context manager entry; returns the client instance."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit; closes the HTTP client."""
+        await self.aclose()
+
+
+class _PluginScope:
+    """Plugin binding shared by ``Client`` and ``AsyncClient``.
+
+    Holds the bound route filters and Opportunity schema that the resource
+    facades read when classifying filters and parsing responses.
+    """
+
+    def _init_scope(self) -> None:
+        """Start unscoped: no registered filters, base ``OpportunityBase`` rows."""
         self._routes: PluginRoutes[Any] = PluginRoutes(opportunities=ResourceRoutes())
+        self._search_classifier: FilterClassifier = compile_classifier(
+            self._routes, "opportunities", "search"
+        )
         self._schemas: Optional[PluginSchemas[Any]] = None
         self._opportunity_schema: type[OpportunityBase] = _resolve_opportunity_schema(
             None
         )
-        self.opportunities: Opportunities[FiltersT, ItemT] = Opportunities(client=self)
 
     def _bind_routes(self, routes: PluginRoutes[Any]) -> None:
         """Scope this client to a plugin's registered custom filters.
 
         Internal hook called by ``plugin.get_client``: it validates the route
-        registration and stores it for ``opportunities.search`` to classify
+        registration and compiles the classifier ``opportunities.search`` uses for
         registered custom filters. Build scoped clients via ``get_client`` rather
         than calling this directly.
 
@@ -237,6 +723,8 @@ class Client(BaseClient, Generic[FiltersT, ItemT]):
         """
         validate_routes(routes)
         self._routes = routes
+        # Compile the search classifier now, so no search pays for the reflection.
+        self._search_classifier = compile_classifier(routes, "opportunities", "search")
 
     def _bind_schemas(self, schemas: Optional[PluginSchemas[Any]]) -> None:
         """Bind a plugin's schema extensions as the default parse schemas.
@@ -247,3 +735,57 @@ class Client(BaseClient, Generic[FiltersT, ItemT]):
         """
         self._schemas = schemas
         self._opportunity_schema = _resolve_opportunity_schema(schemas)
+
+
+class Client(BaseClient, _PluginScope, Generic[FiltersT, ItemT]):
+    """Typed resource facade over :class:`BaseClient`.
+
+    Binds a plugin's route filters and Opportunity schema, exposing the typed
+    ``opportunities`` resource. Construct one via ``plugin.get_client(...)``: that
+    binds the plugin's registered filters (``FiltersT``) and Opportunity schema
+    (``ItemT``) so ``opportunities.search`` is typed and responses parse with the
+    plugin's custom fields. Constructing ``Client`` directly leaves those generics
+    unbound (standard filters only, base ``OpportunityBase`` rows).
+    """
+
+    def __init__(
+        self,
+        config: Optional[Config] = None,
+        auth: Optional[Auth] = None,
+    ):
+        """Initialize the client.
+
+        Args:
+            config: Optional Config instance.
+            auth: Optional Auth instance.
+        """
+        super().__init__(config=config, auth=auth)
+        self._init_scope()
+        self.opportunities: Opportunities[FiltersT, ItemT] = Opportunities(client=self)
+
+
+class AsyncClient(AsyncBaseClient, _PluginScope, Generic[FiltersT, ItemT]):
+    """Typed async resource facade over :class:`AsyncBaseClient`.
+
+    The ``asyncio`` counterpart of :class:`Client`: the same plugin binding and
+    ``SearchResult`` / ``ListResult`` shapes, with ``opportunities`` methods as
+    coroutines. Construct one via ``plugin.get_async_client(...)`` for a scoped
+    client, or directly for an unscoped one.
+    """
+
+    def __init__(
+        self,
+        config: Optional[Config] = None,
+        auth: Optional[Auth] = None,
+    ):
+        """Initialize the client.
+
+        Args:
+            config: Optional Config instance.
+            auth: Optional Auth instance.
+        """
+        super().__init__(config=config, auth=auth)
+        self._init_scope()
+        self.opportunities: AsyncOpportunities[FiltersT, ItemT] = AsyncOpportunities(
+            client=self
+        )
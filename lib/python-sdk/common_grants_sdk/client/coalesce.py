@@ -0,0 +1,76 @@
+"""Request coalescing for the CommonGrants client.
+
+With ``Config.coalesce`` on, identical GET and search requests (same method,
+URL, query params, body and credentials) that overlap in time are sent once:
+the first caller makes the HTTP call and every caller that arrives while it is
+in flight gets the same response. Rows parsed from a coalesced response are
+parsed once and shared too, so treat them as read-only.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Generic, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    """One in-flight call and its outcome."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[T] = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time; concurrent callers share it."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call[Any]] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """``fn()``, or the result of the identical call already in flight.
+
+        If that call raises, every caller waiting on it raises the same error.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[return-value]
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """Async counterpart of :class:`SingleFlight`, for one event loop.
+
+    The call runs as its own task, so a caller that is cancelled while waiting
+    does not cancel it for the others.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, asyncio.Future[Any]] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Async counterpart of :meth:`SingleFlight.do`."""
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        return await asyncio.shield(task)
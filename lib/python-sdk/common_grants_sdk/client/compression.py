@@ -0,0 +1,164 @@
+"""Transfer compression and payload accounting for the CommonGrants client.
+
+``Config.accept_encoding`` sets the ``Accept-Encoding`` the client sends; httpx
+decodes the response transparently. ``br`` needs the ``brotli`` package and
+``zstd`` the ``zstandard`` package (``pip install "httpx[brotli,zstd]"``).
+
+``Config.compress_requests_over`` gzips JSON request bodies (searches) of at
+least that many bytes, once a response from the server has listed ``gzip`` in
+its ``Accept-Encoding`` header. A server that rejects a compressed body with
+``415 Unsupported Media Type`` gets the request again uncompressed, and no
+further compressed bodies from that client.
+
+``list`` and ``search`` results carry ``TransferStats`` for the responses they
+were built from, so bandwidth savings can be measured.
+"""
+
+import gzip
+import importlib.util
+import json
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Iterator, Optional, Sequence
+
+import httpx
+
+# Codings httpx can decode, and the package each optional one needs.
+_CODING_PACKAGES = {
+    "gzip": None,
+    "deflate": None,
+    "identity": None,
+    "br": ("brotli", "brotlicffi"),
+    "zstd": ("zstandard",),
+}
+
+
+def accept_encoding_header(codings: Sequence[str]) -> str:
+    """The ``Accept-Encoding`` value for ``codings``, in preference order.
+
+    Raises:
+        ValueError: If a coding is unknown or its decoder package is missing
+    """
+    for coding in codings:
+        if coding not in _CODING_PACKAGES:
+            raise ValueError(f"Unsupported content coding: {coding!r}")
+        packages = _CODING_PACKAGES[coding]
+        if packages and not any(importlib.util.find_spec(p) for p in packages):
+            raise ValueError(
+                f"Decoding {coding!r} responses requires the {packages[0]} package"
+            )
+    return ", ".join(codings)
+
+
+@dataclass
+class TransferStats:
+    """Bytes transferred for the responses behind one result.
+
+    Attributes:
+        responses: HTTP responses received (cache hits and shared coalesced
+            responses are not counted)
+        compressed_bytes: Response body bytes as received on the wire
+        uncompressed_bytes: Response body bytes after decoding
+    """
+
+    responses: int = 0
+    compressed_bytes: int = 0
+    uncompressed_bytes: int = 0
+
+    @property
+    def ratio(self) -> Optional[float]:
+        """``compressed_bytes / uncompressed_bytes``, or None with no bytes."""
+        if not self.uncompressed_bytes:
+            return None
+        return self.compressed_bytes / self.uncompressed_bytes
+
+
+class _Accumulator:
+    """``TransferStats`` collected from any thread or task of one call."""
+
+    def __init__(self):
+        self.stats = TransferStats()
+        self._lock = threading.Lock()
+
+    def add(self, response: httpx.Response) -> None:
+        downloaded = response.num_bytes_downloaded
+        if not isinstance(downloaded, int):
+            # Not a response httpx read off a transport (e.g. a stand-in object).
+            return
+        with self._lock:
+            self.stats.responses += 1
+            self.stats.compressed_bytes += downloaded
+            self.stats.uncompressed_bytes += len(response.content)
+
+
+_current: ContextVar[Optional[_Accumulator]] = ContextVar(
+    "commongrants_transfer", default=None
+)
+
+
+@contextmanager
+def measure_transfer() -> Iterator[TransferStats]:
+    """Collect the transfer stats of the requests made inside the block."""
+    accumulator = _Accumulator()
+    token = _current.set(accumulator)
+    try:
+        yield accumulator.stats
+    finally:
+        _current.reset(token)
+
+
+def record_transfer(response: httpx.Response) -> None:
+    """Count ``response`` towards the enclosing :func:`measure_transfer`, if any."""
+    accumulator = _current.get()
+    if accumulator is not None:
+        accumulator.add(response)
+
+
+class BodyCompressor:
+    """Decides when one client gzips its JSON request bodies.
+
+    Args:
+        threshold: Smallest body, in bytes, worth compressing
+    """
+
+    def __init__(self, threshold: int):
+        self.threshold = threshold
+        self._server_accepts = False
+        self._rejected = False
+
+    def compress(self, kwargs: dict[str, Any]) -> Optional[dict[str, Any]]:
+        """Request kwargs sending the JSON body gzipped, or None to send as is.
+
+        The body is ``kwargs["json"]``, or ``kwargs["content"]`` when that is an
+        already serialized JSON body (a prepared search).
+        """
+        if not self._server_accepts or self._rejected:
+            return None
+        body = kwargs.get("content")
+        if body is None and kwargs.get("json") is not None:
+            body = json.dumps(kwargs["json"], separators=(",", ":")).encode()
+        if not isinstance(body, bytes) or len(body) < self.threshold:
+            return None
+        compressed = {
+            key: value
+            for key, value in kwargs.items()
+            if key not in ("json", "content")
+        }
+        compressed["content"] = gzip.compress(body)
+        return compressed
+
+    def observe(self, response: httpx.Response, compressed: bool) -> None:
+        """Learn from a response whether the server takes gzipped bodies."""
+        if compressed and response.status_code == 415:
+            self._rejected = True
+        elif "gzip" in response.headers.get("accept-encoding", "").lower():
+            self._server_accepts = True
+
+
+# Headers sent with an already serialized JSON body.
+JSON_BODY_HEADERS = {"Content-Type": "application/json"}
+
+# Headers sent with a gzipped JSON body.
+COMPRESSED_BODY_HEADERS = {"Content-Encoding": "gzip", **JSON_BODY_HEADERS}
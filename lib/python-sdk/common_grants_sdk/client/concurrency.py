@@ -0,0 +1,65 @@
+"""Bounded fan-out helpers for the CommonGrants HTTP client.
+
+``map_concurrently`` runs a blocking call over many inputs on a thread pool (the
+sync client's ``httpx.Client`` is thread-safe); ``gather_concurrently`` awaits
+many coroutines under a semaphore for the async client. Both return results in
+input order and raise the first failure in that order, so callers see the same
+error a serial loop would have raised.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from typing import TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def map_concurrently(
+    func: Callable[[T], R], args: Iterable[T], max_workers: int
+) -> list[R]:
+    """Call ``func`` on every arg with at most ``max_workers`` calls in flight.
+
+    Runs inline (no pool) when only one call is needed or ``max_workers`` is 1.
+    Once a call fails, calls that have not started yet are cancelled.
+    """
+    args = list(args)
+    if max_workers <= 1 or len(args) <= 1:
+        return [func(arg) for arg in args]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(args))) as pool:
+        # Each call runs in a copy of the caller's context, so context-scoped
+        # state (e.g. transfer accounting) follows it onto the pool.
+        futures = [pool.submit(copy_context().run, func, arg) for arg in args]
+        try:
+            return [future.result() for future in futures]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+
+async def gather_concurrently(
+    factories: Iterable[Callable[[], Awaitable[R]]], limit: int
+) -> list[R]:
+    """Await every coroutine factory with at most ``limit`` awaiting at once.
+
+    Takes factories rather than coroutines so no coroutine is created (and left
+    un-awaited) when an earlier one fails. On the first failure, in input order,
+    the remaining tasks are cancelled and the error is re-raised.
+    """
+    semaphore = asyncio.Semaphore(max(limit, 1))
+
+    async def bounded(factory: Callable[[], Awaitable[R]]) -> R:
+        async with semaphore:
+            return await factory()
+
+    tasks = [asyncio.ensure_future(bounded(factory)) for factory in factories]
+    try:
+        return [await task for task in tasks]
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
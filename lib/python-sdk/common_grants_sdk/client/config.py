@@ -1,7 +1,17 @@
 """Configuration management for the CommonGrants HTTP client."""
 
 import os
-from typing import Optional, cast
+from typing import TYPE_CHECKING, Optional, Sequence, cast
+
+from .cache import ResponseCache
+from .compression import accept_encoding_header
+from .hedge import HedgePolicy
+from .instrumentation import Observer
+from .ratelimit import RateLimiter, shared_limiter
+from .retry import RetryPolicy
+
+if TYPE_CHECKING:
+    import httpx
 
 
 class Config:
@@ -10,6 +20,7 @@ class Config:
     DEFAULT_PAGE_SIZE = 100
     DEFAULT_TIMEOUT = 10.0
     LIST_ITEMS_LIMIT = 1000
+    DEFAULT_MAX_CONCURRENCY = 4
 
     def __init__(
         self,
@@ -18,6 +29,22 @@ class Config:
         timeout: Optional[float] = None,
         page_size: Optional[int] = None,
         list_items_limit: Optional[int] = LIST_ITEMS_LIMIT,
+        max_concurrency: Optional[int] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        http2: Optional[bool] = None,
+        transport: Optional["httpx.BaseTransport"] = None,
+        async_transport: Optional["httpx.AsyncBaseTransport"] = None,
+        retry: Optional[RetryPolicy] = None,
+        cache: Optional[ResponseCache] = None,
+        fast_decode: Optional[bool] = None,
+        observers: Optional[Sequence[Observer]] = None,
+        rate_limit: Optional[RateLimiter] = None,
+        coalesce: Optional[bool] = None,
+        accept_encoding: Optional[Sequence[str]] = None,
+        compress_requests_over: Optional[int] = None,
+        hedge: Optional[HedgePolicy] = None,
     ):
         """Initialize configuration.
 
@@ -26,6 +53,38 @@ class Config:
             api_key: API key for authentication
             timeout: Request timeout in seconds
             page_size: Response max page size
+            list_items_limit: Max items aggregated when fetching all pages
+            max_concurrency: Max pages fetched at once when aggregating all pages
+                (1 fetches them strictly one after another)
+            max_connections: Max open connections in the connection pool
+            max_keepalive_connections: Max idle connections kept open for reuse
+            keepalive_expiry: Seconds an idle pooled connection is kept open
+            http2: Negotiate HTTP/2 (requires ``httpx[http2]``)
+            transport: A shared ``httpx.BaseTransport`` for sync clients to send
+                through instead of opening their own pool. Clients never close it.
+            async_transport: The ``httpx.AsyncBaseTransport`` counterpart for
+                async clients.
+            retry: Retry policy for transient failures (429/5xx, network errors)
+                on GET and search requests; None sends each request once
+            cache: Response cache for GET and search requests; None disables
+                caching. Share one instance across clients to share entries.
+            fast_decode: Validate list/search pages and their rows in one pass
+                from the raw response bytes instead of via intermediate dicts
+            observers: Receive timing events for requests, decoding, filter
+                classification and row parsing (see ``instrumentation``)
+            rate_limit: Pace requests with a token bucket and cap how many are
+                in flight; share one instance across clients to share the quota
+            coalesce: Send identical concurrent GET and search requests once and
+                share the response and parsed rows between their callers
+            accept_encoding: Content codings to accept, in preference order
+                (``gzip``, ``deflate``, ``br``, ``zstd``, ``identity``); None
+                keeps httpx's default
+            compress_requests_over: Gzip JSON request bodies of at least this
+                many bytes once the server advertises gzip support; None never
+                compresses
+            hedge: Send a second copy of a GET or search request that is slower
+                than the policy's latency percentile, using whichever answers
+                first; None never hedges
         """
 
         # set base_url value from param or env var
@@ -66,3 +125,101 @@ class Config:
         )
         # use type narrowing to avoid type validation errors in client
         self.list_items_limit: int = cast(int, list_items_limit)
+
+        # set max_concurrency value from param, env var, or default
+        max_concurrency_value = max_concurrency or int(
+            os.getenv("CG_API_MAX_CONCURRENCY", self.DEFAULT_MAX_CONCURRENCY)
+        )
+        if max_concurrency_value < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency: int = max_concurrency_value
+
+        # set connection pool values from params or env vars; None keeps
+        # httpx's defaults
+        max_connections_value = max_connections or _env_int("CG_API_MAX_CONNECTIONS")
+        self.max_connections: Optional[int] = max_connections_value
+
+        max_keepalive_value = max_keepalive_connections
+        if max_keepalive_value is None:
+            max_keepalive_value = _env_int("CG_API_MAX_KEEPALIVE_CONNECTIONS")
+        self.max_keepalive_connections: Optional[int] = max_keepalive_value
+
+        keepalive_expiry_value = keepalive_expiry
+        if keepalive_expiry_value is None:
+            keepalive_expiry_env = os.getenv("CG_API_KEEPALIVE_EXPIRY")
+            if keepalive_expiry_env:
+                keepalive_expiry_value = float(keepalive_expiry_env)
+        self.keepalive_expiry: Optional[float] = keepalive_expiry_value
+
+        # set http2 value from param, env var, or default (off)
+        self.http2: bool = http2 if http2 is not None else _env_flag("CG_API_HTTP2")
+
+        self.transport = transport
+        self.async_transport = async_transport
+
+        # set retry policy from param or env var (max attempts); default is off
+        retry_attempts = _env_int("CG_API_RETRY_MAX_ATTEMPTS")
+        if retry is None and retry_attempts is not None:
+            retry = RetryPolicy(max_attempts=retry_attempts)
+        self.retry: Optional[RetryPolicy] = retry
+
+        self.cache: Optional[ResponseCache] = cache
+
+        # set fast_decode value from param, env var, or default (off)
+        self.fast_decode: bool = (
+            fast_decode if fast_decode is not None else _env_flag("CG_API_FAST_DECODE")
+        )
+
+        self.observers: tuple[Observer, ...] = tuple(observers or ())
+
+        # set rate limit from param or env vars; limiters built from env vars are
+        # shared process-wide so every client draws on the same quota
+        if rate_limit is None:
+            rate_env = os.getenv("CG_API_RATE_LIMIT")
+            rate = float(rate_env) if rate_env else None
+            burst = _env_int("CG_API_RATE_BURST")
+            max_in_flight = _env_int("CG_API_MAX_IN_FLIGHT")
+            if rate is not None or max_in_flight is not None:
+                rate_limit = shared_limiter(rate, burst, max_in_flight)
+        self.rate_limit: Optional[RateLimiter] = rate_limit
+
+        # set coalesce value from param, env var, or default (off)
+        self.coalesce: bool = (
+            coalesce if coalesce is not None else _env_flag("CG_API_COALESCE")
+        )
+
+        # set compression values from params or env vars; None keeps httpx's
+        # Accept-Encoding and sends request bodies uncompressed
+        if accept_encoding is None:
+            accept_encoding_env = os.getenv("CG_API_ACCEPT_ENCODING")
+            if accept_encoding_env:
+                accept_encoding = [
+                    coding.strip() for coding in accept_encoding_env.split(",")
+                ]
+        self.accept_encoding: Optional[str] = (
+            accept_encoding_header(accept_encoding)
+            if accept_encoding is not None
+            else None
+        )
+
+        if compress_requests_over is None:
+            compress_requests_over = _env_int("CG_API_COMPRESS_REQUESTS_OVER")
+        self.compress_requests_over: Optional[int] = compress_requests_over
+
+        # set hedge policy from param or env var (percentile); default is off
+        if hedge is None:
+            hedge_percentile = os.getenv("CG_API_HEDGE_PERCENTILE")
+            if hedge_percentile:
+                hedge = HedgePolicy(percentile=float(hedge_percentile))
+        self.hedge: Optional[HedgePolicy] = hedge
+
+
+def _env_int(name: str) -> Optional[int]:
+    """An integer env var, or None when it is unset or empty."""
+    value = os.getenv(name)
+    return int(value) if value else None
+
+
+def _env_flag(name: str) -> bool:
+    """A boolean env var: true for ``1``/``true``/``yes`` (any case)."""
+    return os.getenv(name, "").lower() in ("1", "true", "yes")
@@ -0,0 +1,375 @@
+"""Federated search across several CommonGrants servers.
+
+``FederatedClient`` (and its coroutine twin ``AsyncFederatedClient``) sends one
+search to every configured server at once and merges the answers:
+
+- Each server gets its own timeout. A server that misses it, or whose request
+  fails, is reported on ``endpoints`` and left out; the rest still merge.
+- Rows are merged in the requested ``OppSorting`` order with a k-way merge of
+  the per-server results. Each server's rows are first sorted locally, so a
+  server that ignores the requested sorting cannot break the merge.
+- Rows sharing an ``id`` are kept once: the copy that ranks first, or the one
+  from the server listed first on a tie. With ``fields``, ``id`` and the sort
+  field are requested too, since merging needs them.
+
+Servers are given by name, as a ``Config`` or as a ready client (e.g.
+``plugin.get_client(config)`` to parse a server's rows with its plugin schema).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import time
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import Any, Generic, List, Optional, TypeVar, cast
+
+from pydantic import BaseModel
+
+from ..extensions.types import FilterError
+from ..schemas.pydantic.fields.money import Money
+from ..schemas.pydantic.models import OpportunityBase
+from ..schemas.pydantic.models.opp_status import OppStatusOptions
+from ..schemas.pydantic.sorting import OppSortBy, OppSorting
+from .client import AsyncClient, Client
+from .config import Config
+from .exceptions import APIError
+from .results import EndpointReport, FederatedSearchResult, SearchResult
+
+ClientT = TypeVar("ClientT", Client, AsyncClient)
+
+# Failures that take one server out of a federated search instead of failing it.
+# ValueError covers a ``fields`` entry one server's schema does not have.
+_ENDPOINT_ERRORS = (APIError, FilterError, TimeoutError, ValueError)
+
+_DEFAULT_SORTING = OppSorting(sortBy=OppSortBy.LAST_MODIFIED_AT, sortOrder="desc")
+
+
+@dataclass
+class _Outcome:
+    """One server's search: its result or error, and how long it took."""
+
+    latency: float
+    result: Optional[SearchResult[Any]] = None
+    error: Optional[Exception] = None
+
+
+def _field(value: Any, name: str) -> Any:
+    """``value``'s field ``name`` (wire alias or attribute name), or None."""
+    if value is None:
+        return None
+    if isinstance(value, Mapping):
+        return value.get(name)
+    if isinstance(value, BaseModel):
+        for attribute, info in type(value).model_fields.items():
+            if info.alias == name:
+                return getattr(value, attribute)
+    return getattr(value, name, None)
+
+
+def _comparable(value: Any) -> Any:
+    """A value that orders the way the field does, not the way its model would.
+
+    Naive datetimes are taken as UTC, so servers that omit the offset still
+    order against servers that send one.
+    """
+    if isinstance(value, Money):
+        return Decimal(value.amount)
+    if isinstance(value, BaseModel):
+        # Events order by their (start) date.
+        value = getattr(value, "date", None) or getattr(value, "start_date", None)
+    if isinstance(value, datetime) and value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value
+
+
+def _sort_path(sorting: OppSorting) -> list[str]:
+    """The wire names leading from a row to its sort value."""
+    if sorting.sort_by == OppSortBy.CUSTOM:
+        return ["customFields", str(sorting.custom_sort_by), "value"]
+    return str(sorting.sort_by.value).split(".")
+
+
+def _merge_fields(
+    fields: Optional[Sequence[str]], sorting: OppSorting
+) -> Optional[list[str]]:
+    """``fields`` plus the fields merging reads: ``id`` and the sort field."""
+    if fields is None:
+        return None
+    needed = ("id", _sort_path(sorting)[0])
+    return [*fields, *(name for name in needed if name not in fields)]
+
+
+def sort_key(sorting: OppSorting) -> Callable[[BaseModel], tuple[Any, ...]]:
+    """A key ordering rows by ``sorting`` (with ``reverse`` for ``desc``).
+
+    Rows missing the sort field come last in either direction.
+    """
+    path = _sort_path(sorting)
+    descending = sorting.sort_order == "desc"
+
+    def key(row: BaseModel) -> tuple[Any, ...]:
+        value: Any = row
+        for name in path:
+            value = _field(value, name)
+        value = _comparable(value)
+        if value is None:
+            return (0,) if descending else (1,)
+        return (1, value) if descending else (0, value)
+
+    return key
+
+
+class _FederationBase(Generic[ClientT]):
+    """Endpoint bookkeeping and merging shared by the sync and async clients."""
+
+    def __init__(
+        self,
+        clients: dict[str, ClientT],
+        timeout: Optional[float],
+        timeouts: Optional[Mapping[str, float]],
+    ):
+        self.clients = clients
+        self.timeout = timeout
+        self.timeouts = dict(timeouts or {})
+        unknown = set(self.timeouts) - set(self.clients)
+        if unknown:
+            raise ValueError(f"Timeouts given for unknown endpoints: {sorted(unknown)}")
+
+    def _timeout(self, name: str) -> Optional[float]:
+        """The timeout, in seconds, for one server's search (None: no limit)."""
+        return self.timeouts.get(name, self.timeout)
+
+    @staticmethod
+    def _timed_out(name: str, timeout: Optional[float]) -> _Outcome:
+        return _Outcome(
+            latency=timeout or 0.0,
+            error=TimeoutError(f"{name} did not respond within {timeout}s"),
+        )
+
+    def _merge(
+        self, outcomes: dict[str, _Outcome], sorting: OppSorting
+    ) -> FederatedSearchResult[Any]:
+        """K-way merge the servers' rows by ``sorting``, keeping one row per id."""
+        key = sort_key(sorting)
+        descending = sorting.sort_order == "desc"
+        reports = {
+            name: EndpointReport(
+                latency=outcome.latency, result=outcome.result, error=outcome.error
+            )
+            for name, outcome in outcomes.items()
+        }
+        streams = [
+            [
+                (row, name)
+                for row in sorted(outcome.result.items, key=key, reverse=descending)
+            ]
+            for name, outcome in outcomes.items()
+            if outcome.result is not None
+        ]
+        items: list[Any] = []
+        sources: list[str] = []
+        seen: set[Any] = set()
+        for row, name in heapq.merge(
+            *streams, key=lambda entry: key(entry[0]), reverse=descending
+        ):
+            row_id = getattr(row, "id", None)
+            if row_id is not None and row_id in seen:
+                reports[name].duplicates += 1
+                continue
+            seen.add(row_id)
+            items.append(row)
+            sources.append(name)
+        return FederatedSearchResult(items=items, sources=sources, endpoints=reports)
+
+
+class FederatedClient(_FederationBase[Client]):
+    """Searches several CommonGrants servers concurrently and merges the results.
+
+    Args:
+        endpoints: Servers by name, each a ``Config`` or a ``Client``; the
+            iteration order breaks ties between otherwise equal rows
+        timeout: Default per-server timeout in seconds for a whole search
+            (all pages), or None for no limit
+        timeouts: Per-server timeouts overriding ``timeout``, by name
+
+    Raises:
+        ValueError: If ``timeouts`` names a server not in ``endpoints``
+    """
+
+    def __init__(
+        self,
+        endpoints: Mapping[str, Config | Client],
+        timeout: Optional[float] = None,
+        timeouts: Optional[Mapping[str, float]] = None,
+    ):
+        clients = {
+            name: Client(config=endpoint) if isinstance(endpoint, Config) else endpoint
+            for name, endpoint in endpoints.items()
+        }
+        super().__init__(clients, timeout, timeouts)
+
+    def search(
+        self,
+        search: str = "",
+        status: List[OppStatusOptions] | None = None,
+        page: int | None = None,
+        page_size: int | None = None,
+        schema: Optional[type[OpportunityBase]] = None,
+        filters: Optional[Mapping[str, Any]] = None,
+        fields: Optional[Sequence[str]] = None,
+        sorting: Optional[OppSorting] = None,
+    ) -> FederatedSearchResult[Any]:
+        """Run ``search`` on every server at once and merge the results.
+
+        Takes the arguments of :meth:`Opportunities.search`; each server
+        searches with them, sorted by ``sorting`` (default ``lastModifiedAt``
+        descending). ``fields`` is extended with ``id`` and the sort field.
+
+        A server that times out is reported and not waited for any further.
+        A blocking request cannot be interrupted, so its search keeps running
+        on a background thread until it finishes or fails on the client's own
+        ``Config.timeout``, and its result is discarded. Set that timeout to
+        bound how long such a thread can run.
+
+        Returns:
+            ``FederatedSearchResult`` — merged ``items`` and a report per server.
+        """
+        sorting = sorting or _DEFAULT_SORTING
+        arguments = dict(
+            search=search,
+            status=status,
+            page=page,
+            page_size=page_size,
+            schema=schema,
+            filters=filters,
+            fields=_merge_fields(fields, sorting),
+            sorting=sorting,
+        )
+
+        def run(client: Client) -> _Outcome:
+            started = time.perf_counter()
+            try:
+                result = client.opportunities.search(**cast(Any, arguments))
+            except _ENDPOINT_ERRORS as error:
+                return _Outcome(time.perf_counter() - started, error=error)
+            return _Outcome(time.perf_counter() - started, result=result)
+
+        started = time.perf_counter()
+        pool = ThreadPoolExecutor(max_workers=max(len(self.clients), 1))
+        futures = {
+            name: pool.submit(copy_context().run, run, client)
+            for name, client in self.clients.items()
+        }
+        # Don't block on a server that is still running past its timeout.
+        pool.shutdown(wait=False)
+        outcomes: dict[str, _Outcome] = {}
+        for name, future in futures.items():
+            timeout = self._timeout(name)
+            remaining = (
+                None
+                if timeout is None
+                else max(timeout - (time.perf_counter() - started), 0.0)
+            )
+            try:
+                outcomes[name] = future.result(timeout=remaining)
+            except TimeoutError:
+                future.cancel()
+                outcomes[name] = self._timed_out(name, timeout)
+        return self._merge(outcomes, sorting)
+
+    def close(self) -> None:
+        """Close every server's client."""
+        for client in self.clients.values():
+            client.close()
+
+    def __enter__(self):
+        """Context manager entry; returns the client instance."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit; closes every server's client."""
+        self.close()
+
+
+class AsyncFederatedClient(_FederationBase[AsyncClient]):
+    """Async counterpart of :class:`FederatedClient`, over ``AsyncClient``s.
+
+    A server that times out has its request cancelled.
+    """
+
+    def __init__(
+        self,
+        endpoints: Mapping[str, Config | AsyncClient],
+        timeout: Optional[float] = None,
+        timeouts: Optional[Mapping[str, float]] = None,
+    ):
+        clients = {
+            name: (
+                AsyncClient(config=endpoint)
+                if isinstance(endpoint, Config)
+                else endpoint
+            )
+            for name, endpoint in endpoints.items()
+        }
+        super().__init__(clients, timeout, timeouts)
+
+    async def search(
+        self,
+        search: str = "",
+        status: List[OppStatusOptions] | None = None,
+        page: int | None = None,
+        page_size: int | None = None,
+        schema: Optional[type[OpportunityBase]] = None,
+        filters: Optional[Mapping[str, Any]] = None,
+        fields: Optional[Sequence[str]] = None,
+        sorting: Optional[OppSorting] = None,
+    ) -> FederatedSearchResult[Any]:
+        """Search every server at once and merge. See ``FederatedClient.search``."""
+        sorting = sorting or _DEFAULT_SORTING
+        arguments = dict(
+            search=search,
+            status=status,
+            page=page,
+            page_size=page_size,
+            schema=schema,
+            filters=filters,
+            fields=_merge_fields(fields, sorting),
+            sorting=sorting,
+        )
+
+        async def run(name: str, client: AsyncClient) -> _Outcome:
+            timeout = self._timeout(name)
+            started = time.perf_counter()
+            try:
+                result = await asyncio.wait_for(
+                    client.opportunities.search(**cast(Any, arguments)), timeout
+                )
+            except TimeoutError:
+                return self._timed_out(name, timeout)
+            except _ENDPOINT_ERRORS as error:
+                return _Outcome(time.perf_counter() - started, error=error)
+            return _Outcome(time.perf_counter() - started, result=result)
+
+        outcomes = await asyncio.gather(
+            *(run(name, client) for name, client in self.clients.items())
+        )
+        return self._merge(dict(zip(self.clients, outcomes)), sorting)
+
+    async def aclose(self) -> None:
+        """Close every server's client."""
+        for client in self.clients.values():
+            await client.aclose()
+
+    async def __aenter__(self):
+        """Async context manager entry; returns the client instance."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit; closes every server's client."""
+        await self.aclose()
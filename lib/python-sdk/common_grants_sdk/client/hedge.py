@@ -0,0 +1,259 @@
+"""Hedged requests for the CommonGrants client.
+
+With a ``HedgePolicy`` on ``Config.hedge``, a GET or search request that has not
+answered within the policy's delay is sent a second time, and whichever copy
+answers first is used; the other is cancelled (async clients) or left to finish
+in the background with its response discarded (sync clients, which cannot
+interrupt a blocking request). A copy that fails with a network error does not
+win while the other is still running.
+
+Sync clients send both copies on a small thread pool owned by the policy, so no
+thread is started per request. A request's delay runs from when a thread starts
+sending it, not from when it was queued, and no second copy is sent while every
+thread is taken: it would only queue behind the requests already waiting.
+
+The delay is the ``percentile`` of the latencies the policy has recently seen,
+so only the slowest few percent of requests are hedged: at the 95th percentile
+roughly one request in twenty costs a second copy. Until enough latencies have
+been seen, ``initial_delay`` is used. ``stats()`` counts how often hedges fire
+and how often the hedge wins.
+
+Hedging composes with the other policies: each copy takes its own rate-limit
+token, and a retry re-sends (and may re-hedge) the whole attempt.
+"""
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+import httpx
+
+# A copy of a hedged request: a thread's Future or an asyncio Task.
+F = TypeVar("F", Future[Any], asyncio.Future[Any])
+
+
+@dataclass(frozen=True)
+class HedgeStats:
+    """Counters of one policy's hedging.
+
+    Attributes:
+        requests: Requests sent under the policy
+        hedged: Requests whose delay passed, so a second copy was sent
+        won: Hedged requests answered first by the second copy
+    """
+
+    requests: int = 0
+    hedged: int = 0
+    won: int = 0
+
+
+class HedgePolicy:
+    """When to send a second copy of a slow request, and how often it helps.
+
+    Share one instance across clients that talk to the same servers to pool
+    their latencies and counters.
+
+    Args:
+        percentile: Latency percentile (0-100) after which a request is hedged
+        initial_delay: Delay in seconds used until ``min_samples`` latencies
+            have been seen
+        min_delay: Lower bound on the delay, so a burst of fast responses
+            cannot make every request hedge
+        max_delay: Upper bound on the delay; None for no bound
+        window: How many recent latencies the percentile is taken over
+        min_samples: Latencies needed before the percentile is used
+        max_workers: Threads the policy keeps to send sync clients' copies;
+            copies beyond this wait for a free thread
+
+    Raises:
+        ValueError: If a setting is out of range
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        initial_delay: float = 0.1,
+        min_delay: float = 0.01,
+        max_delay: Optional[float] = None,
+        window: int = 256,
+        min_samples: int = 20,
+        max_workers: int = 32,
+    ):
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100")
+        if initial_delay < 0 or min_delay < 0:
+            raise ValueError("delays must not be negative")
+        if window < 1 or min_samples < 1 or max_workers < 1:
+            raise ValueError("window, min_samples and max_workers must be at least 1")
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min(min_samples, window)
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._counts = {"requests": 0, "hedged": 0, "won": 0}
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._submitted = 0
+
+    def delay(self) -> float:
+        """Seconds to wait for an answer before sending the second copy."""
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                delay = self.initial_delay
+            else:
+                ordered = sorted(self._latencies)
+                rank = math.ceil(self.percentile / 100 * len(ordered)) - 1
+                delay = ordered[max(rank, 0)]
+        delay = max(delay, self.min_delay)
+        return delay if self.max_delay is None else min(delay, self.max_delay)
+
+    def record(self, latency: float) -> None:
+        """Add a request's latency in seconds to the window."""
+        with self._lock:
+            self._latencies.append(latency)
+
+    def stats(self) -> HedgeStats:
+        """A snapshot of the counters."""
+        with self._lock:
+            return HedgeStats(**self._counts)
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._counts[counter] += 1
+
+    def _submit(self, send: Callable[[], httpx.Response]) -> "Future[httpx.Response]":
+        """Run ``send`` on the policy's pool, in a copy of the caller's context."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="commongrants-hedge",
+                )
+            executor = self._executor
+            self._submitted += 1
+        future = executor.submit(copy_context().run, send)
+        future.add_done_callback(self._finished)
+        return future
+
+    def _finished(self, future: "Future[httpx.Response]") -> None:
+        with self._lock:
+            self._submitted -= 1
+
+    def _has_idle_worker(self) -> bool:
+        """Whether a copy submitted now would start without queueing."""
+        with self._lock:
+            return self._submitted < self._max_workers
+
+
+def _discard(future: "Future[httpx.Response]") -> None:
+    """Close the response of a copy that lost the race."""
+    if future.exception() is None:
+        future.result().close()
+
+
+def _answered(copies: list[F], done: set[F]) -> Optional[F]:
+    """The first of ``copies`` (primary first) that is done without an error."""
+    for copy in copies:
+        if copy in done and copy.exception() is None:
+            return copy
+    return None
+
+
+def _settle(policy: HedgePolicy, copies: list[F], winner: Optional[F]) -> F:
+    """Count a hedged request's outcome; the copy whose result to return.
+
+    With no winner both copies failed, and the primary's error is the one
+    reported.
+    """
+    if winner is None:
+        return copies[0]
+    if winner is copies[1]:
+        policy._count("won")
+    return winner
+
+
+def send_hedged(
+    policy: Optional[HedgePolicy],
+    send: Callable[[], httpx.Response],
+    idempotent: bool = True,
+) -> httpx.Response:
+    """``send()``, sent again if it has not answered within ``policy.delay()``.
+
+    Returns the first response; a network error is raised only once both
+    copies have failed. Non-idempotent requests are sent once, unhedged.
+    """
+    if policy is None or not idempotent:
+        return send()
+    policy._count("requests")
+    running = threading.Event()
+
+    def send_primary() -> httpx.Response:
+        running.set()
+        return send()
+
+    primary = policy._submit(send_primary)
+    # Time in the pool's queue is not latency: the delay starts with the send.
+    running.wait()
+    started = time.perf_counter()
+    done, _ = wait([primary], timeout=policy.delay())
+    if not done and not policy._has_idle_worker():
+        # Every thread is taken, so a second copy would only queue.
+        done, _ = wait([primary])
+    if done:
+        policy.record(time.perf_counter() - started)
+        return primary.result()
+
+    policy._count("hedged")
+    copies = [primary, policy._submit(send)]
+    pending = set(copies)
+    winner = None
+    while winner is None and pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        winner = _answered(copies, done)
+    # The primary took at least this long, even if it has not answered yet.
+    policy.record(time.perf_counter() - started)
+    for copy in copies:
+        if copy is not winner:
+            copy.add_done_callback(_discard)
+    return _settle(policy, copies, winner).result()
+
+
+async def asend_hedged(
+    policy: Optional[HedgePolicy],
+    send: Callable[[], Awaitable[httpx.Response]],
+    idempotent: bool = True,
+) -> httpx.Response:
+    """Async counterpart of :func:`send_hedged`; the losing copy is cancelled."""
+    if policy is None or not idempotent:
+        return await send()
+    policy._count("requests")
+    started = time.perf_counter()
+    copies = [asyncio.ensure_future(send())]
+    try:
+        done, _ = await asyncio.wait(copies, timeout=policy.delay())
+        if done:
+            policy.record(time.perf_counter() - started)
+            return copies[0].result()
+
+        policy._count("hedged")
+        copies.append(asyncio.ensure_future(send()))
+        pending = set(copies)
+        winner = None
+        while winner is None and pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            winner = _answered(copies, done)
+        policy.record(time.perf_counter() - started)
+        return _settle(policy, copies, winner).result()
+    finally:
+        for copy in copies:
+            copy.cancel()
@@ -0,0 +1,192 @@
+"""Instrumentation hooks for the CommonGrants client.
+
+Observers on ``Config.observers`` receive a ``TimingEvent`` for each measured
+step of a call, so SDK-side latency can be broken down in production:
+
+========================  ======================================================
+Event                     Measures
+========================  ======================================================
+``http.request``          One HTTP attempt, send to last body byte (attributes:
+                          ``method``, ``url``, ``status_code``, ``bytes``,
+                          ``attempt``; retries emit one event per attempt)
+``http.connect``          Opening the connection: DNS lookup and TCP connect
+``http.tls``              TLS handshake
+``http.send``             Writing the request headers and body
+``http.wait``             Waiting for the response headers (time to first byte)
+``http.transfer``         Reading the response body
+``decode``                JSON decoding of a response body
+``validate.envelope``     Validating the response envelope (``fast`` is True
+                          when decode and validation ran as one pass)
+``classify_filters``      Classifying and validating search filters
+``parse_batch``           Parsing rows into the Opportunity schema (``rows``)
+========================  ======================================================
+
+The ``http.*`` phases come from the httpx ``trace`` extension and are only
+reported by real network transports. With no observers configured, none of
+this is measured.
+
+``OpenTelemetryObserver`` forwards events to OpenTelemetry as spans and a
+duration histogram; it needs the ``opentelemetry-api`` package.
+"""
+
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, ContextManager, Iterator, Protocol
+
+# httpcore trace events that open and close each reported HTTP phase.
+_TRACE_PHASES = {
+    "connection.connect_tcp": "http.connect",
+    "connection.start_tls": "http.tls",
+    "http11.send_request_headers": "http.send",
+    "http11.send_request_body": "http.send",
+    "http2.send_request_headers": "http.send",
+    "http2.send_request_body": "http.send",
+    "http11.receive_response_headers": "http.wait",
+    "http2.receive_response_headers": "http.wait",
+    "http11.receive_response_body": "http.transfer",
+    "http2.receive_response_body": "http.transfer",
+}
+
+
+@dataclass(frozen=True)
+class TimingEvent:
+    """One measured step of a client call.
+
+    Attributes:
+        name: What was measured, e.g. ``http.request`` or ``parse_batch``
+        started_at: Wall-clock start, in seconds since the epoch
+        duration: Elapsed seconds
+        attributes: Step details, e.g. the URL or the number of rows
+    """
+
+    name: str
+    started_at: float
+    duration: float
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+
+class Observer(Protocol):
+    """Receives the client's timing events. Must be safe to call from threads."""
+
+    def on_event(self, event: TimingEvent) -> None:
+        """Handle one timing event."""
+        ...
+
+
+class Instrumentation:
+    """Emits timing events to a set of observers."""
+
+    def __init__(self, observers: tuple[Observer, ...] = ()):
+        self.observers = observers
+
+    def emit(
+        self, name: str, started_at: float, duration: float, **attributes: Any
+    ) -> None:
+        """Send one event to every observer."""
+        event = TimingEvent(name, started_at, duration, attributes)
+        for observer in self.observers:
+            observer.on_event(event)
+
+    def timed(self, name: str, **attributes: Any) -> ContextManager[dict[str, Any]]:
+        """Time the ``with`` block as event ``name``.
+
+        The block may add attributes to the yielded dict. A no-op when there are
+        no observers.
+        """
+        if not self.observers:
+            return nullcontext(attributes)
+        return self._timed(name, attributes)
+
+    @contextmanager
+    def _timed(self, name: str, attributes: dict[str, Any]) -> Iterator[dict[str, Any]]:
+        started_at = time.time()
+        start = time.perf_counter()
+        try:
+            yield attributes
+        finally:
+            self.emit(name, started_at, time.perf_counter() - start, **attributes)
+
+    def tracer(self) -> Callable[[str, dict[str, Any]], None]:
+        """An httpx ``trace`` extension callback reporting the HTTP phases."""
+        started: dict[str, tuple[float, float]] = {}
+
+        def trace(event_name: str, info: dict[str, Any]) -> None:
+            step, _, stage = event_name.rpartition(".")
+            phase = _TRACE_PHASES.get(step)
+            if phase is None:
+                return
+            if stage == "started":
+                started[step] = (time.time(), time.perf_counter())
+            elif step in started:
+                started_at, start = started.pop(step)
+                self.emit(phase, started_at, time.perf_counter() - start)
+
+        return trace
+
+    def async_tracer(self) -> Callable[[str, dict[str, Any]], Awaitable[None]]:
+        """The ``trace`` callback for ``httpx.AsyncClient``, which awaits it."""
+        trace = self.tracer()
+
+        async def async_trace(event_name: str, info: dict[str, Any]) -> None:
+            trace(event_name, info)
+
+        return async_trace
+
+
+class OpenTelemetryObserver:
+    """Forward timing events to OpenTelemetry.
+
+    Each event becomes a span (named ``commongrants.<event>``, timed to the
+    measured step) and a sample of the ``commongrants.client.duration``
+    histogram, labelled with the event name.
+
+    Args:
+        tracer: An OpenTelemetry ``Tracer``; defaults to the global provider's
+        meter: An OpenTelemetry ``Meter``; defaults to the global provider's
+
+    Raises:
+        ImportError: If a tracer or meter is needed from the global provider and
+            ``opentelemetry-api`` is not installed
+    """
+
+    def __init__(self, tracer: Any = None, meter: Any = None):
+        if tracer is None or meter is None:
+            try:
+                from opentelemetry import (  # pyright: ignore[reportMissingImports]
+                    metrics,
+                    trace,
+                )
+            except ImportError as exc:
+                raise ImportError(
+                    "OpenTelemetryObserver requires opentelemetry-api: "
+                    "pip install opentelemetry-api"
+                ) from exc
+            tracer = tracer or trace.get_tracer("common_grants_sdk.client")
+            meter = meter or metrics.get_meter("common_grants_sdk.client")
+        self._tracer = tracer
+        self._duration = meter.create_histogram(
+            "commongrants.client.duration",
+            unit="s",
+            description="Duration of CommonGrants client steps",
+        )
+
+    def on_event(self, event: TimingEvent) -> None:
+        attributes = {
+            key: value
+            for key, value in event.attributes.items()
+            if isinstance(value, (str, bool, int, float))
+        }
+        start_ns = int(event.started_at * 1e9)
+        span = self._tracer.start_span(
+            f"commongrants.{event.name}", start_time=start_ns, attributes=attributes
+        )
+        span.end(end_time=start_ns + int(event.duration * 1e9))
+        # Keep metric labels low-cardinality: no URLs or row counts.
+        labels: dict[str, Any] = {"event": event.name}
+        labels.update(
+            (key, attributes[key])
+            for key in ("method", "status_code", "fast")
+            if key in attributes
+        )
+        self._duration.record(event.duration, labels)
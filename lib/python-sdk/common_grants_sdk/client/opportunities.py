@@ -1,22 +1,54 @@
-"""Opportunity resource for the CommonGrants API."""
+"""Opportunity resource for the CommonGrants API.
+
+``Opportunities`` is the resource on the synchronous ``Client``;
+``AsyncOpportunities`` is its coroutine twin on ``AsyncClient``. Both build
+requests and shape results through the shared ``_OpportunitiesBase`` so the two
+stay in lockstep.
+"""
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Generic, List, Optional, cast
+import json
+from collections.abc import AsyncGenerator, Iterable, Iterator
+from dataclasses import replace
+from datetime import datetime
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Generic, List, Optional, cast
 from uuid import UUID
 
+import httpx
 import typing_extensions as te
+from pydantic import ValidationError
 
-from ..extensions.filters import classify_filters
 from ..extensions.types import FilterError, FiltersT
 from ..schemas.pydantic.models import OpportunityBase
 from ..schemas.pydantic.models.opp_status import OppStatusOptions
-from ..schemas.pydantic.requests.opportunity import OpportunitySearchRequest
+from ..schemas.pydantic.responses import Error, Paginated
 from ..schemas.pydantic.responses.success import FilterInfo
-from .results import ListResult, SearchResult, parse_batch
+from ..schemas.pydantic.sorting import OppSorting
+from .checkpoint import PageCheckpoint, PageCursor, request_hash
+from .compression import TransferStats, measure_transfer
+from .concurrency import gather_concurrently, map_concurrently
+from .delta import DeltaCollector
+from .exceptions import APIError
+from .prepared import PreparedSearch
+from .projection import fields_param, projected_model
+from .response import SuccessResponse
+from .results import (
+    GetManyResult,
+    LazyListResult,
+    LazyRows,
+    LazySearchResult,
+    ListResult,
+    ParseFailure,
+    SearchResult,
+    SyncResult,
+    iter_batch,
+    parse_batch,
+)
 
 if TYPE_CHECKING:
-    from .client import Client
+    from .client import AsyncClient, Client
 
 # Bound is OpportunityBase[Any] (the custom-fields parameter is invariant, so a
 # bare OpportunityBase bound would reject OpportunityBase[OppCustomFields]).
@@ -24,22 +56,30 @@ ItemT = te.TypeVar(
     "ItemT", bound="OpportunityBase[Any]", default="OpportunityBase[Any]"
 )
 
+# Search body fields that do not depend on the call: pagination travels in the
+# query string, so the body's stays fixed, and the default sorting is constant.
+_SEARCH_PAGINATION: dict[str, Any] = {"page": 1, "pageSize": 10}
+_DEFAULT_SORTING: dict[str, Any] = {"sortBy": "lastModifiedAt", "sortOrder": "desc"}
 
-class Opportunities(Generic[FiltersT, ItemT]):
-    """Fetch opportunity data from the CommonGrants API.
+# Failures of one ID's request that get_many records instead of raising: besides
+# APIError, a body that is not JSON or not a valid envelope (or error body), and
+# any httpx error that reaches the resource layer unwrapped.
+_FETCH_ERRORS = (APIError, httpx.HTTPError, ValidationError, json.JSONDecodeError)
 
-    Bound (via ``plugin.get_client``) to a plugin's registered filter TypedDict
-    (``FiltersT``) and Opportunity schema (``ItemT``): ``search(filters=...)`` is
-    typed by the registered filters, and responses parse into ``ItemT`` by default.
-    """
 
-    def __init__(self, client: "Client[FiltersT, ItemT]"):
-        """Initialize the Opportunity resource.
+def _fetch_error(error: Exception) -> APIError:
+    """One ID's failed request, as the ``APIError`` ``get_many`` records."""
+    if isinstance(error, APIError):
+        return error
+    api_error = APIError(Error(status=0, message=str(error), errors=[]))
+    api_error.__cause__ = error
+    return api_error
 
-        Args:
-            client: Client instance for making API requests
-        """
-        self.client = client
+
+class _OpportunitiesBase(Generic[FiltersT, ItemT]):
+    """Request building and result shaping shared by the sync and async resources."""
+
+    client: "Client[FiltersT, ItemT] | AsyncClient[FiltersT, ItemT]"
 
     @property
     def path(self) -> str:
@@ -52,11 +92,313 @@ class Opportunities(Generic[FiltersT, ItemT]):
         """The schema to parse into: a per-call override, else the bound default."""
         return override if override is not None else self.client._opportunity_schema
 
+    def _list_result(
+        self,
+        paginated: Paginated[Any],
+        schema: type[OpportunityBase],
+        transfer: Optional[TransferStats] = None,
+    ) -> ListResult[ItemT]:
+        """Parse a list response's rows into ``schema``, partitioning failures."""
+        items, errors = self._parse_rows(paginated, schema)
+        return ListResult(
+            items=cast("list[ItemT]", items),
+            errors=errors,
+            pagination_info=paginated.pagination_info,
+            transfer=transfer,
+        )
+
+    def _parse_batch(
+        self, rows: list[Any], schema: type[OpportunityBase]
+    ) -> tuple[list[OpportunityBase], list[ParseFailure]]:
+        """``parse_batch``, reported to the client's observers."""
+        with self.client.instrumentation.timed("parse_batch", rows=len(rows)):
+            return parse_batch(rows, schema)
+
+    def _parse_one(self, data: Any, schema: type[OpportunityBase]) -> OpportunityBase:
+        """Validate a single record, reported to observers as a one-row batch."""
+        with self.client.instrumentation.timed("parse_batch", rows=1):
+            return schema.model_validate(data)
+
+    def _parse_rows(
+        self, paginated: Paginated[Any], schema: type[OpportunityBase]
+    ) -> tuple[list[OpportunityBase], list[ParseFailure]]:
+        """Parse a page's rows into ``schema``, reusing a cached page's rows."""
+        items, errors = self.client._memoized(
+            paginated,
+            schema,
+            lambda: self._parse_batch(list(paginated.items), schema),
+        )
+        return list(items), list(errors)
+
+    def _parse_item(
+        self, success_response: SuccessResponse, schema: type[OpportunityBase]
+    ) -> ItemT:
+        """Parse a single-item response into ``schema`` (reused when cached)."""
+        return cast(
+            "ItemT",
+            self.client._memoized(
+                success_response,
+                schema,
+                lambda: self._parse_one(success_response.data, schema),
+            ),
+        )
+
+    def _get_many_result(
+        self,
+        ids: list[str],
+        responses: list[SuccessResponse | APIError],
+        schema: type[OpportunityBase],
+    ) -> GetManyResult[ItemT]:
+        """Partition per-ID responses into parsed items, parse and API errors."""
+        api_errors = {
+            opp_id: response
+            for opp_id, response in zip(ids, responses)
+            if isinstance(response, APIError)
+        }
+        fetched = [
+            (position, opp_id, response.data)
+            for position, (opp_id, response) in enumerate(zip(ids, responses))
+            if isinstance(response, SuccessResponse)
+        ]
+        parsed, failures = self._parse_batch([data for _, _, data in fetched], schema)
+        failed = {failure.index: failure for failure in failures}
+        parsed_items = iter(parsed)
+        items: dict[str, ItemT] = {}
+        errors: dict[str, ParseFailure] = {}
+        for row, (position, opp_id, _) in enumerate(fetched):
+            failure = failed.get(row)
+            if failure is None:
+                items[opp_id] = cast("ItemT", next(parsed_items))
+            else:
+                errors[opp_id] = replace(failure, index=position)
+        return GetManyResult(items=items, errors=errors, api_errors=api_errors)
+
+    def _cursor(
+        self,
+        path: str,
+        request_data: Optional[dict[str, Any]],
+        page_size: int | None,
+        checkpoint: PageCheckpoint | str | None,
+    ) -> PageCursor:
+        """Start (or resume from ``checkpoint``) a page stream over ``path``."""
+        return PageCursor(
+            request_hash(path, request_data),
+            page_size,
+            self.client.config.page_size,
+            checkpoint,
+        )
+
+    def _stream_page(
+        self,
+        page: Paginated[Any],
+        schema: type[OpportunityBase],
+        cursor: PageCursor,
+        on_checkpoint: Optional[Callable[[PageCheckpoint], None]],
+    ) -> Iterator[ItemT | ParseFailure]:
+        """Yield one page's unseen rows, then report the stream's checkpoint."""
+        rows = cursor.unseen_rows(page)
+        with self.client.instrumentation.timed("parse_batch", rows=len(rows)):
+            parsed = list(iter_batch(rows, schema, cursor.rows_seen))
+        yield from cast("list[ItemT | ParseFailure]", parsed)
+        checkpoint = cursor.advance(page, rows)
+        if on_checkpoint is not None:
+            on_checkpoint(checkpoint)
+
+    def prepare(
+        self,
+        search: str = "",
+        status: List[OppStatusOptions] | None = None,
+        filters: Optional[FiltersT] = None,
+        sorting: Optional[OppSorting] = None,
+    ) -> PreparedSearch:
+        """Validate and serialize a search once, to run with ``search_prepared``.
+
+        Takes the query arguments of :meth:`Opportunities.search`. Filters are
+        classified and validated here, so running the prepared search skips
+        that work, whatever page is fetched.
+
+        Returns:
+            An immutable, hashable ``PreparedSearch``.
+
+        Raises:
+            FilterError: If any filter value — or the ``status`` shorthand — is
+                invalid or conflicting.
+        """
+        request_data, _ = self._search_request(search, status, filters, sorting)
+        return PreparedSearch.from_request(request_data)
+
+    def _search_request(
+        self,
+        search: str,
+        status: List[OppStatusOptions] | None,
+        filters: Optional[FiltersT],
+        sorting: Optional[OppSorting] = None,
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Build the search request body and the filters it carries.
+
+        ``sorting`` defaults to ``lastModifiedAt`` descending.
+
+        Returns ``(request_data, filters_body)``: the JSON-ready request body and
+        the classified filters echoed back on ``filter_info``.
+
+        Raises:
+            FilterError: If any filter value — or the ``status`` shorthand — is
+                invalid or conflicting.
+        """
+        # classify_filters raises FilterError on the first invalid filter value,
+        # whether it is a standard, registered, or ad-hoc filter, before any request
+        # is sent. The filter_info.errors field is reserved for errors the server
+        # reports about the filters it received.
+        filters_body: dict[str, Any] = {}
+        if filters:
+            with self.client.instrumentation.timed("classify_filters"):
+                classified = self.client._search_classifier.classify(filters)
+            filters_body = classified.model_dump(
+                by_alias=True, exclude_none=True, mode="json"
+            )
+
+        if status:
+            if "status" in filters_body:
+                # ``status`` given via both the shorthand and ``filters``:
+                # conflicting input to a standard filter — raise, don't guess.
+                raise FilterError(
+                    "status specified via both the status shorthand and the "
+                    "filters argument; pass it through only one of them",
+                    path="filters.status",
+                    source_value=status,
+                )
+            # str values (not enum members) so filter_info.filters echoes
+            # the same shape as the classified path.
+            filters_body["status"] = {
+                "operator": "in",
+                "value": [s.value for s in status],
+            }
+
+        # The body is assembled from parts that are already validated and
+        # JSON-ready (the classified filters, the OppSorting model, the fixed
+        # pagination) in OpportunitySearchRequest field order, rather than
+        # round-tripped through OpportunitySearchRequest; the wire JSON is the
+        # same. mode="json" dumps keep date filter values as ISO strings, which
+        # httpx's stdlib json encoding needs.
+        request: dict[str, Any] = {"search": search}
+        if filters_body:
+            request["filters"] = filters_body
+        request["sorting"] = (
+            sorting.model_dump(by_alias=True, exclude_none=True, mode="json")
+            if sorting is not None
+            else dict(_DEFAULT_SORTING)
+        )
+        request["pagination"] = dict(_SEARCH_PAGINATION)
+        return request, filters_body
+
+    def _search_result(
+        self,
+        paginated: Paginated[Any],
+        schema: type[OpportunityBase],
+        filters_body: dict[str, Any],
+        transfer: Optional[TransferStats] = None,
+    ) -> SearchResult[ItemT]:
+        """Parse a search response into a ``SearchResult`` with server feedback."""
+        items, parse_errors = self._parse_rows(paginated, schema)
+
+        return SearchResult(
+            items=cast("list[ItemT]", items),
+            errors=parse_errors,
+            pagination_info=paginated.pagination_info,
+            filter_info=self._filter_info(paginated, filters_body),
+            sort_info=getattr(paginated, "sort_info", None),
+            transfer=transfer,
+        )
+
+    @staticmethod
+    def _filter_info(
+        paginated: Paginated[Any], filters_body: dict[str, Any]
+    ) -> FilterInfo[Any]:
+        """The filters sent plus the server's filter feedback."""
+        # filter_info carries the server's filter feedback only — client-side
+        # filter problems already raised above. sort/filter info are preserved
+        # through page-aggregation (pagination copies the first page's Filtered
+        # envelope); the getattr fallbacks fire only on the empty-result path,
+        # which returns a plain Paginated.
+        server_filter_info = getattr(paginated, "filter_info", None)
+        server_errors = list(getattr(server_filter_info, "errors", None) or [])
+        return FilterInfo(filters=filters_body, errors=server_errors)
+
+    def _projection(
+        self,
+        schema: Optional[type[OpportunityBase]],
+        fields: Optional[Iterable[str]],
+    ) -> tuple[type[OpportunityBase], Optional[dict[str, str]]]:
+        """The row model and sparse-fieldset query params for ``fields``.
+
+        Without ``fields`` that is the resolved schema and no params; with them,
+        the schema's projection onto those fields and ``{"fields": ...}``.
+
+        Raises:
+            ValueError: If a field is not on the schema
+        """
+        resolved = self._schema(schema)
+        if fields is None:
+            return resolved, None
+        fields = tuple(fields)
+        # Projected models subclass the schema; fields outside ``fields`` are None.
+        row_schema = cast("type[OpportunityBase]", projected_model(resolved, fields))
+        return row_schema, {"fields": fields_param(resolved, fields)}
+
+    def _lazy_list_result(
+        self,
+        paginated: Paginated[Any],
+        schema: type[Any],
+        transfer: Optional[TransferStats] = None,
+    ) -> LazyListResult[ItemT]:
+        """Wrap a list response's rows, unparsed, in a ``LazyListResult``."""
+        return LazyListResult(
+            rows=LazyRows(list(paginated.items), schema),
+            pagination_info=paginated.pagination_info,
+            transfer=transfer,
+        )
+
+    def _lazy_search_result(
+        self,
+        paginated: Paginated[Any],
+        schema: type[Any],
+        filters_body: dict[str, Any],
+        transfer: Optional[TransferStats] = None,
+    ) -> LazySearchResult[ItemT]:
+        """Wrap a search response's rows, unparsed, in a ``LazySearchResult``."""
+        return LazySearchResult(
+            rows=LazyRows(list(paginated.items), schema),
+            pagination_info=paginated.pagination_info,
+            filter_info=self._filter_info(paginated, filters_body),
+            sort_info=getattr(paginated, "sort_info", None),
+            transfer=transfer,
+        )
+
+
+class Opportunities(_OpportunitiesBase[FiltersT, ItemT]):
+    """Fetch opportunity data from the CommonGrants API.
+
+    Bound (via ``plugin.get_client``) to a plugin's registered filter TypedDict
+    (``FiltersT``) and Opportunity schema (``ItemT``): ``search(filters=...)`` is
+    typed by the registered filters, and responses parse into ``ItemT`` by default.
+    """
+
+    client: "Client[FiltersT, ItemT]"
+
+    def __init__(self, client: "Client[FiltersT, ItemT]"):
+        """Initialize the Opportunity resource.
+
+        Args:
+            client: Client instance for making API requests
+        """
+        self.client = client
+
     def list(
         self,
         page: int | None = None,
         page_size: int | None = None,
         schema: Optional[type[OpportunityBase]] = None,
+        fields: Optional[Iterable[str]] = None,
     ) -> ListResult[ItemT]:
         """Fetch a set of opportunities.
 
@@ -65,23 +407,106 @@ class Opportunities(Generic[FiltersT, ItemT]):
             page_size: Number of items per page. If None, uses the client default.
             schema: Per-call parse-schema override; defaults to the plugin's
                 Opportunity schema (or ``OpportunityBase`` when unbound).
+            fields: Fetch only these fields (attribute names or wire aliases,
+                e.g. ``["id", "title"]``). They are sent as the ``fields`` query
+                parameter for servers that support sparse fieldsets, and rows
+                are parsed into a projected model holding just those fields.
 
         Returns:
             ``ListResult`` — parsed ``items`` plus per-row parse ``errors``.
 
         Raises:
             APIError: If the API request fails
+            ValueError: If a field is not on the schema
+        """
+        resolved, params = self._projection(schema, fields)
+        with measure_transfer() as transfer:
+            paginated = self.client.list(
+                self.path,
+                page=page,
+                page_size=page_size,
+                params=params,
+                schema=resolved,
+            )
+        return self._list_result(paginated, resolved, transfer)
+
+    def list_lazy(
+        self,
+        page: int | None = None,
+        page_size: int | None = None,
+        schema: Optional[type[OpportunityBase]] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> LazyListResult[ItemT]:
+        """Fetch a set of opportunities, validating each row only when read.
+
+        Like :meth:`list`, but ``rows`` keeps the response rows unparsed and
+        validates each on first access (caching it), as the item or its
+        ``ParseFailure``. Listing views that open few rows skip validating the
+        rest.
+
+        Args:
+            page: Page number (1-indexed). If None, fetches all pages.
+            page_size: Number of items per page. If None, uses the client default.
+            schema: Per-call parse-schema override; defaults to the plugin's
+                Opportunity schema (or ``OpportunityBase`` when unbound).
+            fields: Fetch and validate only these fields, as for :meth:`list`.
+
+        Returns:
+            ``LazyListResult`` — lazily parsed ``rows``.
+
+        Raises:
+            APIError: If the API request fails
+            ValueError: If a field is not on the schema
+        """
+        row_schema, params = self._projection(schema, fields)
+        with measure_transfer() as transfer:
+            paginated = self.client.list(
+                self.path, page=page, page_size=page_size, params=params
+            )
+        return self._lazy_list_result(paginated, row_schema, transfer)
+
+    def iter_list(
+        self,
+        page_size: int | None = None,
+        schema: Optional[type[OpportunityBase]] = None,
+        checkpoint: PageCheckpoint | str | None = None,
+        on_checkpoint: Optional[Callable[[PageCheckpoint], None]] = None,
+    ) -> Iterator[ItemT | ParseFailure]:
+        """Stream every opportunity, one page at a time.
+
+        Unlike ``list()``, rows are yielded as each page arrives and only one page
+        is held at a time, so memory stays flat and the first row is available
+        after one round trip. ``list_items_limit`` does not apply; stop early by
+        breaking out of the loop.
+
+        Args:
+            page_size: Number of items per page. If None, uses the client default.
+            schema: Per-call parse-schema override; defaults to the plugin's
+                Opportunity schema (or ``OpportunityBase`` when unbound).
+            checkpoint: A ``PageCheckpoint`` (or its token) from an earlier
+                stream of the same request, to resume it instead of starting at
+                page 1.
+            on_checkpoint: Called with the stream's ``PageCheckpoint`` each time
+                every row of a page has been consumed.
+
+        Yields:
+            Each row in order: the parsed ``ItemT``, or a ``ParseFailure`` whose
+            ``index`` is the row's position in the whole stream.
+
+        Raises:
+            APIError: If an API request fails
+            ValueError: If ``checkpoint`` belongs to a different request or page
+                size
         """
         resolved = self._schema(schema)
-        paginated = self.client.list(self.path, page=page, page_size=page_size)
-        items, errors = parse_batch(
-            cast("list[dict[str, Any]]", list(paginated.items)), resolved
-        )
-        return ListResult(
-            items=cast("list[ItemT]", items),
-            errors=errors,
-            pagination_info=paginated.pagination_info,
+        cursor = self._cursor(self.path, None, page_size, checkpoint)
+        pages = cursor.pages(
+            lambda page: self.client.list(
+                self.path, page=page, page_size=cursor.page_size, schema=resolved
+            )
         )
+        for page in pages:
+            yield from self._stream_page(page, resolved, cursor, on_checkpoint)
 
     def get(
         self,
@@ -103,7 +528,46 @@ class Opportunities(Generic[FiltersT, ItemT]):
         """
         resolved = self._schema(schema)
         success_response = self.client.get_item(self.path, opp_id)
-        return cast("ItemT", resolved.model_validate(success_response.data))
+        return self._parse_item(success_response, resolved)
+
+    def get_many(
+        self,
+        opp_ids: Iterable[str | UUID],
+        concurrency: int | None = None,
+        schema: Optional[type[OpportunityBase]] = None,
+    ) -> GetManyResult[ItemT]:
+        """Get many opportunities by ID, fetching them concurrently.
+
+        Duplicate IDs are fetched once. A failed request does not abort the
+        batch: its ``APIError`` is collected in ``api_errors`` instead. So are
+        network errors and response bodies that are not a valid envelope,
+        wrapped in an ``APIError`` with status 0 and the original error as its
+        ``__cause__``.
+
+        Args:
+            opp_ids: The opportunity IDs
+            concurrency: Max requests in flight; defaults to
+                ``config.max_concurrency``.
+            schema: Per-call parse-schema override; defaults to the plugin's
+                Opportunity schema (or ``OpportunityBase`` when unbound).
+
+        Returns:
+            ``GetManyResult`` — parsed ``items``, parse ``errors`` and
+            ``api_errors``, each keyed by ID.
+        """
+        resolved = self._schema(schema)
+        ids = _unique_ids(opp_ids)
+
+        def fetch(opp_id: str) -> SuccessResponse | APIError:
+            try:
+                return self.client.get_item(self.path, opp_id)
+            except _FETCH_ERRORS as error:
+                return _fetch_error(error)
+
+        responses = map_concurrently(
+            fetch, ids, concurrency or self.client.config.max_concurrency
+        )
+        return self._get_many_result(ids, responses, resolved)
 
     def search(
         self,
@@ -113,6 +577,8 @@ class Opportunities(Generic[FiltersT, ItemT]):
         page_size: int | None = None,
         schema: Optional[type[OpportunityBase]] = None,
         filters: Optional[FiltersT] = None,
+        fields: Optional[Iterable[str]] = None,
+        sorting: Optional[OppSorting] = None,
     ) -> SearchResult[ItemT]:
         """Search for opportunities.
 
@@ -129,6 +595,9 @@ class Opportunities(Generic[FiltersT, ItemT]):
                 plugin's route filters, standard keys against their models, and
                 ad-hoc (unregistered) keys against the known-filter-model union. Any
                 invalid value raises ``FilterError`` before a request is sent.
+            fields: Fetch and parse only these fields, as for :meth:`list`.
+            sorting: How the server should order results; defaults to
+                ``lastModifiedAt`` descending.
 
         Returns:
             ``SearchResult`` — parsed ``items``, per-row parse ``errors``, and
@@ -138,78 +607,451 @@ class Opportunities(Generic[FiltersT, ItemT]):
             APIError: If the API request fails.
             FilterError: If any filter value — or the ``status`` shorthand — is
                 invalid or conflicting.
+            ValueError: If a field is not on the schema.
         """
-        resolved = self._schema(schema)
+        resolved, params = self._projection(schema, fields)
+        request_data, filters_body = self._search_request(
+            search, status, filters, sorting
+        )
+        with measure_transfer() as transfer:
+            paginated = self.client.search(
+                f"{self.path}/search",
+                request_data,
+                page=page,
+                page_size=page_size,
+                params=params,
+                schema=resolved,
+            )
+        return self._search_result(paginated, resolved, filters_body, transfer)
 
-        # classify_filters raises FilterError on the first invalid filter value,
-        # whether it is a standard, registered, or ad-hoc filter, before any request
-        # is sent. The filter_info.errors field is reserved for errors the server
-        # reports about the filters it received.
-        filters_body: dict[str, Any] = {}
-        if filters:
-            classified = classify_filters(
-                self.client._routes, "opportunities", "search", filters
+    def search_prepared(
+        self,
+        prepared: PreparedSearch,
+        page: int | None = None,
+        page_size: int | None = None,
+        schema: Optional[type[OpportunityBase]] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> SearchResult[ItemT]:
+        """Run a search built by :meth:`prepare`.
+
+        ``page``, ``page_size``, ``schema`` and ``fields`` are as for
+        :meth:`search`; the query itself is sent exactly as prepared.
+
+        Returns:
+            ``SearchResult``, as from :meth:`search`.
+
+        Raises:
+            APIError: If the API request fails.
+            ValueError: If a field is not on the schema.
+        """
+        resolved, params = self._projection(schema, fields)
+        with measure_transfer() as transfer:
+            paginated = self.client.search(
+                f"{self.path}/search",
+                prepared.body,
+                page=page,
+                page_size=page_size,
+                params=params,
+                schema=resolved,
             )
-            filters_body = classified.model_dump(
-                by_alias=True, exclude_none=True, mode="json"
+        return self._search_result(paginated, resolved, prepared.filters_body, transfer)
+
+    def search_lazy(
+        self,
+        search: str = "",
+        status: List[OppStatusOptions] | None = None,
+        page: int | None = None,
+        page_size: int | None = None,
+        schema: Optional[type[OpportunityBase]] = None,
+        filters: Optional[FiltersT] = None,
+        fields: Optional[Iterable[str]] = None,
+        sorting: Optional[OppSorting] = None,
+    ) -> LazySearchResult[ItemT]:
+        """Search for opportunities, validating each row only when read.
+
+        Like :meth:`search`, but ``rows`` keeps the response rows unparsed and
+        validates each on first access. ``fields`` and ``sorting`` are as for
+        :meth:`search`.
+
+        Returns:
+            ``LazySearchResult`` — lazily parsed ``rows`` and ``filter_info``.
+
+        Raises:
+            APIError: If the API request fails.
+            FilterError: If any filter value is invalid or conflicting.
+            ValueError: If a field is not on the schema.
+        """
+        row_schema, params = self._projection(schema, fields)
+        request_data, filters_body = self._search_request(
+            search, status, filters, sorting
+        )
+        with measure_transfer() as transfer:
+            paginated = self.client.search(
+                f"{self.path}/search",
+                request_data,
+                page=page,
+                page_size=page_size,
+                params=params,
             )
+        return self._lazy_search_result(paginated, row_schema, filters_body, transfer)
 
-        if status:
-            if "status" in filters_body:
-                # ``status`` given via both the shorthand and ``filters``:
-                # conflicting input to a standard filter — raise, don't guess.
-                raise FilterError(
-                    "status specified via both the status shorthand and the "
-                    "filters argument; pass it through only one of them",
-                    path="filters.status",
-                    source_value=status,
-                )
-            # str values (not enum members) so filter_info.filters echoes
-            # the same shape as the classified path.
-            filters_body["status"] = {
-                "operator": "in",
-                "value": [s.value for s in status],
-            }
+    def iter_search(
+        self,
+        search: str = "",
+        status: List[OppStatusOptions] | None = None,
+        page_size: int | None = None,
+        schema: Optional[type[OpportunityBase]] = None,
+        filters: Optional[FiltersT] = None,
+        sorting: Optional[OppSorting] = None,
+        checkpoint: PageCheckpoint | str | None = None,
+        on_checkpoint: Optional[Callable[[PageCheckpoint], None]] = None,
+    ) -> Iterator[ItemT | ParseFailure]:
+        """Stream every search match, one page at a time.
 
-        request: dict[str, Any] = {
-            "pagination": {"page": 1, "pageSize": 10},
-            "search": search,
-            "sorting": {"sortBy": "lastModifiedAt", "sortOrder": "desc"},
-        }
-        if filters_body:
-            request["filters"] = filters_body
+        Takes the same query arguments as ``search()`` and streams rows like
+        ``iter_list()``, including ``checkpoint`` / ``on_checkpoint`` resumption.
+        Filters are classified once, before the first request.
 
-        request_data = OpportunitySearchRequest.model_validate(request)
+        Yields:
+            Each row in order: the parsed ``ItemT``, or a ``ParseFailure`` whose
+            ``index`` is the row's position in the whole stream.
 
-        # mode="json" so date filter values serialize to ISO strings — httpx encodes
-        # json= with stdlib json, which rejects the date objects pydantic parses to.
-        paginated = self.client.search(
-            f"{self.path}/search",
-            request_data.model_dump(by_alias=True, exclude_unset=True, mode="json"),
-            page=page,
-            page_size=page_size,
+        Raises:
+            APIError: If an API request fails.
+            FilterError: If any filter value — or the ``status`` shorthand — is
+                invalid or conflicting.
+            ValueError: If ``checkpoint`` belongs to a different request or page
+                size
+        """
+        resolved = self._schema(schema)
+        request_data, _ = self._search_request(search, status, filters, sorting)
+        path = f"{self.path}/search"
+        cursor = self._cursor(path, request_data, page_size, checkpoint)
+        pages = cursor.pages(
+            lambda page: self.client.search(
+                path,
+                request_data,
+                page=page,
+                page_size=cursor.page_size,
+                schema=resolved,
+            )
         )
+        for page in pages:
+            yield from self._stream_page(page, resolved, cursor, on_checkpoint)
+
+    def sync_since(
+        self,
+        watermark: datetime | None,
+        search: str = "",
+        status: List[OppStatusOptions] | None = None,
+        page_size: int | None = None,
+        schema: Optional[type[OpportunityBase]] = None,
+        filters: Optional[FiltersT] = None,
+    ) -> SyncResult[ItemT]:
+        """Fetch only the opportunities modified since ``watermark``.
+
+        Streams the search (sorted by ``lastModifiedAt``, newest first) and stops
+        requesting pages at the first row older than ``watermark``, so the cost
+        scales with how much changed. Rows modified exactly at ``watermark`` are
+        included again so none is missed. ``None`` fetches everything.
+
+        Args:
+            watermark: ``SyncResult.watermark`` from the previous sync (naive
+                datetimes are taken as UTC), or None for a full sync.
+            search, status, page_size, schema, filters: As for ``search()``.
+
+        Returns:
+            ``SyncResult`` — changed ``items``, parse ``errors`` and the new
+            ``watermark`` to store for the next sync.
+
+        Raises:
+            APIError: If an API request fails.
+            FilterError: If any filter value is invalid or conflicting.
+        """
+        delta: DeltaCollector[ItemT] = DeltaCollector(watermark)
+        rows = self.iter_search(search, status, page_size, schema, filters)
+        for row in rows:  # breaking out stops further page requests
+            if not delta.add(row):
+                break
+        return delta.result()
+
+
+class AsyncOpportunities(_OpportunitiesBase[FiltersT, ItemT]):
+    """Fetch opportunity data from the CommonGrants API on an ``AsyncClient``.
+
+    The coroutine twin of :class:`Opportunities`: same arguments, same bound
+    filters and schema, same ``ListResult`` / ``SearchResult`` shapes.
+    """
+
+    client: "AsyncClient[FiltersT, ItemT]"
 
-        items, parse_errors = parse_batch(
-            cast("list[dict[str, Any]]", list(paginated.items)), resolved
+    def __init__(self, client: "AsyncClient[FiltersT, ItemT]"):
+        """Initialize the Opportunity resource.
+
+        Args:
+            client: AsyncClient instance for making API requests
+        """
+        self.client = client
+
+    async def list(
+        self,
+        page: int | None = None,
+        page_size: int | None = None,
+        schema: Optional[type[OpportunityBase]] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> ListResult[ItemT]:
+        """Fetch a set of opportunities. See :meth:`Opportunities.list`.
+
+        Raises:
+            APIError: If the API request fails
+            ValueError: If a field is not on the schema
+        """
+        resolved, params = self._projection(schema, fields)
+        with measure_transfer() as transfer:
+            paginated = await self.client.list(
+                self.path,
+                page=page,
+                page_size=page_size,
+                params=params,
+                schema=resolved,
+            )
+        return self._list_result(paginated, resolved, transfer)
+
+    async def get(
+        self,
+        opp_id: str | UUID,
+        schema: Optional[type[OpportunityBase]] = None,
+    ) -> ItemT:
+        """Get a specific opportunity by ID. See :meth:`Opportunities.get`.
+
+        Raises:
+            APIError: If the API request fails
+        """
+        resolved = self._schema(schema)
+        success_response = await self.client.get_item(self.path, opp_id)
+        return self._parse_item(success_response, resolved)
+
+    async def get_many(
+        self,
+        opp_ids: Iterable[str | UUID],
+        concurrency: int | None = None,
+        schema: Optional[type[OpportunityBase]] = None,
+    ) -> GetManyResult[ItemT]:
+        """Get many opportunities by ID concurrently. See ``Opportunities.get_many``."""
+        resolved = self._schema(schema)
+        ids = _unique_ids(opp_ids)
+
+        async def fetch(opp_id: str) -> SuccessResponse | APIError:
+            try:
+                return await self.client.get_item(self.path, opp_id)
+            except _FETCH_ERRORS as error:
+                return _fetch_error(error)
+
+        responses = await gather_concurrently(
+            [partial(fetch, opp_id) for opp_id in ids],
+            concurrency or self.client.config.max_concurrency,
         )
+        return self._get_many_result(ids, responses, resolved)
 
-        # filter_info carries the server's filter feedback only — client-side
-        # filter problems already raised above. sort/filter info are preserved
-        # through page-aggregation (pagination copies the first page's Filtered
-        # envelope); the getattr fallbacks fire only on the empty-result path,
-        # which returns a plain Paginated.
-        server_filter_info = getattr(paginated, "filter_info", None)
-        server_errors = list(getattr(server_filter_info, "errors", None) or [])
-        filter_info: FilterInfo[Any] = FilterInfo(
-            filters=filters_body,
-            errors=server_errors,
+    async def search(
+        self,
+        search: str = "",
+        status: List[OppStatusOptions] | None = None,
+        page: int | None = None,
+        page_size: int | None = None,
+        schema: Optional[type[OpportunityBase]] = None,
+        filters: Optional[FiltersT] = None,
+        fields: Optional[Iterable[str]] = None,
+        sorting: Optional[OppSorting] = None,
+    ) -> SearchResult[ItemT]:
+        """Search for opportunities. See :meth:`Opportunities.search`.
+
+        Raises:
+            APIError: If the API request fails.
+            FilterError: If any filter value — or the ``status`` shorthand — is
+                invalid or conflicting.
+            ValueError: If a field is not on the schema.
+        """
+        resolved, params = self._projection(schema, fields)
+        request_data, filters_body = self._search_request(
+            search, status, filters, sorting
         )
+        with measure_transfer() as transfer:
+            paginated = await self.client.search(
+                f"{self.path}/search",
+                request_data,
+                page=page,
+                page_size=page_size,
+                params=params,
+                schema=resolved,
+            )
+        return self._search_result(paginated, resolved, filters_body, transfer)
 
-        return SearchResult(
-            items=cast("list[ItemT]", items),
-            errors=parse_errors,
-            pagination_info=paginated.pagination_info,
-            filter_info=filter_info,
-            sort_info=getattr(paginated, "sort_info", None),
+    async def search_prepared(
+        self,
+        prepared: PreparedSearch,
+        page: int | None = None,
+        page_size: int | None = None,
+        schema: Optional[type[OpportunityBase]] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> SearchResult[ItemT]:
+        """Run a prepared search. See :meth:`Opportunities.search_prepared`.
+
+        Raises:
+            APIError: If the API request fails.
+            ValueError: If a field is not on the schema.
+        """
+        resolved, params = self._projection(schema, fields)
+        with measure_transfer() as transfer:
+            paginated = await self.client.search(
+                f"{self.path}/search",
+                prepared.body,
+                page=page,
+                page_size=page_size,
+                params=params,
+                schema=resolved,
+            )
+        return self._search_result(paginated, resolved, prepared.filters_body, transfer)
+
+    async def list_lazy(
+        self,
+        page: int | None = None,
+        page_size: int | None = None,
+        schema: Optional[type[OpportunityBase]] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> LazyListResult[ItemT]:
+        """Fetch opportunities, validated on read. See ``Opportunities.list_lazy``.
+
+        Raises:
+            APIError: If the API request fails
+            ValueError: If a field is not on the schema
+        """
+        row_schema, params = self._projection(schema, fields)
+        with measure_transfer() as transfer:
+            paginated = await self.client.list(
+                self.path, page=page, page_size=page_size, params=params
+            )
+        return self._lazy_list_result(paginated, row_schema, transfer)
+
+    async def iter_list(
+        self,
+        page_size: int | None = None,
+        schema: Optional[type[OpportunityBase]] = None,
+        checkpoint: PageCheckpoint | str | None = None,
+        on_checkpoint: Optional[Callable[[PageCheckpoint], None]] = None,
+    ) -> AsyncGenerator[ItemT | ParseFailure, None]:
+        """Stream every opportunity, one page at a time. See
+        :meth:`Opportunities.iter_list`.
+
+        Raises:
+            APIError: If an API request fails
+            ValueError: If ``checkpoint`` belongs to a different request
+        """
+        resolved = self._schema(schema)
+        cursor = self._cursor(self.path, None, page_size, checkpoint)
+
+        async def fetch(page: int) -> Paginated[Any]:
+            return await self.client.list(
+                self.path, page=page, page_size=cursor.page_size, schema=resolved
+            )
+
+        async for page in cursor.apages(fetch):
+            for row in self._stream_page(page, resolved, cursor, on_checkpoint):
+                yield row
+
+    async def search_lazy(
+        self,
+        search: str = "",
+        status: List[OppStatusOptions] | None = None,
+        page: int | None = None,
+        page_size: int | None = None,
+        schema: Optional[type[OpportunityBase]] = None,
+        filters: Optional[FiltersT] = None,
+        fields: Optional[Iterable[str]] = None,
+        sorting: Optional[OppSorting] = None,
+    ) -> LazySearchResult[ItemT]:
+        """Search, validating rows on read. See ``Opportunities.search_lazy``.
+
+        Raises:
+            APIError: If the API request fails.
+            FilterError: If any filter value is invalid or conflicting.
+            ValueError: If a field is not on the schema.
+        """
+        row_schema, params = self._projection(schema, fields)
+        request_data, filters_body = self._search_request(
+            search, status, filters, sorting
         )
+        with measure_transfer() as transfer:
+            paginated = await self.client.search(
+                f"{self.path}/search",
+                request_data,
+                page=page,
+                page_size=page_size,
+                params=params,
+            )
+        return self._lazy_search_result(paginated, row_schema, filters_body, transfer)
+
+    async def iter_search(
+        self,
+        search: str = "",
+        status: List[OppStatusOptions] | None = None,
+        page_size: int | None = None,
+        schema: Optional[type[OpportunityBase]] = None,
+        filters: Optional[FiltersT] = None,
+        sorting: Optional[OppSorting] = None,
+        checkpoint: PageCheckpoint | str | None = None,
+        on_checkpoint: Optional[Callable[[PageCheckpoint], None]] = None,
+    ) -> AsyncGenerator[ItemT | ParseFailure, None]:
+        """Stream every search match, one page at a time. See
+        :meth:`Opportunities.iter_search`.
+
+        Raises:
+            APIError: If an API request fails.
+            FilterError: If any filter value — or the ``status`` shorthand — is
+                invalid or conflicting.
+            ValueError: If ``checkpoint`` belongs to a different request
+        """
+        resolved = self._schema(schema)
+        request_data, _ = self._search_request(search, status, filters, sorting)
+        path = f"{self.path}/search"
+        cursor = self._cursor(path, request_data, page_size, checkpoint)
+
+        async def fetch(page: int) -> Paginated[Any]:
+            return await self.client.search(
+                path,
+                request_data,
+                page=page,
+                page_size=cursor.page_size,
+                schema=resolved,
+            )
+
+        async for page in cursor.apages(fetch):
+            for row in self._stream_page(page, resolved, cursor, on_checkpoint):
+                yield row
+
+    async def sync_since(
+        self,
+        watermark: datetime | None,
+        search: str = "",
+        status: List[OppStatusOptions] | None = None,
+        page_size: int | None = None,
+        schema: Optional[type[OpportunityBase]] = None,
+        filters: Optional[FiltersT] = None,
+    ) -> SyncResult[ItemT]:
+        """Fetch only the opportunities modified since ``watermark``. See
+        :meth:`Opportunities.sync_since`.
+        """
+        delta: DeltaCollector[ItemT] = DeltaCollector(watermark)
+        rows = self.iter_search(search, status, page_size, schema, filters)
+        try:
+            async for row in rows:
+                if not delta.add(row):
+                    break
+        finally:
+            await rows.aclose()
+        return delta.result()
+
+
+def _unique_ids(opp_ids: Iterable[str | UUID]) -> list[str]:
+    """The IDs as strings, first occurrence kept, in order."""
+    return list(dict.fromkeys(str(opp_id) for opp_id in opp_ids))
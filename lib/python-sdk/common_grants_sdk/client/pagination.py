@@ -1,20 +1,144 @@
-"""Pagination decorator for client methods.
+"""Pagination decorators for client methods.
 
-This decorator adds automatic pagination support to methods that fetch a single
-page of results. When the `page` parameter is None, it automatically fetches all
-pages and aggregates the results.
+These decorators add automatic pagination support to methods that fetch a single
+page of results. When the `page` parameter is None, they automatically fetch all
+pages and aggregate the results. ``pagination`` wraps the synchronous client's
+methods; ``async_pagination`` wraps the coroutine methods of the async client.
+
+Page 1 reveals ``totalPages``, so the remaining pages needed to reach
+``config.list_items_limit`` are fetched concurrently (up to
+``config.max_concurrency`` at a time) and reassembled in page order.
+
+``iter_pages`` / ``aiter_pages`` walk the same pages lazily, one at a time, for
+callers that stream rows instead of aggregating them.
 """
 
 import inspect
-from functools import wraps
-from typing import TYPE_CHECKING, Any, Callable, cast
+from collections.abc import AsyncIterator, Awaitable, Iterator
+from functools import partial, wraps
+from typing import TYPE_CHECKING, Any, Callable, Optional, cast
 
+from .concurrency import gather_concurrently, map_concurrently
 from .types import ItemsT
 from ..schemas.pydantic.pagination import PaginatedResultsInfo
 from ..schemas.pydantic.responses import Paginated
 
 if TYPE_CHECKING:
-    from .client import Client
+    from .client import AsyncBaseClient, BaseClient
+
+
+def _next_page(
+    page_response: Paginated[ItemsT], items_fetched: int, list_items_limit: int
+) -> Optional[int]:
+    """The page to fetch after ``page_response``, or None when aggregation is done.
+
+    Aggregation stops once ``list_items_limit`` items have been fetched or the
+    server reports no further pages.
+    """
+    if items_fetched >= list_items_limit:
+        return None
+    info = page_response.pagination_info
+    if info.page >= info.total_pages:
+        return None
+    return info.page + 1
+
+
+def _prefetch_pages(
+    first_response: Paginated[ItemsT], page_size: int, list_items_limit: int
+) -> list[int]:
+    """The pages to fetch concurrently once the first page has arrived.
+
+    Plans just enough pages to reach ``list_items_limit``, assuming later pages
+    are as full as the first; a short page leaves the limit unreached, and the
+    caller then continues page by page from the last one fetched.
+    """
+    info = first_response.pagination_info
+    fetched = len(first_response.items)
+    if fetched >= list_items_limit or info.page >= info.total_pages:
+        return []
+    per_page = fetched or page_size
+    pages_needed = -(-(list_items_limit - fetched) // per_page)
+    last_page = min(info.total_pages, info.page + pages_needed)
+    return list(range(info.page + 1, last_page + 1))
+
+
+def iter_pages(
+    fetch_page: Callable[[int], Paginated[ItemsT]], start_page: int = 1
+) -> Iterator[Paginated[ItemsT]]:
+    """Yield pages one at a time, from ``start_page`` to the server's last page.
+
+    Each page is fetched only when the previous one has been consumed, so at
+    most one page is held at a time. An empty page also ends the walk.
+    """
+    page_number: int | None = start_page
+    while page_number is not None:
+        page_response = fetch_page(page_number)
+        yield page_response
+        page_number = _following_page(page_response)
+
+
+async def aiter_pages(
+    fetch_page: Callable[[int], Awaitable[Paginated[ItemsT]]], start_page: int = 1
+) -> AsyncIterator[Paginated[ItemsT]]:
+    """Async counterpart of :func:`iter_pages`."""
+    page_number: int | None = start_page
+    while page_number is not None:
+        page_response = await fetch_page(page_number)
+        yield page_response
+        page_number = _following_page(page_response)
+
+
+def _following_page(page_response: Paginated[ItemsT]) -> Optional[int]:
+    """The page after ``page_response`` for a page walk, or None at the end."""
+    info = page_response.pagination_info
+    if not page_response.items or info.page >= info.total_pages:
+        return None
+    return info.page + 1
+
+
+def _aggregate(
+    first_response: Optional[Paginated[ItemsT]],
+    latest_response: Optional[Paginated[ItemsT]],
+    items: list[dict],
+    page_size: int,
+    list_items_limit: int,
+) -> Paginated[ItemsT]:
+    """Build the aggregated response for an all-pages fetch.
+
+    Trims ``items`` to ``list_items_limit`` and reports aggregated pagination info
+    (page=1, totalItems=aggregated count, totalPages=1).
+    """
+    # Trim items array to not exceed max items limit
+    items = items[:list_items_limit]
+
+    aggregated_pagination_info = PaginatedResultsInfo(
+        page=1,
+        pageSize=len(items) or page_size,
+        totalItems=len(items),
+        totalPages=1,
+    )
+
+    # Build aggregated response. Copy the first page's response so any extra
+    # envelope fields (search -> Filtered's sortInfo/filterInfo) are preserved;
+    # this is a no-op for plain Paginated (list), which has no such fields.
+    if first_response is not None:
+        return cast(
+            Paginated[ItemsT],
+            first_response.model_copy(
+                update={
+                    "items": cast(list[ItemsT], items),
+                    "pagination_info": aggregated_pagination_info,
+                }
+            ),
+        )
+
+    # No response was fetched (e.g. empty result set with no pages).
+    return Paginated[ItemsT](
+        status=latest_response.status if latest_response else 200,
+        message=latest_response.message if latest_response else "Success",
+        items=cast(list[ItemsT], items),
+        paginationInfo=aggregated_pagination_info,
+    )
 
 
 def pagination(single_page_func: Callable) -> Callable:
@@ -26,9 +150,10 @@ def pagination(single_page_func: Callable) -> Callable:
       a single response, limited by config.list_items_limit
 
     When fetching all pages:
-    - Starts at page 1 and continues until all pages are fetched or the limit
-      is reached
-    - Aggregates all items from all pages into a single list
+    - Fetches page 1, then the further pages needed to reach the limit
+      concurrently (at most ``config.max_concurrency`` in flight), continuing
+      page by page if short pages leave the limit unreached
+    - Aggregates all items from all pages into a single list, in page order
     - Returns a Paginated response with aggregated pagination info (page=1,
       totalItems=aggregated count, totalPages=1)
 
@@ -48,7 +173,7 @@ def pagination(single_page_func: Callable) -> Callable:
 
     @wraps(single_page_func)
     def wrapper(
-        self: "Client",
+        self: "BaseClient",
         *args: Any,
         page: int | None = None,
         page_size: int | None = None,
@@ -66,72 +191,114 @@ def pagination(single_page_func: Callable) -> Callable:
             return single_page_func(*bound.args, **bound.kwargs)
 
         # Otherwise, fetch all pages
-        items: list[dict] = []
-        first_response: Paginated[ItemsT] | None = None
-        latest_response: Paginated[ItemsT] | None = None
-
-        current_page = 1
         page_size = page_size or self.config.page_size
+        list_items_limit = self.config.list_items_limit
 
-        more_pages_available = True
-
-        # Iteratively fetch all pages
-        while more_pages_available:
-            # Fetch page and save items - update kwargs to set page
+        def fetch(page_number: int) -> Paginated[ItemsT]:
             bound = sig.bind(
-                self, *args, page=current_page, page_size=page_size, **kwargs
+                self, *args, page=page_number, page_size=page_size, **kwargs
             )
             bound.apply_defaults()
-            page_response: Paginated[ItemsT] = single_page_func(
-                *bound.args, **bound.kwargs
+            return single_page_func(*bound.args, **bound.kwargs)
+
+        # Page 1 reveals totalPages; fetch the rest of what the limit needs at once.
+        first_response: Paginated[ItemsT] = fetch(1)
+        responses = [first_response]
+        responses.extend(
+            map_concurrently(
+                fetch,
+                _prefetch_pages(first_response, page_size, list_items_limit),
+                self.config.max_concurrency,
             )
+        )
+        items: list[dict] = []
+        for page_response in responses:
             items.extend(cast(list[dict], page_response.items))
-            if first_response is None:
-                first_response = page_response
-            latest_response = page_response
-
-            # Break if max items is reached or no more pages
-            if len(items) >= self.config.list_items_limit:
-                more_pages_available = False
-            elif (
-                page_response.pagination_info.page
-                >= page_response.pagination_info.total_pages
-            ):
-                more_pages_available = False
-            else:
-                current_page = page_response.pagination_info.page + 1
-                more_pages_available = True
-
-        # Trim items array to not exceed max items limit
-        items = items[: self.config.list_items_limit]
-
-        aggregated_pagination_info = PaginatedResultsInfo(
-            page=1,
-            pageSize=len(items) or page_size,
-            totalItems=len(items),
-            totalPages=1,
+
+        # Short pages can leave the limit unreached: continue one page at a time.
+        latest_response = responses[-1]
+        current_page = _next_page(latest_response, len(items), list_items_limit)
+        while current_page is not None:
+            latest_response = fetch(current_page)
+            items.extend(cast(list[dict], latest_response.items))
+            current_page = _next_page(latest_response, len(items), list_items_limit)
+
+        return _aggregate(
+            first_response,
+            latest_response,
+            items,
+            page_size,
+            list_items_limit,
         )
 
-        # Build aggregated response. Copy the first page's response so any extra
-        # envelope fields (search -> Filtered's sortInfo/filterInfo) are preserved;
-        # this is a no-op for plain Paginated (list), which has no such fields.
-        if first_response is not None:
-            return cast(
-                Paginated[ItemsT],
-                first_response.model_copy(
-                    update={
-                        "items": cast(list[ItemsT], items),
-                        "pagination_info": aggregated_pagination_info,
-                    }
-                ),
+    return wrapper
+
+
+def async_pagination(single_page_func: Callable) -> Callable:
+    """Async counterpart of :func:`pagination` for coroutine single-page methods.
+
+    Same contract as ``pagination``: a given `page` fetches just that page, and
+    `page=None` fetches every page up to ``config.list_items_limit`` and returns
+    one aggregated response that preserves the first page's envelope.
+    """
+    sig = inspect.signature(single_page_func)
+
+    @wraps(single_page_func)
+    async def wrapper(
+        self: "AsyncBaseClient",
+        *args: Any,
+        page: int | None = None,
+        page_size: int | None = None,
+        **kwargs: Any,
+    ) -> Paginated[ItemsT]:
+        kwargs.pop("page", None)
+        kwargs.pop("page_size", None)
+
+        if page is not None:
+            bound = sig.bind(self, *args, page=page, page_size=page_size, **kwargs)
+            bound.apply_defaults()
+            return await single_page_func(*bound.args, **bound.kwargs)
+
+        page_size = page_size or self.config.page_size
+        list_items_limit = self.config.list_items_limit
+
+        async def fetch(page_number: int) -> Paginated[ItemsT]:
+            bound = sig.bind(
+                self, *args, page=page_number, page_size=page_size, **kwargs
+            )
+            bound.apply_defaults()
+            return await single_page_func(*bound.args, **bound.kwargs)
+
+        first_response: Paginated[ItemsT] = await fetch(1)
+        responses = [first_response]
+        responses.extend(
+            await gather_concurrently(
+                [
+                    partial(fetch, page_number)
+                    for page_number in _prefetch_pages(
+                        first_response, page_size, list_items_limit
+                    )
+                ],
+                self.config.max_concurrency,
             )
+        )
+        items: list[dict] = []
+        for page_response in responses:
+            items.extend(cast(list[dict], page_response.items))
+
+        latest_response = responses[-1]
+        current_page = _next_page(latest_response, len(items), list_items_limit)
+        while current_page is not None:
+            latest_response = await fetch(current_page)
+            items.extend(cast(list[dict], latest_response.items))
+            current_page = _next_page(latest_response, len(items), list_items_limit)
 
-        # No response was fetched (e.g. empty result set with no pages).
-        return Paginated[ItemsT](
-            status=latest_response.status if latest_response else 200,
-            message=latest_response.message if latest_response else "Success",
-            items=cast(list[ItemsT], items),
-            paginationInfo=aggregated_pagination_info,
+        return _aggregate(
+            first_response,
+            latest_response,
+            items,
+            page_size,
+            list_items_limit,
         )
 
     return wrapper
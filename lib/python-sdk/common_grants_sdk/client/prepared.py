@@ -0,0 +1,60 @@
+"""Prepared opportunity searches for the CommonGrants client.
+
+``client.opportunities.prepare(...)`` classifies and validates a search's
+filters and builds its request body once, returning a ``PreparedSearch``.
+``search_prepared(prepared, page=...)`` then runs it as often as needed, with
+any page, page size, schema or fields, without classifying the filters again.
+
+A ``PreparedSearch`` is immutable and hashable: it holds the serialized body,
+and two preparations of the same search compare equal, so saved searches can
+be kept in sets, used as dict keys, or persisted (``body`` is the JSON sent,
+byte for byte, on every run).
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Optional
+
+from ..schemas.pydantic.filters.opportunity import OppFilters
+
+
+@dataclass(frozen=True)
+class PreparedSearch:
+    """An opportunity search, validated and serialized once, ready to run.
+
+    Attributes:
+        body: The JSON request body, as sent
+    """
+
+    body: bytes
+
+    @classmethod
+    def from_request(cls, request_data: dict[str, Any]) -> "PreparedSearch":
+        """Serialize a JSON-ready search request body."""
+        return cls(json.dumps(request_data, separators=(",", ":")).encode())
+
+    @property
+    def key(self) -> str:
+        """A stable fingerprint of the search, e.g. for an external cache."""
+        return hashlib.sha256(self.body).hexdigest()
+
+    @cached_property
+    def filters_body(self) -> dict[str, Any]:
+        """The ``filters`` object of the body, decoded once (empty without filters).
+
+        Shared by every run of the search; use :meth:`request_data` for a copy
+        to modify.
+        """
+        return json.loads(self.body).get("filters") or {}
+
+    @cached_property
+    def filters(self) -> Optional[OppFilters]:
+        """The classified filters the search sends, or None without filters."""
+        filters_body = self.filters_body
+        return OppFilters.model_validate(filters_body) if filters_body else None
+
+    def request_data(self) -> dict[str, Any]:
+        """A fresh copy of the request body, as the dict passed to the client."""
+        return json.loads(self.body)
@@ -0,0 +1,109 @@
+"""Projected Opportunity models for the CommonGrants client.
+
+``projected_model(schema, fields)`` is a subclass of ``schema`` that validates
+only the named fields, so an index-style pull that needs ``id`` and ``title`` no
+longer pays for ``description``, ``funding``, ``keyDates`` or ``customFields``.
+The other fields are dropped from the input and left as None, so projected rows
+are still instances of ``schema`` and keep its validators, but validators that
+read a field outside the projection see None. Models are built once per schema
+and field set and cached.
+
+``fields_param`` is the matching sparse-fieldset query value (wire names,
+comma-separated) sent as ``?fields=`` so servers that support it can omit the
+other fields from the response; servers that ignore it still return full rows,
+whose extra fields the projected model skips.
+"""
+
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Any, ClassVar, Optional
+
+from pydantic import ConfigDict, Field, create_model, model_validator
+
+from ..schemas.pydantic.base import CommonGrantsBaseModel
+
+
+class ProjectedModel(CommonGrantsBaseModel):
+    """Mixin base of the models built by :func:`projected_model`.
+
+    Attributes:
+        projected_fields: Attribute names of the fields the model validates
+    """
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    projected_fields: ClassVar[tuple[str, ...]] = ()
+    # Attribute names and wire aliases of projected_fields.
+    projected_keys: ClassVar[frozenset[str]] = frozenset()
+
+    @model_validator(mode="before")
+    @classmethod
+    def _drop_unprojected(cls, data: Any) -> Any:
+        if not isinstance(data, dict):
+            return data
+        return {key: value for key, value in data.items() if key in cls.projected_keys}
+
+
+def projection_fields(schema: type[Any], fields: Iterable[str]) -> tuple[str, ...]:
+    """Normalize ``fields`` (attribute names or wire aliases) to attribute names.
+
+    Returns them in the schema's field order, so equivalent field lists share
+    one cached model.
+
+    Raises:
+        ValueError: If a field is not on ``schema``
+    """
+    by_alias = {info.alias or name: name for name, info in schema.model_fields.items()}
+    wanted: set[str] = set()
+    for field in fields:
+        name = field if field in schema.model_fields else by_alias.get(field)
+        if name is None:
+            raise ValueError(f"Unknown field {field!r} for {schema.__name__}")
+        wanted.add(name)
+    return tuple(name for name in schema.model_fields if name in wanted)
+
+
+def fields_param(schema: type[Any], fields: Iterable[str]) -> str:
+    """The ``fields`` query value for ``fields``: their wire names, comma-separated.
+
+    Raises:
+        ValueError: If a field is not on ``schema``
+    """
+    return ",".join(
+        schema.model_fields[name].alias or name
+        for name in projection_fields(schema, fields)
+    )
+
+
+def projected_model(schema: type[Any], fields: Iterable[str]) -> type[ProjectedModel]:
+    """A subclass of ``schema`` that validates only ``fields``; the rest are None.
+
+    Raises:
+        ValueError: If a field is not on ``schema``
+    """
+    return _projected_model(schema, projection_fields(schema, fields))
+
+
+@lru_cache(maxsize=128)
+def _projected_model(schema: type[Any], names: tuple[str, ...]) -> type[ProjectedModel]:
+    # Fields outside the projection are never validated, so their type does not
+    # matter: they default to None and are left out of dumps.
+    definitions: dict[str, Any] = {
+        name: (Optional[Any], Field(default=None, exclude=True))
+        for name in schema.model_fields
+        if name not in names
+    }
+    model = create_model(
+        f"{schema.__name__}Projection",
+        __base__=(ProjectedModel, schema),
+        __module__=schema.__module__,
+        **definitions,
+    )
+    model.projected_fields = names
+    model.projected_keys = frozenset(
+        key
+        for name in names
+        for key in (name, schema.model_fields[name].alias)
+        if key is not None
+    )
+    return model
@@ -0,0 +1,170 @@
+"""Client-side rate limiting for the CommonGrants client.
+
+A ``RateLimiter`` on ``Config.rate_limit`` paces every request the client sends,
+retries included, with a token bucket (``rate`` requests per second, bursts of
+up to ``burst``) and caps how many are in flight at once (``max_in_flight``).
+
+One limiter is shared by every client whose ``Config`` holds it, across threads
+and across sync and async clients, so workers sharing an API key can be held to
+one quota: build a single ``Config`` (or ``RateLimiter``) and pass it to each
+``plugin.get_client(...)`` call. Limiters configured from environment variables
+are shared process-wide automatically.
+
+When the server answers ``429 Too Many Requests`` with a ``Retry-After``, the
+limiter holds back every client sharing it for that long.
+"""
+
+import asyncio
+import math
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Iterator, Optional
+
+import httpx
+
+from .retry import _retry_after_seconds
+
+
+class RateLimiter:
+    """A token bucket and an in-flight cap, shared by the clients using it.
+
+    Args:
+        rate: Requests per second; None for no rate limit
+        burst: Requests that may be sent back to back after an idle period;
+            defaults to ``rate`` rounded up
+        max_in_flight: Max requests awaiting a response at once; None for no cap
+
+    Raises:
+        ValueError: If a limit is not positive
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+    ):
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst is not None and burst < 1:
+            raise ValueError("burst must be at least 1")
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self.rate = rate
+        self.burst = burst or math.ceil(rate or 1)
+        self.max_in_flight = max_in_flight
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._slot_freed = threading.Condition(self._lock)
+        self._async_waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+    def _reserve(self) -> float:
+        """Take a token; return the seconds to wait before sending with it.
+
+        Tokens may be taken ahead of time (the bucket goes negative), so callers
+        queue in the order they arrived instead of racing when a token frees up.
+        """
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self._paused_until - now)
+            if self.rate is None:
+                return wait
+            elapsed = now - self._updated
+            if elapsed > 0:
+                self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+                self._updated = now
+            self._tokens -= 1
+            bucket_wait = max(0.0, self._updated - now)
+            if self._tokens < 0:
+                bucket_wait += -self._tokens / self.rate
+            return max(wait, bucket_wait)
+
+    def _has_slot(self) -> bool:
+        return self.max_in_flight is None or self._in_flight < self.max_in_flight
+
+    def _release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._slot_freed.notify()
+            waiters, self._async_waiters = self._async_waiters, []
+        for loop, waiter in waiters:
+            loop.call_soon_threadsafe(_wake, waiter)
+
+    @contextmanager
+    def acquire(self) -> Iterator[None]:
+        """Hold an in-flight slot and a token for the ``with`` block."""
+        with self._slot_freed:
+            while not self._has_slot():
+                self._slot_freed.wait()
+            self._in_flight += 1
+        try:
+            wait = self._reserve()
+            if wait > 0:
+                time.sleep(wait)
+            yield
+        finally:
+            self._release()
+
+    @asynccontextmanager
+    async def aacquire(self) -> AsyncIterator[None]:
+        """Async counterpart of :meth:`acquire`."""
+        while True:
+            with self._lock:
+                if self._has_slot():
+                    self._in_flight += 1
+                    break
+                loop = asyncio.get_running_loop()
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            await waiter
+        try:
+            wait = self._reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            yield
+        finally:
+            self._release()
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every request for ``seconds`` from now."""
+        with self._lock:
+            until = time.monotonic() + seconds
+            self._paused_until = max(self._paused_until, until)
+            if self.rate is not None and until > self._updated:
+                # Don't let tokens pile up during the pause and burst after it.
+                self._tokens = min(self._tokens, 0.0)
+                self._updated = until
+
+    def observe(self, response: httpx.Response) -> None:
+        """Pause the limiter if ``response`` is a 429 with a ``Retry-After``."""
+        if response.status_code == 429:
+            retry_after = _retry_after_seconds(response)
+            if retry_after:
+                self.pause(retry_after)
+
+
+def _wake(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+_shared: dict[tuple, RateLimiter] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_limiter(
+    rate: Optional[float] = None,
+    burst: Optional[int] = None,
+    max_in_flight: Optional[int] = None,
+) -> RateLimiter:
+    """The process-wide limiter for these settings, created on first use."""
+    key = (rate, burst, max_in_flight)
+    with _shared_lock:
+        limiter = _shared.get(key)
+        if limiter is None:
+            limiter = _shared[key] = RateLimiter(rate, burst, max_in_flight)
+        return limiter
@@ -4,16 +4,24 @@
 parsed (``items``) and the rows that did not (``errors``), so one malformed row
 never fails the whole response. This is distinct from ``filter_info.errors``,
 which carries filter-validation and server-reported errors.
+
+``LazyListResult`` / ``LazySearchResult`` hold the rows unparsed in ``LazyRows``
+instead, validating each one only when it is first read.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Generic, Optional
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, replace
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Generic, Optional, cast, overload
 
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from typing_extensions import TypeVar
 
+from .compression import TransferStats
+from .exceptions import APIError
 from ..schemas.pydantic.pagination import PaginatedResultsInfo
 from ..schemas.pydantic.responses.success import FilterInfo
 from ..schemas.pydantic.sorting import SortedResultsInfo
@@ -41,6 +49,8 @@ class ListResult(Generic[ItemT]):
     items: list[ItemT]
     errors: list[ParseFailure]
     pagination_info: PaginatedResultsInfo
+    # Bytes received for the page(s) behind this result.
+    transfer: Optional[TransferStats] = None
 
 
 @dataclass
@@ -60,6 +70,154 @@ class SearchResult(Generic[ItemT]):
     # path returns a plain Paginated); page-aggregation preserves the first
     # page's sort_info via model_copy.
     sort_info: Optional[SortedResultsInfo] = None
+    # Bytes received for the page(s) behind this result.
+    transfer: Optional[TransferStats] = None
+
+
+@dataclass
+class GetManyResult(Generic[ItemT]):
+    """A bulk fetch by ID: each requested ID lands in exactly one of the dicts.
+
+    ``items`` holds the parsed records, ``errors`` the records that came back but
+    failed to parse (``ParseFailure.index`` is the ID's position among the
+    deduplicated IDs), and ``api_errors`` the IDs whose request failed, including
+    network errors and unreadable responses (as an ``APIError``). All three are
+    keyed by the ID as a string.
+    """
+
+    items: dict[str, ItemT]
+    errors: dict[str, ParseFailure]
+    api_errors: dict[str, APIError]
+
+
+@dataclass
+class SyncResult(Generic[ItemT]):
+    """The records changed since a watermark, and the watermark to use next.
+
+    ``watermark`` is the newest ``lastModifiedAt`` seen (or the watermark passed
+    in when nothing changed); store it and pass it to the next sync.
+    """
+
+    items: list[ItemT]
+    errors: list[ParseFailure]
+    watermark: Optional[datetime]
+
+
+@dataclass
+class EndpointReport:
+    """How one server fared in a federated search.
+
+    ``latency`` is the wall time of its search in seconds (the timeout, if it
+    timed out). Exactly one of ``result`` and ``error`` is set. ``duplicates``
+    counts its rows dropped because another server's copy ranked first.
+    """
+
+    latency: float
+    result: Optional[SearchResult[Any]] = None
+    error: Optional[Exception] = None
+    duplicates: int = 0
+
+
+@dataclass
+class FederatedSearchResult(Generic[ItemT]):
+    """The merged rows of a search across several servers.
+
+    ``items`` are in the requested sort order with one row per ``id``;
+    ``sources[i]`` names the server ``items[i]`` came from. ``endpoints`` holds
+    an ``EndpointReport`` per server, including its parse ``errors`` and
+    ``filter_info`` on ``result``.
+    """
+
+    items: list[ItemT]
+    sources: list[str]
+    endpoints: dict[str, EndpointReport]
+
+    @property
+    def errors(self) -> dict[str, Exception]:
+        """The servers whose search failed or timed out, and why."""
+        return {
+            name: report.error
+            for name, report in self.endpoints.items()
+            if report.error is not None
+        }
+
+
+class LazyRows(Sequence["ItemT | ParseFailure"]):
+    """Rows held as raw dicts and validated into ``schema`` on first access.
+
+    Each row is validated at most once: reading it again returns the same parsed
+    item (or ``ParseFailure``, whose ``index`` is the row's position). Rows that
+    are never read are never validated.
+    """
+
+    def __init__(self, rows: list[dict[str, Any]], schema: type[ItemT]):
+        self._rows = rows
+        self._schema = schema
+        self._parsed: list[ItemT | ParseFailure | None] = [None] * len(rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @overload
+    def __getitem__(self, index: int) -> ItemT | ParseFailure: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[ItemT | ParseFailure]: ...
+
+    def __getitem__(
+        self, index: int | slice
+    ) -> ItemT | ParseFailure | list[ItemT | ParseFailure]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._rows)))]
+        if index < 0:
+            index += len(self._rows)
+        row = self._rows[index]
+        parsed = self._parsed[index]
+        if parsed is None:
+            try:
+                parsed = self._schema.model_validate(row)
+            except ValidationError as exc:
+                parsed = ParseFailure(index=index, message=str(exc), raw=row)
+            self._parsed[index] = parsed
+        return parsed
+
+    def raw(self, index: int) -> dict[str, Any]:
+        """The unparsed row at ``index``."""
+        return self._rows[index]
+
+    def materialize(self) -> tuple[list[ItemT], list[ParseFailure]]:
+        """Validate every row; return ``(items, errors)`` like ``parse_batch``."""
+        items: list[ItemT] = []
+        errors: list[ParseFailure] = []
+        for row in self:
+            if isinstance(row, ParseFailure):
+                errors.append(row)
+            else:
+                items.append(row)
+        return items, errors
+
+
+@dataclass
+class LazyListResult(Generic[ItemT]):
+    """A list response whose rows are validated on first access."""
+
+    rows: LazyRows[ItemT]
+    pagination_info: PaginatedResultsInfo
+    transfer: Optional[TransferStats] = None
+
+
+@dataclass
+class LazySearchResult(Generic[ItemT]):
+    """A search response whose rows are validated on first access.
+
+    ``filter_info`` and ``sort_info`` are as on ``SearchResult``.
+    """
+
+    rows: LazyRows[ItemT]
+    pagination_info: PaginatedResultsInfo
+    filter_info: FilterInfo[Any]
+    sort_info: Optional[SortedResultsInfo] = None
+    transfer: Optional[TransferStats] = None
 
 
 def parse_batch(
@@ -70,7 +228,34 @@ def parse_batch(
     Returns ``(items, errors)``: ``items`` are the rows that validated, in order;
     ``errors`` are ``ParseFailure``s for the rows that did not. A single bad row
     never aborts the batch.
+
+    The whole batch is validated in one call through a cached
+    ``TypeAdapter(list[schema])``. Only when that fails are the failing rows
+    validated one at a time, so each ``ParseFailure`` carries the same message a
+    per-row validation would have produced.
     """
+    adapter = _list_adapter(schema)
+    try:
+        return adapter.validate_python(rows), []
+    except ValidationError as exc:
+        heads = [error["loc"][0] if error["loc"] else None for error in exc.errors()]
+
+    if all(isinstance(head, int) for head in heads):
+        failed = {cast(int, head) for head in heads}
+        failures = [
+            _row_failure(index, rows[index], schema) for index in sorted(failed)
+        ]
+        try:
+            items = adapter.validate_python(
+                [row for index, row in enumerate(rows) if index not in failed]
+            )
+        except ValidationError:
+            pass
+        else:
+            if all(failure is not None for failure in failures):
+                return items, cast(list[ParseFailure], failures)
+
+    # The batch errors did not map cleanly onto rows: validate row by row.
     items: list[ItemT] = []
     errors: list[ParseFailure] = []
     for index, row in enumerate(rows):
@@ -79,3 +264,40 @@ def parse_batch(
         except ValidationError as exc:
             errors.append(ParseFailure(index=index, message=str(exc), raw=row))
     return items, errors
+
+
+@lru_cache(maxsize=64)
+def _list_adapter(schema: type[ItemT]) -> TypeAdapter[list[ItemT]]:
+    """The (cached) adapter validating a whole batch of rows into ``schema``."""
+    return TypeAdapter(list[schema])
+
+
+def _row_failure(
+    index: int, row: dict[str, Any], schema: type[BaseModel]
+) -> Optional[ParseFailure]:
+    """The ``ParseFailure`` for one row, or None if it validates on its own."""
+    try:
+        schema.model_validate(row)
+    except ValidationError as exc:
+        return ParseFailure(index=index, message=str(exc), raw=row)
+    return None
+
+
+def iter_batch(
+    rows: list[dict[str, Any]], schema: type[ItemT], offset: int = 0
+) -> Iterator[ItemT | ParseFailure]:
+    """Parse a batch like ``parse_batch``, yielding rows back in their original order.
+
+    Each row comes out as the parsed item or its ``ParseFailure``. ``offset`` is
+    added to failure indices, so a stream of pages reports each failure's
+    position in the whole stream rather than within its page.
+    """
+    items, errors = parse_batch(rows, schema)
+    failures = {error.index: error for error in errors}
+    parsed = iter(items)
+    for index in range(len(rows)):
+        failure = failures.get(index)
+        if failure is None:
+            yield next(parsed)
+        else:
+            yield replace(failure, index=index + offset)
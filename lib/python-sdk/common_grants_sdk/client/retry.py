@@ -0,0 +1,184 @@
+"""Retry policy for transient CommonGrants API failures.
+
+A ``RetryPolicy`` on ``Config.retry`` makes the client re-send idempotent requests
+(GET, and the read-only search POST) that fail with a transient status (429,
+502, 503, 504 by default) or a transient network error, waiting a jittered exponential
+backoff between attempts, or the server's ``Retry-After`` when it sends one.
+Retries happen per request, so a transient failure on page 12 of an
+auto-paginated pull retries page 12 instead of discarding pages 1-11.
+"""
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Optional
+
+import httpx
+
+DEFAULT_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+# Network failures worth another attempt: timeouts, refused or dropped
+# connections, and a server closing mid-response. Errors a retry cannot fix,
+# such as an unsupported URL scheme, a proxy rejection or a malformed request,
+# are raised at once.
+RETRYABLE_NETWORK_ERRORS: tuple[type[httpx.TransportError], ...] = (
+    httpx.ConnectTimeout,
+    httpx.ReadTimeout,
+    httpx.WriteTimeout,
+    httpx.PoolTimeout,
+    httpx.ConnectError,
+    httpx.ReadError,
+    httpx.RemoteProtocolError,
+)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """When and how long to wait before re-sending a failed request.
+
+    Attributes:
+        max_attempts: Total attempts per request, including the first
+        backoff: Base delay in seconds; attempt ``n`` waits up to
+            ``backoff * 2 ** (n - 1)``
+        max_backoff: Upper bound on a single computed delay
+        jitter: Draw each backoff delay uniformly from ``[0, delay]`` so many
+            clients retrying at once do not stay in lockstep
+        retry_statuses: Response statuses worth retrying
+        retry_network_errors: Also retry ``RETRYABLE_NETWORK_ERRORS``
+        respect_retry_after: Wait the server's ``Retry-After`` when present
+        budget: Max total seconds one request may spend waiting between
+            attempts; a retry whose wait would exceed it is not attempted
+    """
+
+    max_attempts: int = 3
+    backoff: float = 0.5
+    max_backoff: float = 30.0
+    jitter: bool = True
+    retry_statuses: frozenset[int] = DEFAULT_RETRY_STATUSES
+    retry_network_errors: bool = True
+    respect_retry_after: bool = True
+    budget: Optional[float] = 60.0
+
+    def __post_init__(self):
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+    def delay(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """Seconds to wait after failed attempt number ``attempt`` (1-based)."""
+        if self.respect_retry_after and response is not None:
+            retry_after = _retry_after_seconds(response)
+            if retry_after is not None:
+                return retry_after
+        delay = min(self.backoff * 2 ** (attempt - 1), self.max_backoff)
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def retryable(self, response: httpx.Response) -> bool:
+        """Whether ``response``'s status is worth another attempt."""
+        return response.status_code in self.retry_statuses
+
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    """The ``Retry-After`` header as seconds from now, or None if absent/invalid.
+
+    Accepts both forms the header allows: delta-seconds and an HTTP-date.
+    """
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class _Attempts:
+    """Attempt and wait bookkeeping for one request under a policy."""
+
+    def __init__(self, policy: RetryPolicy):
+        self.policy = policy
+        self.attempt = 0
+        self.waited = 0.0
+
+    def next_wait(
+        self,
+        response: Optional[httpx.Response] = None,
+        error: Optional[httpx.TransportError] = None,
+    ) -> Optional[float]:
+        """Seconds to wait before retrying, or None to stop with this outcome."""
+        policy = self.policy
+        if self.attempt >= policy.max_attempts:
+            return None
+        if response is not None and not policy.retryable(response):
+            return None
+        if error is not None and not policy.retry_network_errors:
+            return None
+        wait = policy.delay(self.attempt, response)
+        if policy.budget is not None and self.waited + wait > policy.budget:
+            return None
+        self.waited += wait
+        return wait
+
+
+def send_with_retry(
+    policy: Optional[RetryPolicy],
+    send: Callable[[], httpx.Response],
+    idempotent: bool = True,
+) -> httpx.Response:
+    """Call ``send`` until it succeeds or ``policy`` gives up.
+
+    Returns the last response, retryable or not, so the caller's
+    ``raise_for_status`` reports the final failure as before. A network error on
+    the last attempt is re-raised. Non-idempotent requests are sent once.
+    """
+    if policy is None or not idempotent:
+        return send()
+    attempts = _Attempts(policy)
+    while True:
+        attempts.attempt += 1
+        try:
+            response = send()
+        except RETRYABLE_NETWORK_ERRORS as error:
+            wait = attempts.next_wait(error=error)
+            if wait is None:
+                raise
+        else:
+            wait = attempts.next_wait(response=response)
+            if wait is None:
+                return response
+            response.close()
+        time.sleep(wait)
+
+
+async def asend_with_retry(
+    policy: Optional[RetryPolicy],
+    send: Callable[[], Awaitable[httpx.Response]],
+    idempotent: bool = True,
+) -> httpx.Response:
+    """Async counterpart of :func:`send_with_retry`."""
+    if policy is None or not idempotent:
+        return await send()
+    attempts = _Attempts(policy)
+    while True:
+        attempts.attempt += 1
+        try:
+            response = await send()
+        except RETRYABLE_NETWORK_ERRORS as error:
+            wait = attempts.next_wait(error=error)
+            if wait is None:
+                raise
+        else:
+            wait = attempts.next_wait(response=response)
+            if wait is None:
+                return response
+            await response.aclose()
+        await asyncio.sleep(wait)
@@ -0,0 +1,114 @@
+"""Connection pool settings and shared transports for the CommonGrants client.
+
+By default every client opens its own ``httpx`` connection pool, sized by the
+``Config`` pool settings. To let many clients (e.g. one per plugin via
+``plugin.get_client``) reuse the same warm connections, build one transport and
+pass it to each client's ``Config``::
+
+    shared = build_transport(Config(max_connections=50, http2=True))
+    client_a = plugin_a.get_client(Config(transport=shared))
+    client_b = plugin_b.get_client(Config(transport=shared))
+
+Clients never close an injected transport; whoever built it closes it once all
+clients sharing it are done.
+"""
+
+from typing import Any, Optional
+
+import httpx
+
+from .config import Config
+
+
+def pool_limits(config: Config) -> Optional[httpx.Limits]:
+    """The ``httpx.Limits`` for ``config``, or None when no pool setting is set.
+
+    Unset settings keep httpx's defaults.
+    """
+    if (
+        config.max_connections is None
+        and config.max_keepalive_connections is None
+        and config.keepalive_expiry is None
+    ):
+        return None
+    defaults = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    return httpx.Limits(
+        max_connections=config.max_connections or defaults.max_connections,
+        max_keepalive_connections=(
+            config.max_keepalive_connections
+            if config.max_keepalive_connections is not None
+            else defaults.max_keepalive_connections
+        ),
+        keepalive_expiry=(
+            config.keepalive_expiry
+            if config.keepalive_expiry is not None
+            else defaults.keepalive_expiry
+        ),
+    )
+
+
+def _pool_options(config: Config) -> dict[str, Any]:
+    """Pool keyword arguments for an httpx client or transport; only those set."""
+    options: dict[str, Any] = {}
+    limits = pool_limits(config)
+    if limits is not None:
+        options["limits"] = limits
+    if config.http2:
+        options["http2"] = True
+    return options
+
+
+def build_transport(config: Config) -> httpx.HTTPTransport:
+    """A sync transport with ``config``'s pool settings, for sharing across clients."""
+    return httpx.HTTPTransport(**_pool_options(config))
+
+
+def build_async_transport(config: Config) -> httpx.AsyncHTTPTransport:
+    """An async transport with ``config``'s pool settings, to share across clients."""
+    return httpx.AsyncHTTPTransport(**_pool_options(config))
+
+
+class _SharedTransport(httpx.BaseTransport):
+    """Delegates to a transport the client does not own; closing is a no-op."""
+
+    def __init__(self, transport: httpx.BaseTransport):
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self._transport.handle_request(request)
+
+    def close(self) -> None:
+        pass
+
+
+class _AsyncSharedTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of :class:`_SharedTransport`."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+
+def client_options(config: Config) -> dict[str, Any]:
+    """Keyword arguments for the sync client's ``httpx.Client``."""
+    options: dict[str, Any] = {"timeout": config.timeout}
+    if config.transport is not None:
+        options["transport"] = _SharedTransport(config.transport)
+    else:
+        options.update(_pool_options(config))
+    return options
+
+
+def async_client_options(config: Config) -> dict[str, Any]:
+    """Keyword arguments for the async client's ``httpx.AsyncClient``."""
+    options: dict[str, Any] = {"timeout": config.timeout}
+    if config.async_transport is not None:
+        options["transport"] = _AsyncSharedTransport(config.async_transport)
+    else:
+        options.update(_pool_options(config))
+    return options
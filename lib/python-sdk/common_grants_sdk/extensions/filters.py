@@ -15,6 +15,9 @@ Provides:
   producing the ``OppFilters`` search request body; raises ``FilterError`` on the first
   invalid filter value (standard, registered, or ad-hoc). Registered custom filters are
   recovered from the route's TypedDict via ``get_type_hints``.
+- ``compile_classifier(routes, resource, method)`` — the memoized ``FilterClassifier``
+  behind ``classify_filters``: the route's key → validator table, built once, so
+  classifying a search is a dict lookup plus one validation per key.
 
 No generate.py / codegen dependency. Correctness is enforced at runtime by Pydantic v2.
 """
@@ -23,9 +26,11 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 from dataclasses import fields
-from typing import Any, Optional, Union, get_type_hints, overload
+from enum import StrEnum
+from functools import lru_cache
+from typing import Any, Optional, Union, get_args, get_type_hints, overload
 
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from common_grants_sdk.schemas.pydantic.base import CommonGrantsBaseModel
 from common_grants_sdk.schemas.pydantic.filters.base import (
@@ -326,6 +331,9 @@ _SNAKE_TO_ALIAS: dict[str, str] = {
     for field_name, field_info in OppDefaultFilters.model_fields.items()
     if field_info.alias
 }
+_ALIAS_TO_SNAKE: dict[str, str] = {
+    alias: field_name for field_name, alias in _SNAKE_TO_ALIAS.items()
+}
 
 # ---------------------------------------------------------------------------
 # Registered-filter recovery + validate_routes (registration-time validator)
@@ -448,6 +456,101 @@ AD_HOC_VALUE_EXPECTATION: dict[str, str] = {
 }
 
 
+#: The value shapes each valid filter model can accept, including what lax
+#: coercion lets through (a numeric string is a number, an int a Unix-epoch
+#: date). A shape not listed here is one the model always rejects; values of any
+#: other type are shaped "other" and tried against every model for the operator.
+_ADHOC_VALUE_SHAPES: dict[type[CommonGrantsBaseModel], frozenset[str]] = {
+    StringComparisonFilter: frozenset({"string"}),
+    StringArrayFilter: frozenset({"array"}),
+    NumberComparisonFilter: frozenset({"number", "string"}),
+    NumberArrayFilter: frozenset({"array"}),
+    NumberRangeFilter: frozenset({"object"}),
+    BooleanComparisonFilter: frozenset({"bool"}),
+    DateComparisonFilter: frozenset({"number", "string"}),
+    DateRangeFilter: frozenset({"object"}),
+    MoneyComparisonFilter: frozenset({"object"}),
+    MoneyRangeFilter: frozenset({"object"}),
+}
+
+_VALUE_SHAPES = ("bool", "number", "string", "array", "object", "other")
+
+
+def _value_shape(value: Any) -> str:
+    """The JSON-ish shape of an ad-hoc filter value, for candidate dispatch."""
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, (int, float)):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return "array"
+    if isinstance(value, Mapping):
+        return "object"
+    return "other"
+
+
+def _model_operators(model: type[BaseModel]) -> set[str]:
+    """The wire operators a filter model's ``operator`` field accepts."""
+    annotation: Any = model.model_fields["operator"].annotation
+    enums: tuple[type[StrEnum], ...] = get_args(annotation) or (annotation,)
+    return {operator.value for enum in enums for operator in enum}
+
+
+def _adhoc_candidates() -> dict[tuple[str, str], tuple[type[BaseModel], ...]]:
+    """(operator, value shape) → the valid filter models that could accept it.
+
+    Each tuple keeps ``VALID_FILTER_MODELS`` order, so the first model that
+    validates is the one the full scan over every model would have picked.
+    """
+    operators = {model: _model_operators(model) for model in VALID_FILTER_MODELS}
+    return {
+        (operator, shape): tuple(
+            model
+            for model in VALID_FILTER_MODELS
+            if operator in operators[model]
+            and (shape == "other" or shape in _ADHOC_VALUE_SHAPES[model])
+        )
+        for operator in AD_HOC_VALUE_EXPECTATION
+        for shape in _VALUE_SHAPES
+    }
+
+
+#: Ad-hoc dispatch table: an ad-hoc filter is validated only against the models
+#: its operator and value shape can match (usually one), instead of every model.
+_ADHOC_CANDIDATES = _adhoc_candidates()
+
+
+def _filter_payload(value: Any) -> Any:
+    """The ``{operator, value}`` input to validate a consumer's filter value from.
+
+    Filter model instances are mutable, so they are re-validated rather than
+    trusted. An ``f.*``-built filter with a scalar or list value is read
+    field-by-field instead of through a full ``model_dump()``; one holding a
+    sub-model (a range, Money) is dumped so the sub-model is re-validated too.
+    """
+    if not isinstance(value, BaseModel):
+        return value
+    inner = getattr(value, "value", None)
+    if "operator" in type(value).model_fields and not isinstance(inner, BaseModel):
+        return {"operator": value.operator, "value": inner}  # type: ignore[attr-defined]
+    return value.model_dump()
+
+
+def _wire_filter(validated: BaseModel) -> DefaultFilter:
+    """``validated`` re-shaped to a ``DefaultFilter`` for the wire bucket.
+
+    Built without validation: ``validated`` was just checked against its typed
+    model, and ``DefaultFilter.value`` is ``Any``, so nothing it holds can fail.
+    """
+    inner = getattr(validated, "value")
+    return DefaultFilter.model_construct(
+        operator=getattr(validated, "operator"),
+        value=inner.model_dump() if isinstance(inner, BaseModel) else inner,
+    )
+
+
 def _adhoc_detail(payload: Any) -> str:
     """Explain why an ad-hoc {operator, value} matched no valid filter model."""
     operator = payload.get("operator") if isinstance(payload, dict) else None
@@ -470,7 +573,8 @@ def validate_filter_call(
     value model, recovered from the route's TypedDict), or against the
     ``VALID_FILTER_MODELS`` union when ``model_cls`` is ``None`` (ad-hoc /
     escape-hatch filter): the ``{operator, value}`` pair must be well-formed for
-    some valid filter model.
+    some valid filter model. Ad-hoc values are only tried against the models
+    their operator and value shape can match (``_ADHOC_CANDIDATES``).
 
     Never raises itself: returns ``(validated_filter, None)`` on success or
     ``(None, FilterError)`` on failure. The caller (``classify_filters``) raises
@@ -478,9 +582,8 @@ def validate_filter_call(
 
     On success the returned filter carries the coerced operator/value, never the
     raw input — lax coercion can differ from the input (e.g. ``"42"`` → ``42``).
-    Model instances are re-validated via ``model_dump()`` rather than trusted:
-    the filter models are mutable, so an instance valid at construction may not
-    be valid now.
+    Model instances are re-validated rather than trusted: the filter models are
+    mutable, so an instance valid at construction may not be valid now.
 
     Args:
         model_cls: The registered filter's value model, or ``None`` for ad-hoc.
@@ -491,7 +594,7 @@ def validate_filter_call(
         ``(DefaultFilter, None)`` when the value is valid, else ``(None, FilterError)``.
         The error wraps the pydantic ``ValidationError`` as ``cause``.
     """
-    payload = value.model_dump() if isinstance(value, BaseModel) else value
+    payload = _filter_payload(value)
     if model_cls is not None:
         try:
             validated = model_cls.model_validate(payload)
@@ -504,19 +607,22 @@ def validate_filter_call(
                 cause=exc,
             )
         # Re-shape to DefaultFilter so the wire bucket carries the coerced
-        # operator/value. DefaultFilter.value is Any per the core spec, so
-        # nothing the typed model accepted can fail here.
-        return DefaultFilter.model_validate(validated.model_dump()), None
+        # operator/value.
+        return _wire_filter(validated), None
     # Ad-hoc filter: there is no registered model for this key, so accept it only
     # if its operator and value together match one of the valid filter models. This
     # rejects a value that does not fit its operator, for example "in" with a plain
-    # string instead of a list, instead of letting it pass through unchecked.
-    for model in VALID_FILTER_MODELS:
-        try:
-            validated = model.model_validate(payload)
-        except ValidationError:
-            continue
-        return DefaultFilter.model_validate(validated.model_dump()), None
+    # string instead of a list, instead of letting it pass through unchecked. The
+    # dispatch table narrows the models to try from the operator and value shape.
+    operator = payload.get("operator") if isinstance(payload, Mapping) else None
+    if isinstance(operator, str):
+        shape = _value_shape(payload.get("value"))
+        for model in _ADHOC_CANDIDATES.get((operator, shape), ()):
+            try:
+                validated = model.model_validate(payload)
+            except ValidationError:
+                continue
+            return _wire_filter(validated), None
     return None, FilterError(
         f'Ad-hoc filter "{filter_name}" has an invalid operator/value combination: '
         f"{_adhoc_detail(payload)}",
@@ -530,6 +636,19 @@ def validate_filter_call(
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=None)
+def _default_field_adapter(alias_key: str) -> tuple[str, TypeAdapter[Any]]:
+    """The ``OppDefaultFilters`` field named by ``alias_key``, and its adapter.
+
+    The adapter validates a value exactly as the field does on the model, so a
+    standard filter is validated once — here — and placed on ``OppFilters``
+    without the model validating it again.
+    """
+    name = _ALIAS_TO_SNAKE.get(alias_key, alias_key)
+    annotation: Any = OppDefaultFilters.model_fields[name].annotation
+    return name, TypeAdapter(annotation)
+
+
 def _validate_default_field(
     alias_key: str,
     value: Any,
@@ -539,17 +658,16 @@ def _validate_default_field(
     Bucket-1 (default) values are validated against the named field's real type
     on ``OppDefaultFilters`` (e.g. ``status`` → ``StringArrayFilter``) — stricter
     than the permissive ``DefaultFilter`` shape. Each field is validated in
-    isolation by constructing a single-field ``OppDefaultFilters`` keyed by its
-    alias, so a malformed default can be dropped on its own without discarding
-    the other valid default fields.
+    isolation through its cached per-field ``TypeAdapter``, so a malformed
+    default can be reported on its own without touching the other fields.
 
-    Fail-soft: each field is validated on its own, collecting the error and
-    skipping the key on failure. Returns ``(value, None)`` when valid (the
-    original value is kept — construction is a validation gate, not a reshape)
+    Fail-soft: returns ``(validated, None)`` when valid — the value as the
+    ``OppDefaultFilters`` field would hold it, ready for ``model_construct`` —
     or ``(None, FilterError)`` when invalid.
     """
+    _, adapter = _default_field_adapter(alias_key)
     try:
-        OppDefaultFilters.model_validate({alias_key: value})
+        validated = adapter.validate_python(value)
     except ValidationError as exc:
         return None, FilterError(
             f'Default filter "{alias_key}" failed validation: '
@@ -558,7 +676,7 @@ def _validate_default_field(
             source_value=value,
             cause=exc,
         )
-    return value, None
+    return validated, None
 
 
 # ---------------------------------------------------------------------------
@@ -566,6 +684,101 @@ def _validate_default_field(
 # ---------------------------------------------------------------------------
 
 
+# How a key is validated: the alias of the standard field it names, or the
+# registered model its value validates against (neither for an ad-hoc key).
+_KeySlot = tuple[Optional[str], Optional[type[BaseModel]]]
+_AD_HOC: _KeySlot = (None, None)
+
+
+class FilterClassifier:
+    """One route's filter classification, compiled: each known key → its validator.
+
+    Built by ``compile_classifier``. The standard filter names (snake_case and
+    alias forms) map to the alias of their ``OppFilters`` field, and the route's
+    registered custom filters to their value models, so ``classify`` resolves each
+    consumer key with a single dict lookup instead of re-reading type hints.
+    """
+
+    def __init__(self, registered: Mapping[str, type[BaseModel]]):
+        self.registered: dict[str, type[BaseModel]] = dict(registered)
+        self._slots: dict[str, _KeySlot] = {
+            name: (None, model) for name, model in self.registered.items()
+        }
+        # Standard names take precedence over a registered key of the same name.
+        for name in DEFAULT_FILTER_NAMES:
+            self._slots[name] = (_SNAKE_TO_ALIAS.get(name, name), None)
+
+    def classify(
+        self, consumer_filters: Mapping[str, Union[BaseModel, dict[str, Any]]]
+    ) -> OppFilters:
+        """Classify ``consumer_filters``; see :func:`classify_filters`.
+
+        Raises:
+            FilterError: On the first invalid filter value.
+        """
+        default_fields: dict[str, Any] = {}
+        custom_buckets: dict[str, DefaultFilter] = {}
+
+        for key, value in consumer_filters.items():
+            alias_key, model = self._slots.get(key, _AD_HOC)
+            if alias_key is not None:
+                # Bucket 1: a standard filter. Validate it against the type declared
+                # for that field (for example, "status" is validated as a
+                # StringArrayFilter). OppFilters is constructed with keyword
+                # arguments and does not set populate_by_name, so the slot holds the
+                # alias a snake_case key converts to. Keys that are already in alias
+                # form, and keys that have no alias, map to themselves.
+                if alias_key in default_fields:
+                    # Snake and camel forms of the same field normalize to one key.
+                    raise FilterError(
+                        f'Default filter "{alias_key}" was supplied more than once '
+                        "(snake_case and camelCase forms of the same filter)",
+                        path=f"filters.{alias_key}",
+                        source_value=value,
+                    )
+                validated, error = _validate_default_field(alias_key, value)
+                if error is not None:
+                    raise error
+                default_fields[alias_key] = validated
+            else:
+                # Bucket 2 (model set): a filter the plugin registered for this
+                # route, validated against the model the plugin declared for it.
+                # Bucket 3 (no model): a filter the plugin did not register,
+                # validated against the valid filter models so that a value that
+                # does not fit its operator is rejected instead of quietly passing
+                # through to the request.
+                validated, error = validate_filter_call(model, key, value)
+                if error is not None:
+                    raise error
+                custom_buckets[key] = validated  # type: ignore[assignment]
+
+        # Every value was validated above, so assemble OppFilters without
+        # validating it again. model_construct takes field names, not aliases.
+        return OppFilters.model_construct(
+            **{
+                _default_field_adapter(alias_key)[0]: validated
+                for alias_key, validated in default_fields.items()
+            },
+            custom_filters=custom_buckets if custom_buckets else None,
+        )
+
+
+@lru_cache(maxsize=128)
+def compile_classifier(
+    routes: PluginRoutes[Any], resource: str, method: str
+) -> FilterClassifier:
+    """The ``FilterClassifier`` for one route, built once per (routes, resource, method).
+
+    ``PluginRoutes`` and its resource routes are frozen dataclasses, so equal
+    registrations share one compiled classifier. ``plugin.get_client`` compiles
+    the opportunities search route when it binds routes, so the type-hint
+    reflection happens then rather than on the first search.
+    """
+    route = getattr(routes, resource, None)
+    route_td = getattr(route, method, None) if route is not None else None
+    return FilterClassifier(_registered_filter_models(route_td))
+
+
 # The Opportunity binding (OppDefaultFilters / OppFilters) is a known limitation;
 # deriving both from the declared resource is tracked in
 # https://github.com/HHS/simpler-grants-protocol/issues/896.
@@ -598,6 +811,9 @@ def classify_filters(
     then validated against the known-model union, exactly like ad-hoc input. Call
     sites must pass the same resource/method strings the plugin declared.
 
+    Classification runs through the route's memoized ``compile_classifier``, so the
+    route's registered filters are recovered once, not on every call.
+
     Construction normalizes all default consumer keys to the form that
     ``OppFilters(**kwargs)`` accepts.  Because ``OppDefaultFilters`` does NOT set
     ``populate_by_name=True``, Pydantic v2 requires the alias form (e.g.
@@ -625,54 +841,4 @@ def classify_filters(
     Raises:
         FilterError: On the first invalid filter value (standard, registered, or ad-hoc).
     """
-    route = getattr(routes, resource, None)
-    route_td = getattr(route, method, None) if route is not None else None
-    registered = _registered_filter_models(route_td)
-
-    default_fields: dict[str, Any] = {}
-    custom_buckets: dict[str, DefaultFilter] = {}
-
-    for key, value in consumer_filters.items():
-        if key in DEFAULT_FILTER_NAMES:
-            # Bucket 1: a standard filter. Validate it against the type declared for
-            # that field (for example, "status" is validated as a StringArrayFilter).
-            # OppFilters is constructed with keyword arguments and does not set
-            # populate_by_name, so a snake_case key is first converted to its alias.
-            # Keys that are already in alias form, and keys that have no alias, pass
-            # through unchanged.
-            alias_key = _SNAKE_TO_ALIAS.get(key, key)
-            if alias_key in default_fields:
-                # Snake and camel forms of the same field normalize to one key.
-                raise FilterError(
-                    f'Default filter "{alias_key}" was supplied more than once '
-                    "(snake_case and camelCase forms of the same filter)",
-                    path=f"filters.{alias_key}",
-                    source_value=value,
-                )
-            validated, error = _validate_default_field(alias_key, value)
-            if error is not None:
-                raise error
-            default_fields[alias_key] = validated
-        elif key in registered:
-            # Bucket 2: a filter the plugin registered for this route. Validate it
-            # against the model the plugin declared for this key, and keep the
-            # validated value.
-            validated, error = validate_filter_call(registered[key], key, value)
-            if error is not None:
-                raise error
-            custom_buckets[key] = validated  # type: ignore[assignment]
-        else:
-            # Bucket 3: a filter the plugin did not register. Validate it against the
-            # valid filter models so that a value that does not fit its operator is
-            # rejected instead of quietly passing through to the request.
-            validated, error = validate_filter_call(None, key, value)
-            if error is not None:
-                raise error
-            custom_buckets[key] = validated  # type: ignore[assignment]
-
-    # OppFilters requires the alias form for construction (populate_by_name is not set).
-    # Use "customFilters" (the alias) rather than "custom_filters" (the field name).
-    return OppFilters(
-        **default_fields,
-        customFilters=custom_buckets if custom_buckets else None,
-    )
+    return compile_classifier(routes, resource, method).classify(consumer_filters)
@@ -9,6 +9,7 @@ consumers get fully-typed, non-optional dot access: ``plugin.schemas.Opportunity
 ``plugin.get_client(...)`` returns a client already scoped with the plugin's routes and
 schemas: ``client.opportunities.search(filters=...)`` is typed by the registered filter
 TypedDict, and responses parse with the plugin's Opportunity schema by default.
+``plugin.get_async_client(...)`` returns the same scoping on an ``AsyncClient``.
 """
 
 from __future__ import annotations
@@ -30,7 +31,7 @@ from .types import FiltersT, PluginMeta, PluginRoutes, ResourceRoutes
 
 if TYPE_CHECKING:
     from ..client.auth import Auth
-    from ..client.client import Client
+    from ..client.client import AsyncClient, Client
     from ..client.config import Config
 
 SchemasT = te.TypeVar("SchemasT")
@@ -126,6 +127,37 @@ class Plugin(Generic[SchemasT, FiltersT]):
         client._bind_routes(cast("Any", self.routes))
         return client
 
+    @overload
+    def get_async_client(
+        self: "Plugin[PluginSchemas[SchemaOnly[ItemT]], FiltersT]",
+        config: Optional[Config] = ...,
+        auth: Optional[Auth] = ...,
+    ) -> "AsyncClient[FiltersT, ItemT]": ...
+
+    @overload
+    def get_async_client(
+        self: "Plugin[PluginSchemas[SchemaWithTransforms[Any, ItemT]], FiltersT]",
+        config: Optional[Config] = ...,
+        auth: Optional[Auth] = ...,
+    ) -> "AsyncClient[FiltersT, ItemT]": ...
+
+    def get_async_client(
+        self,
+        config: "Optional[Config]" = None,
+        auth: "Optional[Auth]" = None,
+    ) -> "AsyncClient[Any, Any]":
+        """Return an ``AsyncClient`` pre-scoped with this plugin's routes and schemas.
+
+        The async counterpart of :meth:`get_client`: same binding, with
+        ``opportunities`` methods as coroutines.
+        """
+        from ..client.client import AsyncClient
+
+        client = AsyncClient(config=config, auth=auth)
+        client._bind_schemas(cast("Any", self.schemas))
+        client._bind_routes(cast("Any", self.routes))
+        return client
+
 
 def define_plugin(
     schemas: SchemasT,
@@ -0,0 +1,85 @@
+"""Shared fixtures and response builders for the client tests."""
+
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from common_grants_sdk.client import Client
+from common_grants_sdk.client.config import Config
+
+
+def opportunity_row(**fields) -> dict:
+    """A minimal valid opportunity on the wire, with ``fields`` overridden."""
+    now = datetime.now(UTC).isoformat()
+    return {
+        "id": str(uuid4()),
+        "title": "Test Opportunity",
+        "description": "Test description",
+        "status": {"value": "open"},
+        "createdAt": now,
+        "lastModifiedAt": now,
+        **fields,
+    }
+
+
+def page_body(
+    items: list,
+    page: int = 1,
+    total_pages: int = 1,
+    page_size: int | None = None,
+    total_items: int | None = None,
+) -> dict:
+    """A paginated list or search response body carrying ``items``."""
+    page_size = page_size if page_size is not None else max(len(items), 1)
+    return {
+        "status": 200,
+        "message": "Success",
+        "items": items,
+        "paginationInfo": {
+            "page": page,
+            "pageSize": page_size,
+            "totalItems": (
+                total_items
+                if total_items is not None
+                else len(items) if total_pages == 1 else page_size * total_pages
+            ),
+            "totalPages": total_pages,
+        },
+        "sortInfo": {"sortBy": "lastModifiedAt", "sortOrder": "desc"},
+        "filterInfo": {"filters": {}, "errors": []},
+    }
+
+
+@pytest.fixture
+def make_client():
+    """Build clients whose requests are answered by a handler function.
+
+    ``make_client(handler, client_cls=Client, auth=None, **config)`` returns a
+    ``Client`` (or ``AsyncClient``) sending through
+    ``httpx.MockTransport(handler)`` via ``Config.transport``; ``config`` holds
+    any further ``Config`` arguments.
+    Sync clients are closed at teardown; close async ones in the test.
+    """
+    clients = []
+
+    def make(handler, client_cls=Client, auth=None, **config):
+        transport = httpx.MockTransport(handler)
+        client = client_cls(
+            config=Config(
+                base_url="https://api.example.com",
+                api_key="test-key",
+                transport=transport,
+                async_transport=transport,
+                **config,
+            ),
+            auth=auth,
+        )
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        if isinstance(client.http, httpx.Client):
+            client.close()
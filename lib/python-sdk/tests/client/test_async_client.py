@@ -0,0 +1,317 @@
+"""Tests for the AsyncClient class and its async opportunities resource."""
+
+import asyncio
+import json
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from common_grants_sdk.client import (
+    AsyncClient,
+    ListResult,
+    ParseFailure,
+    SearchResult,
+)
+from common_grants_sdk.client.config import Config
+from common_grants_sdk.client.exceptions import APIError
+from common_grants_sdk.extensions import (
+    FilterError,
+    PluginMeta,
+    PluginRoutes,
+    PluginSchemas,
+    ResourceRoutes,
+    define_plugin,
+    f,
+    schema,
+)
+from common_grants_sdk.schemas.pydantic.filters.opportunity import (
+    OpportunityFilters,
+    StringArray,
+)
+from common_grants_sdk.schemas.pydantic.models import OpportunityBase
+
+
+class OppSearchFilters(OpportunityFilters, total=False):
+    """Route filter TypedDict registering ``agency`` as a stringArray custom filter."""
+
+    agency: StringArray
+
+
+AGENCY_PLUGIN = define_plugin(
+    PluginSchemas(Opportunity=schema(common_schema=OpportunityBase)),
+    routes=PluginRoutes(opportunities=ResourceRoutes(search=OppSearchFilters)),
+    meta=PluginMeta(name="test", source_system="test"),
+)
+
+
+def _opportunity() -> dict:
+    now = datetime.now(UTC).isoformat()
+    return {
+        "id": str(uuid4()),
+        "title": "Test Opportunity",
+        "description": "Test description",
+        "status": {"value": "open"},
+        "createdAt": now,
+        "lastModifiedAt": now,
+    }
+
+
+def _page(items: list[dict], page: int, total_pages: int) -> dict:
+    return {
+        "status": 200,
+        "message": "Success",
+        "items": items,
+        "paginationInfo": {
+            "page": page,
+            "pageSize": len(items),
+            "totalItems": len(items) * total_pages,
+            "totalPages": total_pages,
+        },
+        "sortInfo": {"sortBy": "lastModifiedAt", "sortOrder": "desc"},
+        "filterInfo": {"filters": {}, "errors": []},
+    }
+
+
+def _client(handler, plugin=None) -> AsyncClient:
+    """An AsyncClient whose transport is served by ``handler``."""
+    config = Config(base_url="https://api.example.com", api_key="test-key")
+    client = plugin.get_async_client(config) if plugin else AsyncClient(config=config)
+    client.http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+class TestAsyncOpportunities:
+    """Tests for AsyncOpportunities get/list/search."""
+
+    def test_get_parses_into_schema(self):
+        opp = _opportunity()
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"status": 200, "data": opp})
+
+        async def run():
+            async with _client(handler) as client:
+                return await client.opportunities.get(opp["id"])
+
+        result = asyncio.run(run())
+        assert isinstance(result, OpportunityBase)
+        assert str(result.id) == opp["id"]
+        assert requests[0].url.path == f"/common-grants/opportunities/{opp['id']}"
+        assert requests[0].headers["X-API-Key"] == "test-key"
+
+    def test_list_aggregates_all_pages(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            page = int(request.url.params["page"])
+            return httpx.Response(200, json=_page([_opportunity()] * 2, page, 3))
+
+        async def run():
+            async with _client(handler) as client:
+                return await client.opportunities.list()
+
+        result = asyncio.run(run())
+        assert isinstance(result, ListResult)
+        assert len(result.items) == 6
+        assert result.pagination_info.total_pages == 1
+
+    def test_list_prefetches_pages_concurrently_in_order(self):
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            page = int(request.url.params["page"])
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            items = [dict(_opportunity(), title=f"page {page}")]
+            return httpx.Response(200, json=_page(items, page, 6))
+
+        async def run():
+            async with _client(handler) as client:
+                return await client.opportunities.list()
+
+        result = asyncio.run(run())
+        assert [opp.title for opp in result.items] == [f"page {n}" for n in range(1, 7)]
+        # Pages 2-6 are fetched together, bounded by the default max_concurrency.
+        assert peak == Config.DEFAULT_MAX_CONCURRENCY
+
+    def test_iter_search_streams_rows_across_pages(self):
+        pages_requested: list[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            page = int(request.url.params["page"])
+            pages_requested.append(page)
+            if page == 2:
+                rows = [_opportunity(), {"id": "not-a-uuid"}]
+            else:
+                rows = [_opportunity(), _opportunity()]
+            return httpx.Response(200, json=_page(rows, page, 2))
+
+        async def run():
+            async with _client(handler) as client:
+                return [row async for row in client.opportunities.iter_search()]
+
+        rows = asyncio.run(run())
+        assert pages_requested == [1, 2]
+        assert len(rows) == 4
+        assert isinstance(rows[3], ParseFailure)
+        assert rows[3].index == 3
+
+    def test_get_many_fetches_concurrently_and_collects_errors(self):
+        in_flight = 0
+        peak = 0
+        missing = str(uuid4())
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            opp_id = request.url.path.rsplit("/", 1)[-1]
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if opp_id == missing:
+                return httpx.Response(
+                    404, json={"status": 404, "message": "Not found", "errors": []}
+                )
+            return httpx.Response(
+                200, json={"status": 200, "data": dict(_opportunity(), id=opp_id)}
+            )
+
+        ids = [str(uuid4()) for _ in range(5)] + [missing]
+
+        async def run():
+            async with _client(handler) as client:
+                return await client.opportunities.get_many(ids, concurrency=3)
+
+        result = asyncio.run(run())
+        assert set(result.items) == set(ids[:5])
+        assert result.api_errors[missing].error.status == 404
+        assert peak == 3
+
+    def test_sync_since_stops_requesting_past_watermark(self):
+        pages_requested: list[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            page = int(request.url.params["page"])
+            pages_requested.append(page)
+            rows = [
+                dict(_opportunity(), lastModifiedAt=f"2025-01-{day:02d}T00:00:00Z")
+                for day in {1: (9, 8), 2: (6, 2), 3: (1, 1)}[page]
+            ]
+            return httpx.Response(200, json=_page(rows, page, 3))
+
+        async def run():
+            async with _client(handler) as client:
+                return await client.opportunities.sync_since(
+                    datetime(2025, 1, 5, tzinfo=UTC)
+                )
+
+        result = asyncio.run(run())
+        assert len(result.items) == 3
+        assert result.watermark == datetime(2025, 1, 9, tzinfo=UTC)
+        assert pages_requested == [1, 2]
+
+    def test_search_classifies_registered_filters(self):
+        bodies: list[dict] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            bodies.append(json.loads(request.content))
+            return httpx.Response(200, json=_page([_opportunity()], 1, 1))
+
+        async def run():
+            async with _client(handler, plugin=AGENCY_PLUGIN) as client:
+                return await client.opportunities.search(
+                    search="health",
+                    filters={"status": f.in_(["open"]), "agency": f.in_(["HHS"])},
+                    page=1,
+                )
+
+        result = asyncio.run(run())
+        assert isinstance(result, SearchResult)
+        assert len(result.items) == 1
+        assert result.sort_info is not None
+        assert bodies[0]["filters"]["status"] == {"operator": "in", "value": ["open"]}
+        assert bodies[0]["filters"]["customFilters"]["agency"]["value"] == ["HHS"]
+
+    def test_search_invalid_filter_raises_before_request(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise AssertionError("no request should be sent")
+
+        async def run():
+            async with _client(handler) as client:
+                await client.opportunities.search(
+                    filters={"status": {"operator": "in", "value": "open"}}
+                )
+
+        with pytest.raises(FilterError):
+            asyncio.run(run())
+
+    def test_http_error_raises_api_error(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                404, json={"status": 404, "message": "Not found", "errors": []}
+            )
+
+        async def run():
+            async with _client(handler) as client:
+                await client.opportunities.get(uuid4())
+
+        with pytest.raises(APIError) as exc_info:
+            asyncio.run(run())
+        assert exc_info.value.error.status == 404
+
+    def test_concurrent_searches_share_one_client(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=_page([_opportunity()], 1, 1))
+
+        async def run():
+            async with _client(handler) as client:
+                return await asyncio.gather(
+                    *(client.opportunities.search(search=str(i)) for i in range(20))
+                )
+
+        results = asyncio.run(run())
+        assert len(results) == 20
+        assert all(len(r.items) == 1 for r in results)
+
+
+def test_get_async_client_binds_plugin_scope():
+    """get_async_client scopes routes and schemas exactly like get_client."""
+    client = AGENCY_PLUGIN.get_async_client(
+        Config(base_url="https://api.example.com", api_key="test-key")
+    )
+    assert client._routes.opportunities.search is OppSearchFilters
+    assert client._opportunity_schema is OpportunityBase
+
+
+def test_async_clients_share_injected_transport():
+    """An injected async transport serves every client and outlives them."""
+    closed = []
+
+    class RecordingTransport(httpx.MockTransport):
+        async def aclose(self):
+            closed.append(True)
+
+    shared = RecordingTransport(
+        lambda request: httpx.Response(
+            200, json={"status": 200, "data": _opportunity()}
+        )
+    )
+    config = Config(
+        base_url="https://api.example.com", api_key="test-key", async_transport=shared
+    )
+
+    async def run():
+        async with AsyncClient(config=config) as first:
+            async with AsyncClient(config=config) as second:
+                return await asyncio.gather(
+                    first.opportunities.get(uuid4()), second.opportunities.get(uuid4())
+                )
+
+    assert len(asyncio.run(run())) == 2
+    assert closed == []
@@ -1,6 +1,15 @@
 """Tests for the Auth class."""
 
-from common_grants_sdk.client import Auth
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+
+from common_grants_sdk.client import Auth, BearerToken, Client
+from common_grants_sdk.client.config import Config
 
 
 class TestAuth:
@@ -40,3 +49,138 @@ class TestAuth:
             "Custom-Header": "custom-value",
             "Accept": "application/json",
         }
+
+    def test_headers_are_cached_and_read_only(self):
+        """Test that headers() returns the same immutable mapping each call."""
+        auth = Auth.api_key("test-key")
+        assert auth.headers() is auth.headers()
+        with pytest.raises(TypeError):
+            auth.headers()["X-API-Key"] = "other"  # type: ignore[index]
+
+
+class TestRefreshingAuth:
+    """Tests for bearer auth refreshed from a token provider."""
+
+    def test_token_fetched_once_until_due(self):
+        """Test that a valid token is reused without calling the provider."""
+        provider = Mock(return_value=BearerToken("t1", expires_at=time.time() + 3600))
+        auth = Auth.refreshing(provider)
+
+        assert auth.headers()["Authorization"] == "Bearer t1"
+        assert auth.get_headers()["Accept"] == "application/json"
+        assert provider.call_count == 1
+
+    def test_scope_survives_refresh(self):
+        """Test that the scope keys the principal, not the current token."""
+        tokens = iter(BearerToken(f"t{n}", expires_at=0) for n in range(3))
+        auth = Auth.refreshing(lambda: next(tokens), refresh_ahead=0)
+
+        scope = auth.scope
+        auth.headers()
+        auth.headers()
+
+        assert auth.scope == scope
+        assert Auth.refreshing(Mock()).scope != scope
+        assert (
+            Auth.refreshing(Mock(), scope="svc").scope
+            == Auth.refreshing(Mock(), scope="svc").scope
+        )
+        assert Auth.api_key("a").scope != Auth.api_key("b").scope
+
+    def test_refreshes_ahead_of_expiry(self):
+        """Test that a token inside the refresh window is replaced."""
+        tokens = iter(
+            [
+                BearerToken("t1", expires_at=time.time() + 30),
+                BearerToken("t2", expires_at=time.time() + 3600),
+            ]
+        )
+        auth = Auth.refreshing(lambda: next(tokens), refresh_ahead=60)
+
+        assert auth.headers()["Authorization"] == "Bearer t1"
+        assert auth.headers()["Authorization"] == "Bearer t2"
+
+    def test_failed_early_refresh_keeps_valid_token(self):
+        """Test that an early refresh failure does not fail the request."""
+        calls = []
+
+        def provider() -> BearerToken:
+            calls.append(1)
+            if len(calls) > 1:
+                raise RuntimeError("identity provider down")
+            return BearerToken("t1", expires_at=time.time() + 30)
+
+        auth = Auth.refreshing(provider, refresh_ahead=60)
+        auth.headers()
+
+        assert auth.headers()["Authorization"] == "Bearer t1"
+        assert len(calls) == 2
+
+    def test_expired_token_refreshed_once_under_concurrency(self):
+        """Test that a burst of requests triggers a single refresh."""
+        calls = []
+        lock = threading.Lock()
+
+        def provider() -> BearerToken:
+            with lock:
+                calls.append(1)
+                count = len(calls)
+            time.sleep(0.02)
+            if count == 1:
+                return BearerToken("t1", expires_at=time.time() - 1)
+            return BearerToken(f"t{count}", expires_at=time.time() + 3600)
+
+        auth = Auth.refreshing(provider)
+        auth.headers()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            values = list(
+                pool.map(lambda _: auth.headers()["Authorization"], range(16))
+            )
+
+        assert len(calls) == 2
+        assert set(values) == {"Bearer t2"}
+
+    def test_client_sends_refreshed_token_mid_pagination(self):
+        """Test that later pages use a token refreshed after earlier ones."""
+        clock = [1000.0]
+        tokens = iter(
+            [
+                BearerToken("t1", expires_at=1100.0),
+                BearerToken("t2", expires_at=5000.0),
+            ]
+        )
+        seen: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers["Authorization"])
+            clock[0] += 100
+            page = int(request.url.params["page"])
+            return httpx.Response(
+                200,
+                json={
+                    "status": 200,
+                    "message": "Success",
+                    "items": [{"page": page}],
+                    "paginationInfo": {
+                        "page": page,
+                        "pageSize": 1,
+                        "totalItems": 2,
+                        "totalPages": 2,
+                    },
+                },
+            )
+
+        client = Client(
+            config=Config(
+                base_url="https://api.example.com",
+                api_key="unused",
+                max_concurrency=1,
+            ),
+            auth=Auth.refreshing(lambda: next(tokens), refresh_ahead=0),
+        )
+        client.http = httpx.Client(transport=httpx.MockTransport(handler))
+
+        with patch("common_grants_sdk.client.auth.time.time", lambda: clock[0]):
+            client.list("/items")
+
+        assert seen == ["Bearer t1", "Bearer t2"]
@@ -0,0 +1,286 @@
+"""Tests for the client-side response cache."""
+
+import asyncio
+import gzip
+import itertools
+import json
+
+import httpx
+import pytest
+
+from common_grants_sdk.client import AsyncClient, Auth, BearerToken
+from common_grants_sdk.client.cache import (
+    CachedResponse,
+    FileCache,
+    MemoryCache,
+    ResponseCache,
+)
+
+from .conftest import opportunity_row, page_body
+
+
+def _entry(key: str = "k") -> CachedResponse:
+    return CachedResponse(
+        method="GET",
+        url=f"https://api.example.com/{key}",
+        status_code=200,
+        headers={"etag": '"v1"'},
+        content=b'{"ok": true}',
+    )
+
+
+class TestBackends:
+    """Tests for the MemoryCache and FileCache backends."""
+
+    def test_memory_cache_evicts_least_recently_used(self):
+        cache = MemoryCache(max_entries=2)
+        cache.set("a", _entry("a"))
+        cache.set("b", _entry("b"))
+        cache.get("a")
+        cache.set("c", _entry("c"))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert len(cache) == 2
+
+    def test_file_cache_round_trips_entries(self, tmp_path):
+        FileCache(tmp_path).set("k", _entry())
+
+        entry = FileCache(tmp_path).get("k")
+
+        assert entry is not None
+        assert entry.content == b'{"ok": true}'
+        assert entry.validators() == {"If-None-Match": '"v1"'}
+
+    def test_file_cache_miss_and_clear(self, tmp_path):
+        cache = FileCache(tmp_path)
+        assert cache.get("missing") is None
+
+        cache.set("k", _entry())
+        cache.clear()
+        assert cache.get("k") is None
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "not json",
+            '{"content": "!!not base64!!"}',
+            '{"url": "https://api.example.com/k", "content": ""}',
+            "[]",
+        ],
+    )
+    def test_file_cache_corrupt_entry_is_a_miss(self, tmp_path, text):
+        (tmp_path / "k.json").write_text(text)
+        assert FileCache(tmp_path).get("k") is None
+
+    def test_file_cache_reuses_loaded_entry_until_rewritten(self, tmp_path):
+        cache = FileCache(tmp_path)
+        cache.set("k", _entry())
+        entry = cache.get("k")
+
+        assert cache.get("k") is entry
+        FileCache(tmp_path).set("k", _entry())
+        assert cache.get("k") is not entry
+
+
+class TestClientCache:
+    """Tests for cached requests through the client."""
+
+    def test_fresh_entry_skips_request_and_reuses_parsed_model(self, make_client):
+        opp = opportunity_row()
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"status": 200, "data": opp})
+
+        client = make_client(handler, cache=ResponseCache(ttl=60))
+        first = client.opportunities.get(opp["id"])
+        second = client.opportunities.get(opp["id"])
+
+        assert len(requests) == 1
+        assert second is first
+
+    def test_stale_entry_revalidates_with_etag(self, make_client):
+        opp = opportunity_row()
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200,
+                headers={
+                    "ETag": '"v1"',
+                    "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT",
+                },
+                json={"status": 200, "data": opp},
+            )
+
+        client = make_client(handler, cache=ResponseCache(ttl=0))
+        first = client.opportunities.get(opp["id"])
+        second = client.opportunities.get(opp["id"])
+
+        assert len(requests) == 2
+        assert requests[1].headers["If-Modified-Since"] == (
+            "Wed, 01 Jan 2025 00:00:00 GMT"
+        )
+        assert second is first
+
+    @pytest.mark.parametrize("ttl", [60, 0], ids=["fresh", "revalidated"])
+    def test_file_cache_hit_reuses_parsed_model(self, make_client, tmp_path, ttl):
+        opp = opportunity_row()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200, headers={"ETag": '"v1"'}, json={"status": 200, "data": opp}
+            )
+
+        cache = ResponseCache(backend=FileCache(tmp_path), ttl=ttl)
+        client = make_client(handler, cache=cache)
+        first = client.opportunities.get(opp["id"])
+
+        assert client.opportunities.get(opp["id"]) is first
+
+    @pytest.mark.parametrize("backend", ["memory", "file"])
+    @pytest.mark.parametrize("ttl", [60, 0], ids=["fresh", "revalidated"])
+    def test_compressed_responses_are_served_decoded(
+        self, make_client, tmp_path, backend, ttl
+    ):
+        opp = opportunity_row()
+        body = gzip.compress(json.dumps({"status": 200, "data": opp}).encode())
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200,
+                headers={"Content-Encoding": "gzip", "ETag": '"v1"'},
+                content=body,
+            )
+
+        cache = ResponseCache(
+            backend=MemoryCache() if backend == "memory" else FileCache(tmp_path),
+            ttl=ttl,
+        )
+        client = make_client(handler, cache=cache)
+        client.opportunities.get(opp["id"])
+        cached = client.opportunities.get(opp["id"])
+
+        assert str(cached.id) == opp["id"]
+
+    def test_entries_with_wire_headers_rebuild_decoded(self):
+        entry = _entry()
+        entry.headers = {"Content-Encoding": "gzip", "Content-Length": "3"}
+
+        response = entry.to_response()
+
+        assert response.json() == {"ok": True}
+        assert "content-encoding" not in response.headers
+
+    def test_token_refresh_keeps_cached_entries(self, make_client):
+        opp = opportunity_row()
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"status": 200, "data": opp})
+
+        # Every token has expired, so each request is sent with a fresh one.
+        tokens = (BearerToken(f"t{n}", expires_at=0) for n in itertools.count())
+        auth = Auth.refreshing(lambda: next(tokens), refresh_ahead=0)
+        client = make_client(handler, auth=auth, cache=ResponseCache())
+        client.opportunities.get(opp["id"])
+        client.opportunities.get(opp["id"])
+
+        assert len(requests) == 1
+
+    def test_credentials_do_not_share_entries(self, make_client):
+        opp = opportunity_row()
+        keys: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            keys.append(request.headers["X-API-Key"])
+            return httpx.Response(200, json={"status": 200, "data": opp})
+
+        cache = ResponseCache()
+        for key in ("a", "b", "a"):
+            make_client(handler, auth=Auth.api_key(key), cache=cache).get_item(
+                "/opportunities", opp["id"]
+            )
+
+        assert keys == ["a", "b"]
+
+    def test_search_is_keyed_on_body(self, make_client):
+        bodies: list[bytes] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            bodies.append(request.content)
+            return httpx.Response(
+                200,
+                json=page_body([opportunity_row()]),
+            )
+
+        client = make_client(handler, cache=ResponseCache())
+        first = client.opportunities.search(search="health", page=1)
+        again = client.opportunities.search(search="health", page=1)
+        client.opportunities.search(search="education", page=1)
+
+        assert len(bodies) == 2
+        assert again.items[0] is first.items[0]
+
+    def test_no_store_responses_are_not_cached(self, make_client):
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(
+                200, headers={"Cache-Control": "no-store"}, json={"ok": True}
+            )
+
+        client = make_client(handler, cache=ResponseCache())
+        client.get("/things")
+        client.get("/things")
+
+        assert len(requests) == 2
+
+    def test_plain_post_bypasses_cache(self, make_client):
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"ok": True})
+
+        client = make_client(handler, cache=ResponseCache())
+        client.post("/things", json={})
+        client.post("/things", json={})
+
+        assert len(requests) == 2
+
+    def test_async_client_serves_from_cache(self, make_client):
+        opp = opportunity_row()
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"status": 200, "data": opp})
+
+        async def run():
+            async with make_client(
+                handler, AsyncClient, cache=ResponseCache()
+            ) as client:
+                first = await client.opportunities.get(opp["id"])
+                second = await client.opportunities.get(opp["id"])
+                return first, second
+
+        first, second = asyncio.run(run())
+        assert len(requests) == 1
+        assert second is first
+
+
+def test_memory_cache_rejects_empty_capacity():
+    with pytest.raises(ValueError, match="max_entries must be at least 1"):
+        MemoryCache(max_entries=0)
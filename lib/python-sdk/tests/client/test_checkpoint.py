@@ -0,0 +1,226 @@
+"""Tests for resumable page streams (PageCheckpoint)."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from common_grants_sdk.client import (
+    AsyncClient,
+    Client,
+    PageCheckpoint,
+    ParseFailure,
+)
+from common_grants_sdk.client.config import Config
+
+IDS = [f"00000000-0000-0000-0000-{n:012d}" for n in range(1, 8)]
+
+
+def _row(opp_id: str) -> dict:
+    return {
+        "id": opp_id,
+        "title": f"Opportunity {opp_id[-1]}",
+        "description": "Test description",
+        "status": {"value": "open"},
+        "createdAt": "2025-01-01T00:00:00Z",
+        "lastModifiedAt": f"2025-01-0{opp_id[-1]}T00:00:00Z",
+    }
+
+
+class Catalog:
+    """A live catalog served two rows per page; ``ids`` can change mid-stream."""
+
+    def __init__(self, ids: list[str]):
+        self.ids = list(ids)
+        self.pages_requested: list[int] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        size = int(request.url.params["pageSize"])
+        self.pages_requested.append(page)
+        rows = [_row(opp_id) for opp_id in self.ids[(page - 1) * size : page * size]]
+        return httpx.Response(
+            200,
+            json={
+                "status": 200,
+                "message": "Success",
+                "items": rows,
+                "paginationInfo": {
+                    "page": page,
+                    "pageSize": size,
+                    "totalItems": len(self.ids),
+                    "totalPages": -(-len(self.ids) // size),
+                },
+                "sortInfo": {"sortBy": "lastModifiedAt", "sortOrder": "desc"},
+                "filterInfo": {"filters": {}, "errors": []},
+            },
+        )
+
+    def client(self, client_cls=Client):
+        transport = httpx.MockTransport(self.handler)
+        config = Config(
+            base_url="https://api.example.com",
+            api_key="test-key",
+            page_size=2,
+            transport=transport,
+            async_transport=transport,
+        )
+        return client_cls(config=config)
+
+
+def _ids(rows) -> list[str]:
+    return [str(row.id) for row in rows]
+
+
+def _interrupted_after(stream, pages: int, checkpoints: list) -> None:
+    """Consume ``stream`` until ``pages`` checkpoints were reported."""
+    for _ in stream:
+        if len(checkpoints) == pages:
+            break
+
+
+class TestPageCheckpoint:
+    """Tests for checkpoint tokens."""
+
+    def test_token_round_trip(self):
+        checkpoint = PageCheckpoint(
+            page=3, page_size=50, request_hash="abc", rows_seen=150, last_id=IDS[0]
+        )
+        assert PageCheckpoint.from_token(checkpoint.to_token()) == checkpoint
+
+    def test_invalid_token(self):
+        with pytest.raises(ValueError, match="Invalid checkpoint token"):
+            PageCheckpoint.from_token("not-a-token")
+
+
+class TestResumableStreams:
+    """Tests for checkpoint/on_checkpoint on iter_list and iter_search."""
+
+    def test_checkpoint_reported_after_each_page(self):
+        catalog = Catalog(IDS[:5])
+        checkpoints: list[PageCheckpoint] = []
+
+        rows = list(
+            catalog.client().opportunities.iter_list(on_checkpoint=checkpoints.append)
+        )
+
+        assert len(rows) == 5
+        assert [cp.page for cp in checkpoints] == [1, 2, 3]
+        assert [cp.rows_seen for cp in checkpoints] == [2, 4, 5]
+        assert checkpoints[1].last_id == IDS[3]
+        assert checkpoints[1].last_modified_at == "2025-01-04T00:00:00Z"
+
+    def test_resume_continues_after_last_row(self):
+        catalog = Catalog(IDS[:6])
+        checkpoints: list[PageCheckpoint] = []
+        opportunities = catalog.client().opportunities
+        _interrupted_after(
+            opportunities.iter_list(on_checkpoint=checkpoints.append), 2, checkpoints
+        )
+
+        catalog.pages_requested.clear()
+        resumed = list(opportunities.iter_list(checkpoint=checkpoints[-1].to_token()))
+
+        assert _ids(resumed) == IDS[4:6]
+        assert catalog.pages_requested == [2, 3]
+
+    def test_resume_after_inserts_repeats_but_never_skips(self):
+        catalog = Catalog(IDS[2:7])
+        checkpoints: list[PageCheckpoint] = []
+        opportunities = catalog.client().opportunities
+        _interrupted_after(
+            opportunities.iter_list(on_checkpoint=checkpoints.append), 1, checkpoints
+        )
+
+        # Two rows are inserted ahead of the stream while it is interrupted.
+        catalog.ids = IDS[:2] + catalog.ids
+        resumed = _ids(opportunities.iter_list(checkpoint=checkpoints[-1]))
+
+        assert set(IDS[4:7]) <= set(resumed)
+
+    def test_resume_after_deletions_walks_back_to_the_last_row(self):
+        catalog = Catalog(IDS[:6])
+        checkpoints: list[PageCheckpoint] = []
+        opportunities = catalog.client().opportunities
+        _interrupted_after(
+            opportunities.iter_list(on_checkpoint=checkpoints.append), 2, checkpoints
+        )
+
+        # Rows 1-3 are deleted: row 4, the last one streamed, moves to page 1.
+        catalog.ids = IDS[3:6]
+        catalog.pages_requested.clear()
+        resumed = _ids(opportunities.iter_list(checkpoint=checkpoints[-1]))
+
+        assert resumed == IDS[4:6]
+        assert catalog.pages_requested == [2, 1, 2]
+
+    def test_resume_restarts_when_the_last_row_is_gone(self):
+        catalog = Catalog(IDS[:7])
+        checkpoints: list[PageCheckpoint] = []
+        opportunities = catalog.client().opportunities
+        _interrupted_after(
+            opportunities.iter_list(on_checkpoint=checkpoints.append), 3, checkpoints
+        )
+
+        catalog.ids = IDS[:2] + IDS[6:]
+        catalog.pages_requested.clear()
+        resumed = _ids(opportunities.iter_list(checkpoint=checkpoints[-1]))
+
+        assert resumed == catalog.ids
+        assert catalog.pages_requested == [3, 2, 1, 2]
+
+    def test_async_resume_after_deletions(self):
+        catalog = Catalog(IDS[:6])
+        checkpoints: list[PageCheckpoint] = []
+        _interrupted_after(
+            catalog.client().opportunities.iter_list(on_checkpoint=checkpoints.append),
+            2,
+            checkpoints,
+        )
+        catalog.ids = IDS[3:6]
+
+        async def resume() -> list:
+            async with catalog.client(AsyncClient) as client:
+                return [
+                    row
+                    async for row in client.opportunities.iter_list(
+                        checkpoint=checkpoints[-1]
+                    )
+                ]
+
+        assert _ids(asyncio.run(resume())) == IDS[4:6]
+
+    def test_resume_failure_indexes_continue_the_stream(self):
+        catalog = Catalog(IDS[:4])
+        checkpoints: list[PageCheckpoint] = []
+        opportunities = catalog.client().opportunities
+        _interrupted_after(
+            opportunities.iter_list(on_checkpoint=checkpoints.append), 1, checkpoints
+        )
+        catalog.ids[3] = "not-a-uuid"
+
+        resumed = list(opportunities.iter_list(checkpoint=checkpoints[-1]))
+
+        assert isinstance(resumed[1], ParseFailure)
+        assert resumed[1].index == 3
+
+    def test_checkpoint_from_another_request_is_rejected(self):
+        catalog = Catalog(IDS[:4])
+        checkpoints: list[PageCheckpoint] = []
+        opportunities = catalog.client().opportunities
+        _interrupted_after(
+            opportunities.iter_search(
+                search="health", on_checkpoint=checkpoints.append
+            ),
+            1,
+            checkpoints,
+        )
+
+        with pytest.raises(ValueError, match="different request"):
+            next(opportunities.iter_search(search="water", checkpoint=checkpoints[0]))
+        with pytest.raises(ValueError, match="page_size=2"):
+            next(
+                opportunities.iter_search(
+                    search="health", page_size=10, checkpoint=checkpoints[0]
+                )
+            )
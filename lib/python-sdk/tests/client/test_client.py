@@ -1,6 +1,7 @@
 """Tests for the Client class."""
 
 import json
+import threading
 import pytest
 from unittest.mock import Mock, patch
 from uuid import uuid4
@@ -141,6 +142,49 @@ class TestClient:
             # Verify httpx.Client was called with the timeout
             mock_httpx.assert_called_once_with(timeout=30.0)
 
+    def test_client_initialization_pool_limits(self):
+        """Test pool settings are passed to httpx.Client as Limits."""
+        with patch("common_grants_sdk.client.client.httpx.Client") as mock_httpx:
+            config = Config(
+                base_url="https://api.example.com",
+                api_key="test-key",
+                max_connections=50,
+                keepalive_expiry=30.0,
+            )
+            Client(config=config)
+            mock_httpx.assert_called_once_with(
+                timeout=config.timeout,
+                limits=httpx.Limits(
+                    max_connections=50,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=30.0,
+                ),
+            )
+
+    def test_clients_share_injected_transport(self):
+        """Test clients send through a shared transport and never close it."""
+        closed = []
+        paths = []
+
+        class RecordingTransport(httpx.MockTransport):
+            def close(self):
+                closed.append(True)
+
+        shared = RecordingTransport(
+            lambda request: paths.append(request.url.path)
+            or httpx.Response(200, json={})
+        )
+        config = Config(
+            base_url="https://api.example.com", api_key="test-key", transport=shared
+        )
+
+        with Client(config=config) as first, Client(config=config) as second:
+            first.get("/a")
+            second.get("/b")
+
+        assert paths == ["/a", "/b"]
+        assert closed == []
+
     def test_client_environment_variables(self, monkeypatch):
         """Test client initialization using environment variables."""
         monkeypatch.setenv("CG_API_BASE_URL", "https://env.example.com")
@@ -915,6 +959,130 @@ class TestClientListAllItems:
                 client.list("/test-path")
             assert exc_info.value.error.status == 500
 
+    def test_list_all_prefetches_remaining_pages_concurrently(self):
+        """After page 1 reveals totalPages, the rest are fetched concurrently
+        (all in flight together) and reassembled in page order."""
+        with patch("common_grants_sdk.client.client.httpx.Client"):
+            config = Config(
+                base_url="https://api.example.com",
+                api_key="test-key",
+                max_concurrency=4,
+            )
+            client = Client(config=config)
+
+            total_pages = 5
+            barrier = threading.Barrier(total_pages - 1, timeout=5)
+
+            def mock_get(*args, **kwargs):
+                page = kwargs["params"]["page"]
+                if page > 1:
+                    # Every later page must be in flight at once to pass the barrier.
+                    barrier.wait()
+                mock_resp = Mock()
+                mock_resp.raise_for_status = Mock()
+                mock_resp.json = Mock(
+                    return_value={
+                        "status": 200,
+                        "message": "Success",
+                        "items": [{"page": page, "n": n} for n in range(2)],
+                        "paginationInfo": {
+                            "page": page,
+                            "pageSize": 2,
+                            "totalItems": 2 * total_pages,
+                            "totalPages": total_pages,
+                        },
+                    }
+                )
+                return mock_resp
+
+            client.get = Mock(side_effect=mock_get)
+
+            response = client.list("/test-path")
+
+            assert [item["page"] for item in response.items] == [
+                1, 1, 2, 2, 3, 3, 4, 4, 5, 5,
+            ]  # fmt: skip
+            assert client.get.call_count == total_pages
+
+    def test_list_all_serial_when_max_concurrency_is_one(self, sample_item_data):
+        """max_concurrency=1 fetches pages strictly one after another."""
+        with patch("common_grants_sdk.client.client.httpx.Client"):
+            config = Config(
+                base_url="https://api.example.com",
+                api_key="test-key",
+                max_concurrency=1,
+            )
+            client = Client(config=config)
+            pages_seen: list[tuple[int, str]] = []
+
+            def mock_get(*args, **kwargs):
+                page = kwargs["params"]["page"]
+                pages_seen.append((page, threading.current_thread().name))
+                mock_resp = Mock()
+                mock_resp.raise_for_status = Mock()
+                mock_resp.json = Mock(
+                    return_value={
+                        "status": 200,
+                        "message": "Success",
+                        "items": [sample_item_data],
+                        "paginationInfo": {
+                            "page": page,
+                            "pageSize": 1,
+                            "totalItems": 3,
+                            "totalPages": 3,
+                        },
+                    }
+                )
+                return mock_resp
+
+            client.get = Mock(side_effect=mock_get)
+
+            response = client.list("/test-path")
+
+            assert len(response.items) == 3
+            main = threading.current_thread().name
+            assert pages_seen == [(1, main), (2, main), (3, main)]
+
+    def test_list_all_continues_after_short_prefetched_pages(self, sample_item_data):
+        """If prefetched pages come back short, the limit is still reached by
+        continuing page by page."""
+        with patch("common_grants_sdk.client.client.httpx.Client"):
+            config = Config(
+                base_url="https://api.example.com",
+                api_key="test-key",
+                list_items_limit=6,
+            )
+            client = Client(config=config)
+
+            def mock_get(*args, **kwargs):
+                page = kwargs["params"]["page"]
+                # Page 1 is full (3 items); later pages carry only 1 item each.
+                count = 3 if page == 1 else 1
+                mock_resp = Mock()
+                mock_resp.raise_for_status = Mock()
+                mock_resp.json = Mock(
+                    return_value={
+                        "status": 200,
+                        "message": "Success",
+                        "items": [sample_item_data] * count,
+                        "paginationInfo": {
+                            "page": page,
+                            "pageSize": 3,
+                            "totalItems": 10,
+                            "totalPages": 8,
+                        },
+                    }
+                )
+                return mock_resp
+
+            client.get = Mock(side_effect=mock_get)
+
+            response = client.list("/test-path")
+
+            assert len(response.items) == 6
+            # Page 1, prefetched page 2, then pages 3-4 serially.
+            assert client.get.call_count == 4
+
 
 class TestClientGetItem:
     """Tests for Client.get_item() method."""
@@ -1488,3 +1656,81 @@ class TestClientSearchAllItems:
             with pytest.raises(APIError) as exc_info:
                 client.search("/test-path", search_request)
             assert exc_info.value.error.status == 500
+
+
+def _opportunity_row(title: str = "Test Opportunity") -> dict:
+    return {
+        "id": str(uuid4()),
+        "title": title,
+        "description": "Test description",
+        "status": {"value": "open"},
+        "createdAt": "2025-01-01T00:00:00Z",
+        "lastModifiedAt": "2025-01-01T00:00:00Z",
+    }
+
+
+def _fast_decode_client(rows: list[dict]) -> Client:
+    """A fast_decode client whose list/search endpoints return ``rows``."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            json={
+                "status": 200,
+                "message": "Success",
+                "items": rows,
+                "paginationInfo": {
+                    "page": 1,
+                    "pageSize": len(rows),
+                    "totalItems": len(rows),
+                    "totalPages": 1,
+                },
+                "sortInfo": {"sortBy": "lastModifiedAt", "sortOrder": "desc"},
+                "filterInfo": {"filters": {}, "errors": []},
+            },
+        )
+
+    config = Config(
+        base_url="https://api.example.com", api_key="test-key", fast_decode=True
+    )
+    client = Client(config=config)
+    client.http = httpx.Client(transport=httpx.MockTransport(handler))
+    return client
+
+
+class TestFastDecode:
+    """Tests for single-pass decoding with config.fast_decode."""
+
+    def test_rows_are_validated_while_decoding(self):
+        client = _fast_decode_client([_opportunity_row(), _opportunity_row()])
+
+        page = client.list("/opps", page=1, schema=OpportunityBase)
+
+        assert all(isinstance(item, OpportunityBase) for item in page.items)
+
+    def test_without_schema_rows_stay_dicts(self):
+        client = _fast_decode_client([_opportunity_row()])
+
+        page = client.list("/opps", page=1)
+
+        assert isinstance(page.items[0], dict)
+
+    def test_bad_row_falls_back_to_per_row_failures(self):
+        client = _fast_decode_client([_opportunity_row("ok"), {"id": "not-a-uuid"}])
+
+        result = client.opportunities.list(page=1)
+
+        assert [item.title for item in result.items] == ["ok"]
+        assert len(result.errors) == 1
+        assert result.errors[0].index == 1
+        assert result.errors[0].raw == {"id": "not-a-uuid"}
+
+    def test_search_keeps_sort_and_filter_info(self):
+        client = _fast_decode_client([_opportunity_row("a"), _opportunity_row("b")])
+
+        result = client.opportunities.search(search="health", page=1)
+
+        assert [item.title for item in result.items] == ["a", "b"]
+        assert result.errors == []
+        assert result.sort_info is not None
+        assert result.sort_info.sort_by == "lastModifiedAt"
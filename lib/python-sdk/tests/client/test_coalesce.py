@@ -0,0 +1,167 @@
+"""Tests for coalescing identical in-flight requests."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from common_grants_sdk.client import AsyncClient
+from common_grants_sdk.client.coalesce import SingleFlight
+from common_grants_sdk.client.exceptions import APIError
+
+from .conftest import opportunity_row, page_body
+
+
+class TestSingleFlight:
+    """Tests for the thread-based SingleFlight."""
+
+    def test_concurrent_callers_share_one_call(self):
+        flights = SingleFlight()
+        calls = []
+        barrier = threading.Barrier(5)
+
+        def work():
+            calls.append(1)
+            time.sleep(0.1)
+            return object()
+
+        def caller(_):
+            barrier.wait()
+            return flights.do("key", work)
+
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            results = list(pool.map(caller, range(5)))
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+
+    def test_sequential_calls_are_not_shared(self):
+        flights = SingleFlight()
+        assert flights.do("key", object) is not flights.do("key", object)
+
+    def test_error_reaches_every_waiter(self):
+        flights = SingleFlight()
+        barrier = threading.Barrier(3)
+
+        def work():
+            time.sleep(0.1)
+            raise RuntimeError("boom")
+
+        def caller(_):
+            barrier.wait()
+            with pytest.raises(RuntimeError, match="boom"):
+                flights.do("key", work)
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            list(pool.map(caller, range(3)))
+
+
+class TestClientCoalescing:
+    """Tests for coalesced requests through the clients."""
+
+    def test_identical_searches_share_one_request_and_rows(self, make_client):
+        requests: list[httpx.Request] = []
+        body = page_body([opportunity_row()])
+        barrier = threading.Barrier(4)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            time.sleep(0.1)
+            return httpx.Response(200, json=body)
+
+        client = make_client(handler, coalesce=True)
+
+        def search(_):
+            barrier.wait()
+            return client.opportunities.search(search="health", page=1)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(search, range(4)))
+
+        assert len(requests) == 1
+        assert all(result.items[0] is results[0].items[0] for result in results)
+
+    def test_async_searches_coalesce_by_body(self, make_client):
+        requests: list[httpx.Request] = []
+        body = page_body([opportunity_row()])
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json=body)
+
+        async def run():
+            async with make_client(handler, AsyncClient, coalesce=True) as client:
+                return await asyncio.gather(
+                    client.opportunities.search(search="health", page=1),
+                    client.opportunities.search(search="health", page=1),
+                    client.opportunities.search(search="health", page=1),
+                    client.opportunities.search(search="education", page=1),
+                )
+
+        results = asyncio.run(run())
+
+        assert len(requests) == 2
+        assert results[1].items[0] is results[0].items[0]
+        assert results[3].items[0] is not results[0].items[0]
+
+    def test_async_failure_is_shared(self, make_client):
+        requests: list[httpx.Request] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            await asyncio.sleep(0.01)
+            return httpx.Response(
+                503, json={"status": 503, "message": "Busy", "errors": []}
+            )
+
+        async def run():
+            async with make_client(handler, AsyncClient, coalesce=True) as client:
+                return await asyncio.gather(
+                    client.opportunities.get("abc"),
+                    client.opportunities.get("abc"),
+                    return_exceptions=True,
+                )
+
+        results = asyncio.run(run())
+
+        assert len(requests) == 1
+        assert all(isinstance(result, APIError) for result in results)
+
+    def test_plain_posts_are_not_coalesced(self, make_client):
+        requests: list[httpx.Request] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"ok": True})
+
+        async def run():
+            async with make_client(handler, AsyncClient, coalesce=True) as client:
+                await asyncio.gather(
+                    client.post("/things", json={}), client.post("/things", json={})
+                )
+
+        asyncio.run(run())
+        assert len(requests) == 2
+
+    def test_off_by_default(self, make_client):
+        requests: list[httpx.Request] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json=page_body([opportunity_row()]))
+
+        async def run():
+            async with make_client(handler, AsyncClient) as client:
+                await asyncio.gather(
+                    client.opportunities.search(page=1),
+                    client.opportunities.search(page=1),
+                )
+
+        asyncio.run(run())
+        assert len(requests) == 2
@@ -0,0 +1,163 @@
+"""Tests for transfer compression and payload accounting."""
+
+import asyncio
+import gzip
+import json
+
+import httpx
+import pytest
+
+from common_grants_sdk.client import AsyncClient
+from common_grants_sdk.client.compression import accept_encoding_header
+from common_grants_sdk.client.config import Config
+
+from .conftest import opportunity_row, page_body
+
+
+def _page(page: int = 1, total_pages: int = 1) -> dict:
+    # A wordy row, so bodies are large enough to be worth compressing.
+    row = opportunity_row(description="A long description. " * 50)
+    return page_body([row], page=page, total_pages=total_pages)
+
+
+def _gzipped(body: dict, **headers: str) -> httpx.Response:
+    # A stream (not content=) so the body is read as it would be off the wire.
+    return httpx.Response(
+        200,
+        headers={"Content-Encoding": "gzip", **headers},
+        stream=httpx.ByteStream(gzip.compress(json.dumps(body).encode())),
+    )
+
+
+class TestAcceptEncoding:
+    """Tests for Accept-Encoding negotiation."""
+
+    def test_configured_codings_are_sent(self, make_client):
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return _gzipped(_page())
+
+        client = make_client(handler, accept_encoding=["gzip", "identity"])
+        client.opportunities.search(page=1)
+
+        assert seen[0].headers["Accept-Encoding"] == "gzip, identity"
+
+    def test_env_var(self, monkeypatch):
+        monkeypatch.setenv("CG_API_ACCEPT_ENCODING", "deflate, gzip")
+        config = Config(base_url="https://api.example.com", api_key="key")
+        assert config.accept_encoding == "deflate, gzip"
+
+    def test_unknown_coding_rejected(self):
+        with pytest.raises(ValueError, match="Unsupported content coding"):
+            accept_encoding_header(["lzma"])
+
+
+class TestTransferStats:
+    """Tests for the byte counts on results."""
+
+    def test_search_reports_compressed_and_uncompressed_bytes(self, make_client):
+        body = _page()
+        client = make_client(lambda request: _gzipped(body))
+
+        result = client.opportunities.search(page=1)
+
+        transfer = result.transfer
+        assert transfer is not None
+        assert transfer.responses == 1
+        assert transfer.uncompressed_bytes == len(json.dumps(body).encode())
+        assert transfer.compressed_bytes < transfer.uncompressed_bytes
+        assert transfer.ratio is not None and transfer.ratio < 1
+
+    def test_all_pages_are_counted(self, make_client):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return _gzipped(_page(int(request.url.params["page"]), 3))
+
+        result = make_client(handler, max_concurrency=3).opportunities.list()
+
+        assert result.transfer is not None
+        assert result.transfer.responses == 3
+
+    def test_async_list_reports_bytes(self, make_client):
+        async def run():
+            async with make_client(
+                lambda request: _gzipped(_page()), AsyncClient
+            ) as client:
+                return await client.opportunities.list(page=1)
+
+        result = asyncio.run(run())
+        assert result.transfer is not None
+        assert result.transfer.compressed_bytes > 0
+
+
+class TestRequestCompression:
+    """Tests for gzipped search request bodies."""
+
+    def test_compresses_once_server_advertises_gzip(self, make_client):
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return _gzipped(_page(), **{"Accept-Encoding": "gzip"})
+
+        client = make_client(handler, compress_requests_over=10)
+        client.opportunities.search(search="health", page=1)
+        client.opportunities.search(search="health", page=1)
+
+        assert "Content-Encoding" not in seen[0].headers
+        assert seen[1].headers["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(seen[1].content)) == json.loads(
+            seen[0].content
+        )
+
+    def test_prepared_bodies_are_compressed(self, make_client):
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return _gzipped(_page(), **{"Accept-Encoding": "gzip"})
+
+        client = make_client(handler, compress_requests_over=10)
+        prepared = client.opportunities.prepare("health")
+        client.opportunities.search_prepared(prepared, page=1)
+        client.opportunities.search_prepared(prepared, page=1)
+
+        assert seen[1].headers["Content-Encoding"] == "gzip"
+        assert seen[1].headers["Content-Type"] == "application/json"
+        assert gzip.decompress(seen[1].content) == prepared.body
+
+    def test_small_bodies_are_sent_as_is(self, make_client):
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return _gzipped(_page(), **{"Accept-Encoding": "gzip"})
+
+        client = make_client(handler, compress_requests_over=100_000)
+        client.opportunities.search(page=1)
+        client.opportunities.search(page=1)
+
+        assert "Content-Encoding" not in seen[1].headers
+
+    def test_rejected_compression_falls_back(self, make_client):
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            if request.headers.get("Content-Encoding") == "gzip":
+                return httpx.Response(415, json={"status": 415, "errors": []})
+            return _gzipped(_page(), **{"Accept-Encoding": "gzip"})
+
+        client = make_client(handler, compress_requests_over=10)
+        client.opportunities.search(page=1)
+        result = client.opportunities.search(page=1)
+        client.opportunities.search(page=1)
+
+        assert len(result.items) == 1
+        assert [r.headers.get("Content-Encoding") for r in seen] == [
+            None,
+            "gzip",
+            None,
+            None,
+        ]
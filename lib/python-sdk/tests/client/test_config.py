@@ -100,3 +100,54 @@ class TestConfig:
         """Test that https:// URLs are valid."""
         config = Config(base_url="https://api.example.com", api_key="test-key")
         assert config.base_url == "https://api.example.com"
+
+    def test_default_max_concurrency(self):
+        """Test default max concurrency value."""
+        config = Config(base_url="https://api.example.com", api_key="test-key")
+        assert config.max_concurrency == Config.DEFAULT_MAX_CONCURRENCY
+
+    def test_environment_variable_max_concurrency(self, monkeypatch):
+        """Test loading max concurrency from environment variable."""
+        monkeypatch.setenv("CG_API_MAX_CONCURRENCY", "8")
+        config = Config(base_url="https://api.example.com", api_key="test-key")
+        assert config.max_concurrency == 8
+
+    def test_invalid_max_concurrency(self):
+        """Test that a negative max concurrency raises ValueError."""
+        with pytest.raises(ValueError, match="max_concurrency must be at least 1"):
+            Config(
+                base_url="https://api.example.com",
+                api_key="test-key",
+                max_concurrency=-1,
+            )
+
+    def test_pool_settings_default_to_none(self):
+        """Test that pool settings are unset (httpx defaults) unless configured."""
+        config = Config(base_url="https://api.example.com", api_key="test-key")
+        assert config.max_connections is None
+        assert config.max_keepalive_connections is None
+        assert config.keepalive_expiry is None
+        assert config.http2 is False
+        assert config.transport is None
+
+    def test_environment_variable_pool_settings(self, monkeypatch):
+        """Test loading pool settings and HTTP/2 from environment variables."""
+        monkeypatch.setenv("CG_API_MAX_CONNECTIONS", "50")
+        monkeypatch.setenv("CG_API_MAX_KEEPALIVE_CONNECTIONS", "0")
+        monkeypatch.setenv("CG_API_KEEPALIVE_EXPIRY", "30")
+        monkeypatch.setenv("CG_API_HTTP2", "true")
+        config = Config(base_url="https://api.example.com", api_key="test-key")
+        assert config.max_connections == 50
+        assert config.max_keepalive_connections == 0
+        assert config.keepalive_expiry == 30.0
+        assert config.http2 is True
+
+    def test_retry_default_off_and_env_max_attempts(self, monkeypatch):
+        """Test retry is off by default and enabled by CG_API_RETRY_MAX_ATTEMPTS."""
+        config = Config(base_url="https://api.example.com", api_key="test-key")
+        assert config.retry is None
+
+        monkeypatch.setenv("CG_API_RETRY_MAX_ATTEMPTS", "5")
+        config = Config(base_url="https://api.example.com", api_key="test-key")
+        assert config.retry is not None
+        assert config.retry.max_attempts == 5
@@ -0,0 +1,205 @@
+"""Tests for federated search across several servers."""
+
+import asyncio
+import json
+import time
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from common_grants_sdk.client import (
+    AsyncClient,
+    AsyncFederatedClient,
+    FederatedClient,
+)
+from common_grants_sdk.client.config import Config
+from common_grants_sdk.client.exceptions import APIError
+from common_grants_sdk.client.federation import sort_key
+from common_grants_sdk.schemas.pydantic.models import OpportunityBase
+from common_grants_sdk.schemas.pydantic.sorting import OppSortBy, OppSorting
+
+from .conftest import opportunity_row, page_body
+
+_NOW = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _row(days_ago: int, opp_id: str | None = None, **extra) -> dict:
+    modified = (_NOW - timedelta(days=days_ago)).isoformat()
+    return opportunity_row(
+        id=opp_id or str(uuid4()),
+        title=f"Opportunity {days_ago}",
+        createdAt=modified,
+        lastModifiedAt=modified,
+        **extra,
+    )
+
+
+def _serving(rows: list[dict], delay: float = 0.0, seen=None):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if seen is not None:
+            seen.append(request)
+        time.sleep(delay)
+        return httpx.Response(200, json=page_body(rows, page_size=100))
+
+    return handler
+
+
+class TestSortKey:
+    """Tests for ordering rows by OppSorting."""
+
+    def test_missing_values_sort_last_both_ways(self):
+        rows = [
+            OpportunityBase.model_validate(_row(1)),
+            OpportunityBase.model_validate(
+                _row(
+                    2, funding={"maxAwardAmount": {"amount": "900", "currency": "USD"}}
+                )
+            ),
+            OpportunityBase.model_validate(
+                _row(
+                    3, funding={"maxAwardAmount": {"amount": "1000", "currency": "USD"}}
+                )
+            ),
+        ]
+        for order, expected in [("desc", [3, 2, 1]), ("asc", [2, 3, 1])]:
+            sorting = OppSorting(sortBy=OppSortBy.MAX_AWARD_AMOUNT, sortOrder=order)
+            ordered = sorted(rows, key=sort_key(sorting), reverse=order == "desc")
+            # Amounts compare as numbers ("1000" > "900"), not strings.
+            assert [int(row.title.split()[-1]) for row in ordered] == expected
+
+    def test_naive_datetimes_order_as_utc(self):
+        naive = {**_row(2), "lastModifiedAt": "2025-12-30T00:00:00"}
+        rows = [
+            OpportunityBase.model_validate(_row(3)),
+            OpportunityBase.model_validate(naive),
+            OpportunityBase.model_validate(_row(1)),
+        ]
+        assert rows[1].last_modified_at.tzinfo is None
+
+        ordered = sorted(
+            rows,
+            key=sort_key(
+                OppSorting(sortBy=OppSortBy.LAST_MODIFIED_AT, sortOrder="asc")
+            ),
+        )
+
+        assert [row.title for row in ordered] == [f"Opportunity {n}" for n in (3, 2, 1)]
+
+
+class TestFederatedClient:
+    """Tests for the thread-based FederatedClient."""
+
+    def test_merges_in_sort_order_and_dedupes_by_id(self, make_client):
+        shared = str(uuid4())
+        federal = [_row(1), _row(4, shared), _row(6)]
+        # The state portal lists rows out of order; the merge still holds.
+        state = [_row(5), _row(2), _row(4, shared)]
+        seen: list[httpx.Request] = []
+        client = FederatedClient(
+            {
+                "federal": make_client(_serving(federal, seen=seen)),
+                "state": make_client(_serving(state, seen=seen)),
+            }
+        )
+
+        result = client.search(search="health", page=1)
+
+        assert [row.title for row in result.items] == [
+            f"Opportunity {n}" for n in (1, 2, 4, 5, 6)
+        ]
+        assert result.sources == ["federal", "state", "federal", "state", "federal"]
+        assert result.endpoints["state"].duplicates == 1
+        assert result.errors == {}
+        sorting = json.loads(seen[0].content)["sorting"]
+        assert sorting == {"sortBy": "lastModifiedAt", "sortOrder": "desc"}
+
+    def test_fields_always_include_id_and_sort_field(self, make_client):
+        shared = str(uuid4())
+        seen: list[httpx.Request] = []
+        client = FederatedClient(
+            {
+                "federal": make_client(_serving([_row(1, shared)], seen=seen)),
+                "state": make_client(_serving([_row(1, shared), _row(2)], seen=seen)),
+            }
+        )
+
+        result = client.search(page=1, fields=["title"])
+
+        assert seen[0].url.params["fields"] == "lastModifiedAt,id,title"
+        assert [row.title for row in result.items] == ["Opportunity 1", "Opportunity 2"]
+        assert result.endpoints["state"].duplicates == 1
+
+    def test_slow_server_times_out_without_blocking_the_rest(self, make_client):
+        client = FederatedClient(
+            {
+                "fast": make_client(_serving([_row(1)])),
+                "slow": make_client(_serving([_row(2)], delay=0.5)),
+            },
+            timeouts={"slow": 0.05},
+        )
+
+        started = time.perf_counter()
+        result = client.search(page=1)
+
+        assert time.perf_counter() - started < 0.4
+        assert len(result.items) == 1
+        assert isinstance(result.errors["slow"], TimeoutError)
+        assert result.endpoints["slow"].latency == 0.05
+        assert result.endpoints["fast"].latency < 0.4
+
+    def test_failed_server_is_reported(self, make_client):
+        def failing(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(500, json={"status": 500, "errors": []})
+
+        client = FederatedClient(
+            {"ok": make_client(_serving([_row(1)])), "down": make_client(failing)}
+        )
+
+        result = client.search(page=1)
+
+        assert len(result.items) == 1
+        assert isinstance(result.errors["down"], APIError)
+        assert result.endpoints["ok"].result is not None
+
+    def test_timeouts_for_unknown_endpoints_rejected(self):
+        with pytest.raises(ValueError, match="unknown endpoints"):
+            FederatedClient(
+                {"a": Config(base_url="https://a.example.com", api_key="key")},
+                timeouts={"b": 1},
+            )
+
+
+class TestAsyncFederatedClient:
+    """Tests for AsyncFederatedClient."""
+
+    def test_merges_ascending_and_cancels_slow_server(self, make_client):
+        async def slow(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(1)
+            return httpx.Response(200, json=page_body([_row(3)], page_size=100))
+
+        async def run():
+            async with AsyncFederatedClient(
+                {
+                    "a": make_client(_serving([_row(1), _row(5)]), AsyncClient),
+                    "b": make_client(_serving([_row(4), _row(2)]), AsyncClient),
+                    "slow": make_client(slow, AsyncClient),
+                },
+                timeout=0.1,
+            ) as client:
+                return await client.search(
+                    page=1,
+                    sorting=OppSorting(
+                        sortBy=OppSortBy.LAST_MODIFIED_AT, sortOrder="asc"
+                    ),
+                )
+
+        started = time.perf_counter()
+        result = asyncio.run(run())
+
+        assert time.perf_counter() - started < 0.5
+        assert [row.title for row in result.items] == [
+            f"Opportunity {n}" for n in (5, 4, 2, 1)
+        ]
+        assert list(result.errors) == ["slow"]
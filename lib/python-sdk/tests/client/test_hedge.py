@@ -0,0 +1,220 @@
+"""Tests for hedged requests."""
+
+import asyncio
+import itertools
+import threading
+import time
+
+import httpx
+import pytest
+
+from common_grants_sdk.client import AsyncClient
+from common_grants_sdk.client.config import Config
+from common_grants_sdk.client.hedge import HedgePolicy, HedgeStats
+
+
+def _first_copy_slow(delay: float):
+    """A handler whose first request takes ``delay`` seconds; the rest are fast."""
+    calls = itertools.count()
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        with lock:
+            call = next(calls)
+        if call == 0:
+            time.sleep(delay)
+        return httpx.Response(200, json={"call": call})
+
+    return handler
+
+
+class TestHedgePolicy:
+    """Tests for the percentile-derived delay."""
+
+    def test_initial_delay_until_enough_samples(self):
+        policy = HedgePolicy(percentile=50, initial_delay=0.2, min_samples=3)
+        policy.record(0.01)
+        policy.record(0.02)
+        assert policy.delay() == 0.2
+
+    def test_delay_is_the_latency_percentile(self):
+        policy = HedgePolicy(percentile=90, min_delay=0, min_samples=10)
+        for ms in range(1, 11):
+            policy.record(ms / 1000)
+        assert policy.delay() == 0.009
+
+    def test_delay_is_clamped(self):
+        policy = HedgePolicy(min_delay=0.05, max_delay=0.5, min_samples=1)
+        policy.record(0.001)
+        assert policy.delay() == 0.05
+        policy = HedgePolicy(min_delay=0.05, max_delay=0.5, min_samples=1)
+        policy.record(3.0)
+        assert policy.delay() == 0.5
+
+    def test_percentile_out_of_range_rejected(self):
+        with pytest.raises(ValueError, match="percentile"):
+            HedgePolicy(percentile=100)
+        with pytest.raises(ValueError, match="max_workers"):
+            HedgePolicy(max_workers=0)
+
+    def test_env_var(self, monkeypatch):
+        monkeypatch.setenv("CG_API_HEDGE_PERCENTILE", "99")
+        config = Config(base_url="https://api.example.com", api_key="key")
+        assert config.hedge is not None
+        assert config.hedge.percentile == 99
+
+
+class TestClientHedging:
+    """Tests for hedged requests through the clients."""
+
+    def test_slow_get_is_hedged_and_the_hedge_wins(self, make_client):
+        policy = HedgePolicy(initial_delay=0.05)
+        client = make_client(_first_copy_slow(0.5), hedge=policy)
+
+        started = time.perf_counter()
+        response = client.get("/items/1")
+
+        assert time.perf_counter() - started < 0.4
+        assert response.json() == {"call": 1}
+        assert policy.stats() == HedgeStats(requests=1, hedged=1, won=1)
+
+    def test_fast_get_is_not_hedged(self, make_client):
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json={})
+
+        policy = HedgePolicy(initial_delay=1.0)
+        client = make_client(handler, hedge=policy)
+        client.get("/items/1")
+        client.get("/items/2")
+
+        assert len(seen) == 2
+        assert policy.stats() == HedgeStats(requests=2, hedged=0, won=0)
+
+    def test_sync_copies_reuse_the_policy_threads(self, make_client):
+        threads: set[int] = set()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            threads.add(threading.get_ident())
+            return httpx.Response(200, json={})
+
+        policy = HedgePolicy(initial_delay=1.0, max_workers=1)
+        client = make_client(handler, hedge=policy)
+        for n in range(5):
+            client.get(f"/items/{n}")
+
+        assert len(threads) == 1
+        assert threading.get_ident() not in threads
+
+    def test_queued_time_is_not_latency(self, make_client):
+        def handler(request: httpx.Request) -> httpx.Response:
+            time.sleep(0.1)
+            return httpx.Response(200, json={})
+
+        policy = HedgePolicy(initial_delay=1.0, max_workers=1)
+        client = make_client(handler, hedge=policy)
+        threads = [
+            threading.Thread(target=client.get, args=(f"/items/{n}",)) for n in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(policy._latencies) == 4
+        assert max(policy._latencies) < 0.25
+
+    def test_saturated_pool_is_not_hedged(self, make_client):
+        entered: list[httpx.Request] = []
+        release = threading.Event()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            entered.append(request)
+            release.wait(5)
+            return httpx.Response(200, json={})
+
+        policy = HedgePolicy(initial_delay=0.2, max_workers=2)
+        client = make_client(handler, hedge=policy)
+        responses: list[httpx.Response] = []
+        threads = [
+            threading.Thread(
+                target=lambda n=n: responses.append(client.get(f"/items/{n}"))
+            )
+            for n in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        while len(entered) < 2:
+            time.sleep(0.01)
+        time.sleep(0.4)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(entered) == 2
+        assert [response.status_code for response in responses] == [200, 200]
+        assert policy.stats() == HedgeStats(requests=2, hedged=0, won=0)
+
+    def test_plain_post_is_never_hedged(self, make_client):
+        policy = HedgePolicy(initial_delay=0.01)
+        client = make_client(_first_copy_slow(0.1), hedge=policy)
+
+        response = client.post("/things", json={})
+
+        assert response.json() == {"call": 0}
+        assert policy.stats() == HedgeStats()
+
+    def test_search_is_hedged(self, make_client):
+        policy = HedgePolicy(initial_delay=0.05)
+        client = make_client(_first_copy_slow(0.5), hedge=policy)
+
+        response = client.post("/items/search", json={}, idempotent=True)
+
+        assert response.json() == {"call": 1}
+        assert policy.stats().won == 1
+
+    def test_async_loser_is_cancelled(self, make_client):
+        cancelled = []
+        calls = itertools.count()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            call = next(calls)
+            try:
+                if call == 0:
+                    await asyncio.sleep(1)
+                return httpx.Response(200, json={"call": call})
+            except asyncio.CancelledError:
+                cancelled.append(call)
+                raise
+
+        policy = HedgePolicy(initial_delay=0.05)
+
+        async def run():
+            async with make_client(handler, AsyncClient, hedge=policy) as client:
+                return await client.get("/items/1")
+
+        started = time.perf_counter()
+        response = asyncio.run(run())
+
+        assert time.perf_counter() - started < 0.5
+        assert response.json() == {"call": 1}
+        assert cancelled == [0]
+        assert policy.stats() == HedgeStats(requests=1, hedged=1, won=1)
+
+    def test_network_error_on_one_copy_does_not_win(self, make_client):
+        calls = itertools.count()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            call = next(calls)
+            if call == 0:
+                time.sleep(0.1)
+                return httpx.Response(200, json={"call": call})
+            raise httpx.ConnectError("refused", request=request)
+
+        policy = HedgePolicy(initial_delay=0.02)
+        response = make_client(handler, hedge=policy).get("/items/1")
+
+        assert response.json() == {"call": 0}
+        assert policy.stats() == HedgeStats(requests=1, hedged=1, won=0)
@@ -0,0 +1,229 @@
+"""Tests for client timing instrumentation."""
+
+import asyncio
+
+import httpx
+
+from common_grants_sdk.client import AsyncClient
+from common_grants_sdk.client.instrumentation import (
+    Instrumentation,
+    OpenTelemetryObserver,
+    TimingEvent,
+)
+from common_grants_sdk.client.retry import RetryPolicy
+
+from .conftest import opportunity_row, page_body
+
+
+class _Recorder:
+    def __init__(self):
+        self.events: list[TimingEvent] = []
+
+    def on_event(self, event: TimingEvent) -> None:
+        self.events.append(event)
+
+    def named(self, name: str) -> list[TimingEvent]:
+        return [event for event in self.events if event.name == name]
+
+
+class TestClientEvents:
+    """Tests for the events emitted during client calls."""
+
+    def test_search_reports_each_step(self, make_client):
+        recorder = _Recorder()
+        body = page_body([opportunity_row(), opportunity_row()])
+        client = make_client(
+            lambda request: httpx.Response(200, json=body), observers=[recorder]
+        )
+
+        client.opportunities.search(search="health", page=1)
+
+        names = [event.name for event in recorder.events]
+        assert names == [
+            "http.request",
+            "decode",
+            "validate.envelope",
+            "parse_batch",
+        ]
+        request = recorder.named("http.request")[0]
+        assert request.attributes["method"] == "POST"
+        assert request.attributes["status_code"] == 200
+        assert request.attributes["bytes"] > 0
+        assert request.attributes["attempt"] == 1
+        assert recorder.named("parse_batch")[0].attributes["rows"] == 2
+        assert all(event.duration >= 0 for event in recorder.events)
+
+    def test_filters_are_timed(self, make_client):
+        recorder = _Recorder()
+        body = page_body([opportunity_row()])
+        client = make_client(
+            lambda request: httpx.Response(200, json=body), observers=[recorder]
+        )
+
+        client.opportunities.search(
+            filters={"status": {"operator": "in", "value": ["open"]}}
+        )
+
+        assert len(recorder.named("classify_filters")) == 1
+
+    def test_retries_report_one_event_per_attempt(self, make_client):
+        recorder = _Recorder()
+        opp = opportunity_row()
+        responses = iter(
+            [
+                httpx.Response(503, json={"status": 503, "message": "Busy"}),
+                httpx.Response(200, json={"status": 200, "data": opp}),
+            ]
+        )
+        client = make_client(
+            lambda request: next(responses),
+            observers=[recorder],
+            retry=RetryPolicy(backoff=0, jitter=False),
+        )
+
+        client.opportunities.get(opp["id"])
+
+        requests = recorder.named("http.request")
+        assert [event.attributes["attempt"] for event in requests] == [1, 2]
+        assert [event.attributes["status_code"] for event in requests] == [503, 200]
+        assert recorder.named("parse_batch")[0].attributes["rows"] == 1
+
+    def test_fast_decode_is_one_validation_event(self, make_client):
+        recorder = _Recorder()
+        body = page_body([opportunity_row()])
+        client = make_client(
+            lambda request: httpx.Response(200, json=body),
+            observers=[recorder],
+            fast_decode=True,
+        )
+
+        client.opportunities.search(page=1)
+
+        assert not recorder.named("decode")
+        assert recorder.named("validate.envelope")[0].attributes["fast"] is True
+
+    def test_async_client_reports_requests(self, make_client):
+        recorder = _Recorder()
+        opp = opportunity_row()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"status": 200, "data": opp})
+
+        async def run():
+            async with make_client(
+                handler, AsyncClient, observers=[recorder]
+            ) as client:
+                await client.opportunities.get(opp["id"])
+
+        asyncio.run(run())
+        assert [event.name for event in recorder.events] == [
+            "http.request",
+            "decode",
+            "validate.envelope",
+            "parse_batch",
+        ]
+
+    def test_no_observers_no_trace_extension(self, make_client):
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json={"status": 200, "data": opportunity_row()})
+
+        make_client(handler).opportunities.get("abc")
+
+        assert "trace" not in seen[0].extensions
+
+
+class TestTracer:
+    """Tests for mapping httpcore trace events to HTTP phases."""
+
+    def test_phases_are_paired_and_unknown_events_ignored(self):
+        recorder = _Recorder()
+        trace = Instrumentation((recorder,)).tracer()
+
+        for step in (
+            "connection.connect_tcp",
+            "connection.start_tls",
+            "http11.send_request_headers",
+            "http11.receive_response_headers",
+            "http11.receive_response_body",
+        ):
+            trace(f"{step}.started", {})
+            trace(f"{step}.complete", {})
+        trace("http11.response_closed.started", {})
+
+        assert [event.name for event in recorder.events] == [
+            "http.connect",
+            "http.tls",
+            "http.send",
+            "http.wait",
+            "http.transfer",
+        ]
+
+
+class _FakeSpan:
+    def __init__(self, name, start_time, attributes):
+        self.name = name
+        self.start_time = start_time
+        self.attributes = attributes
+        self.end_time = None
+
+    def end(self, end_time=None):
+        self.end_time = end_time
+
+
+class _FakeTracer:
+    def __init__(self):
+        self.spans: list[_FakeSpan] = []
+
+    def start_span(self, name, start_time=None, attributes=None):
+        span = _FakeSpan(name, start_time, attributes)
+        self.spans.append(span)
+        return span
+
+
+class _FakeHistogram:
+    def __init__(self):
+        self.records: list[tuple[float, dict]] = []
+
+    def record(self, value, attributes=None):
+        self.records.append((value, attributes))
+
+
+class _FakeMeter:
+    def __init__(self):
+        self.histogram = _FakeHistogram()
+
+    def create_histogram(self, name, unit="", description=""):
+        return self.histogram
+
+
+class TestOpenTelemetryObserver:
+    """Tests for forwarding events to OpenTelemetry."""
+
+    def test_event_becomes_span_and_histogram_sample(self):
+        tracer, meter = _FakeTracer(), _FakeMeter()
+        observer = OpenTelemetryObserver(tracer=tracer, meter=meter)
+
+        observer.on_event(
+            TimingEvent(
+                "http.request",
+                started_at=10.0,
+                duration=0.25,
+                attributes={
+                    "method": "GET",
+                    "url": "https://api.example.com/x",
+                    "status_code": 200,
+                    "extra": object(),
+                },
+            )
+        )
+
+        span = tracer.spans[0]
+        assert span.name == "commongrants.http.request"
+        assert span.end_time - span.start_time == 250_000_000
+        assert "extra" not in span.attributes
+        assert meter.histogram.records == [
+            (0.25, {"event": "http.request", "method": "GET", "status_code": 200})
+        ]
@@ -12,9 +12,13 @@ from pydantic import ValidationError
 from common_grants_sdk.client import (
     Client,
     Auth,
+    GetManyResult,
+    LazyListResult,
+    LazySearchResult,
     ListResult,
     ParseFailure,
     SearchResult,
+    SyncResult,
 )
 from common_grants_sdk.client.config import Config
 from common_grants_sdk.client.exceptions import APIError
@@ -34,6 +38,8 @@ from common_grants_sdk.schemas.pydantic.filters.opportunity import (
     StringArray,
 )
 from common_grants_sdk.schemas.pydantic.models.opp_status import OppStatusOptions
+from common_grants_sdk.schemas.pydantic.requests import OpportunitySearchRequest
+from common_grants_sdk.schemas.pydantic.sorting import OppSortBy, OppSorting
 from common_grants_sdk.extensions.specs import CustomFieldSpec
 
 
@@ -280,6 +286,104 @@ class TestOpportunityGet:
         assert "Connection error" in exc_info.value.error.message
 
 
+class TestOpportunityGetMany:
+    """Tests for Opportunity.get_many()."""
+
+    @staticmethod
+    def _by_id(records: dict[str, dict], statuses: dict[str, int] | None = None):
+        """A mock ``get`` serving ``records`` by the ID at the end of the URL."""
+        statuses = statuses or {}
+
+        def respond(url, **kwargs):
+            opp_id = url.rsplit("/", 1)[-1]
+            status = statuses.get(opp_id, 200)
+            mock_resp = Mock()
+            if status != 200:
+                body = {"status": status, "message": "Not found", "errors": []}
+                mock_resp.text = json.dumps(body)
+                mock_resp.raise_for_status = Mock(
+                    side_effect=httpx.HTTPStatusError(
+                        "error", request=Mock(), response=mock_resp
+                    )
+                )
+                return mock_resp
+            mock_resp.raise_for_status = Mock()
+            mock_resp.json = Mock(return_value={"status": 200, "data": records[opp_id]})
+            return mock_resp
+
+        return Mock(side_effect=respond)
+
+    def test_get_many_dedupes_and_keys_by_id(
+        self, client, mock_httpx_client, sample_opportunity_data
+    ):
+        """Duplicate IDs (str or UUID) are fetched once; results keyed by str ID."""
+        first, second = uuid4(), uuid4()
+        records = {
+            str(opp_id): dict(sample_opportunity_data, id=str(opp_id))
+            for opp_id in (first, second)
+        }
+        mock_httpx_client.get = self._by_id(records)
+
+        result = client.opportunities.get_many([first, str(second), str(first)])
+
+        assert isinstance(result, GetManyResult)
+        assert mock_httpx_client.get.call_count == 2
+        assert set(result.items) == {str(first), str(second)}
+        assert all(isinstance(opp, OpportunityBase) for opp in result.items.values())
+        assert result.errors == {}
+        assert result.api_errors == {}
+
+    def test_get_many_collects_api_and_parse_errors(
+        self, client, mock_httpx_client, sample_opportunity_data
+    ):
+        """A failed request or unparseable record is collected, not raised."""
+        good, missing, broken = str(uuid4()), str(uuid4()), str(uuid4())
+        records = {
+            good: dict(sample_opportunity_data, id=good),
+            broken: {"id": broken},
+        }
+        mock_httpx_client.get = self._by_id(records, statuses={missing: 404})
+
+        result = client.opportunities.get_many([good, missing, broken], concurrency=3)
+
+        assert list(result.items) == [good]
+        assert isinstance(result.api_errors[missing], APIError)
+        assert result.api_errors[missing].error.status == 404
+        assert result.errors[broken].index == 2
+        assert result.errors[broken].raw == {"id": broken}
+
+    def test_get_many_collects_network_and_envelope_errors(
+        self, client, mock_httpx_client, sample_opportunity_data
+    ):
+        """A network error or malformed body is recorded for its ID only."""
+        good, offline, malformed = str(uuid4()), str(uuid4()), str(uuid4())
+        serve = self._by_id({good: dict(sample_opportunity_data, id=good)})
+
+        def respond(url, **kwargs):
+            opp_id = url.rsplit("/", 1)[-1]
+            if opp_id == offline:
+                raise httpx.ReadTimeout("timed out")
+            if opp_id == malformed:
+                # A gateway error page, not a CommonGrants error body.
+                mock_resp = Mock(text="<html>Bad Gateway</html>")
+                mock_resp.raise_for_status = Mock(
+                    side_effect=httpx.HTTPStatusError(
+                        "error", request=Mock(), response=mock_resp
+                    )
+                )
+                return mock_resp
+            return serve(url, **kwargs)
+
+        mock_httpx_client.get = Mock(side_effect=respond)
+
+        result = client.opportunities.get_many([good, offline, malformed])
+
+        assert list(result.items) == [good]
+        assert result.api_errors[offline].error.status == 0
+        assert "timed out" in result.api_errors[offline].error.message
+        assert isinstance(result.api_errors[malformed].__cause__, ValidationError)
+
+
 class TestOpportunityList:
     """Tests for Opportunity.list()."""
 
@@ -602,8 +706,8 @@ class TestOpportunityList:
         assert mock_httpx_client.get.call_count == 3
         calls = mock_httpx_client.get.call_args_list
         assert calls[0][1]["params"]["page"] == 1
-        assert calls[1][1]["params"]["page"] == 2
-        assert calls[2][1]["params"]["page"] == 3
+        # Pages 2 and 3 are prefetched concurrently, so their order is not fixed.
+        assert sorted(call[1]["params"]["page"] for call in calls[1:]) == [2, 3]
 
     def test_list_all_opportunities_with_custom_page_size(
         self, client, mock_httpx_client, sample_opportunity_data
@@ -751,6 +855,318 @@ class TestOpportunityList:
         assert exc_info.value.error.status == 500
 
 
+class TestOpportunityIterList:
+    """Tests for Opportunity.iter_list() / iter_search() streaming."""
+
+    @staticmethod
+    def _paged(pages: list[list[dict]]):
+        """A mock transport method serving ``pages`` (1-indexed) by the page param."""
+
+        def respond(*args, **kwargs):
+            page = kwargs["params"]["page"]
+            body = {
+                "status": 200,
+                "message": "Success",
+                "items": pages[page - 1],
+                "paginationInfo": {
+                    "page": page,
+                    "pageSize": 2,
+                    "totalItems": sum(len(p) for p in pages),
+                    "totalPages": len(pages),
+                },
+                "sortInfo": {"sortBy": "lastModifiedAt", "sortOrder": "desc"},
+                "filterInfo": {"filters": {}, "errors": []},
+            }
+            mock_resp = Mock()
+            mock_resp.raise_for_status = Mock()
+            mock_resp.json = Mock(return_value=body)
+            return mock_resp
+
+        return Mock(side_effect=respond)
+
+    def test_iter_list_fetches_lazily_page_by_page(
+        self, client, mock_httpx_client, sample_opportunity_data
+    ):
+        """The first row is yielded after one request; later pages are fetched
+        only as the stream is consumed."""
+        mock_httpx_client.get = self._paged(
+            [[sample_opportunity_data] * 2, [sample_opportunity_data] * 2]
+        )
+
+        stream = client.opportunities.iter_list()
+        first = next(stream)
+
+        assert isinstance(first, OpportunityBase)
+        assert mock_httpx_client.get.call_count == 1
+        assert len(list(stream)) == 3
+        assert mock_httpx_client.get.call_count == 2
+
+    def test_iter_list_yields_failures_with_stream_index(
+        self, client, mock_httpx_client, sample_opportunity_data
+    ):
+        """A bad row is yielded in place as a ParseFailure indexed across pages."""
+        mock_httpx_client.get = self._paged(
+            [
+                [sample_opportunity_data] * 2,
+                [sample_opportunity_data, {"id": "not-a-uuid"}],
+            ]
+        )
+
+        rows = list(client.opportunities.iter_list())
+
+        assert [isinstance(row, ParseFailure) for row in rows] == [
+            False,
+            False,
+            False,
+            True,
+        ]
+        assert rows[3].index == 3
+        assert rows[3].raw == {"id": "not-a-uuid"}
+
+    def test_iter_search_reuses_one_request_body(
+        self, client, mock_httpx_client, sample_opportunity_data
+    ):
+        """Filters are classified once; every page POSTs the same body."""
+        mock_httpx_client.post = self._paged(
+            [[sample_opportunity_data] * 2, [sample_opportunity_data]]
+        )
+
+        rows = list(
+            client.opportunities.iter_search(
+                search="health",
+                filters={"status": {"operator": "in", "value": ["open"]}},
+            )
+        )
+
+        assert len(rows) == 3
+        calls = mock_httpx_client.post.call_args_list
+        assert [call[1]["params"]["page"] for call in calls] == [1, 2]
+        assert calls[0][1]["json"] == calls[1][1]["json"]
+        assert calls[0][1]["json"]["filters"]["status"]["value"] == ["open"]
+
+    def test_iter_search_sends_sorting(
+        self, client, mock_httpx_client, sample_opportunity_data
+    ):
+        mock_httpx_client.post = self._paged([[sample_opportunity_data]])
+        sorting = OppSorting(sortBy=OppSortBy.CLOSE_DATE, sortOrder="asc")
+
+        list(client.opportunities.iter_search(search="health", sorting=sorting))
+
+        assert mock_httpx_client.post.call_args[1]["json"]["sorting"] == {
+            "sortBy": "keyDates.closeDate",
+            "sortOrder": "asc",
+        }
+
+    def test_iter_search_invalid_filter_raises_before_request(
+        self, client, mock_httpx_client
+    ):
+        mock_httpx_client.post = Mock()
+
+        with pytest.raises(FilterError):
+            next(
+                client.opportunities.iter_search(
+                    filters={"status": {"operator": "in", "value": "open"}}
+                )
+            )
+        mock_httpx_client.post.assert_not_called()
+
+
+class TestOpportunityFields:
+    """Tests for sparse fieldsets on Opportunity.list() / search()."""
+
+    def test_list_sends_fields_and_parses_projection(
+        self, client, mock_httpx_client, sample_list_response
+    ):
+        mock_response = Mock()
+        mock_response.raise_for_status = Mock()
+        mock_response.json = Mock(return_value=sample_list_response)
+        mock_httpx_client.get = Mock(return_value=mock_response)
+
+        result = client.opportunities.list(
+            page=1, fields=["title", "id", "lastModifiedAt"]
+        )
+
+        params = mock_httpx_client.get.call_args[1]["params"]
+        assert params["fields"] == "lastModifiedAt,id,title"
+        assert params["page"] == 1
+        # The server ignored the fieldset; the extra fields are not parsed.
+        assert len(result.items) == 2
+        assert type(result.items[0]).projected_fields == (
+            "last_modified_at",
+            "id",
+            "title",
+        )
+        assert result.items[0].description is None
+        assert result.errors == []
+
+    def test_search_sends_fields_as_query_param(
+        self, client, mock_httpx_client, sample_search_response
+    ):
+        sample_search_response["items"] = [
+            {"id": item["id"], "title": item["title"]}
+            for item in sample_search_response["items"]
+        ]
+        mock_response = Mock()
+        mock_response.raise_for_status = Mock()
+        mock_response.json = Mock(return_value=sample_search_response)
+        mock_httpx_client.post = Mock(return_value=mock_response)
+
+        result = client.opportunities.search(
+            search="health", page=1, fields=["id", "title"]
+        )
+
+        call = mock_httpx_client.post.call_args[1]
+        assert call["params"]["fields"] == "id,title"
+        assert "fields" not in call["json"]
+        # Rows trimmed by the server parse into the projection.
+        assert [item.title for item in result.items] == ["Test Opportunity"] * 2
+        assert result.errors == []
+
+    def test_without_fields_no_param_is_sent(
+        self, client, mock_httpx_client, sample_list_response
+    ):
+        mock_response = Mock()
+        mock_response.raise_for_status = Mock()
+        mock_response.json = Mock(return_value=sample_list_response)
+        mock_httpx_client.get = Mock(return_value=mock_response)
+
+        client.opportunities.list(page=1)
+
+        assert "fields" not in mock_httpx_client.get.call_args[1]["params"]
+
+    def test_search_lazy_sends_sorting(
+        self, client, mock_httpx_client, sample_search_response
+    ):
+        mock_response = Mock()
+        mock_response.raise_for_status = Mock()
+        mock_response.json = Mock(return_value=sample_search_response)
+        mock_httpx_client.post = Mock(return_value=mock_response)
+        sorting = OppSorting(sortBy=OppSortBy.CLOSE_DATE, sortOrder="asc")
+
+        client.opportunities.search_lazy(search="health", page=1, sorting=sorting)
+
+        assert mock_httpx_client.post.call_args[1]["json"]["sorting"] == {
+            "sortBy": "keyDates.closeDate",
+            "sortOrder": "asc",
+        }
+
+    def test_unknown_field_raises_before_request(self, client, mock_httpx_client):
+        mock_httpx_client.post = Mock()
+
+        with pytest.raises(ValueError, match="Unknown field"):
+            client.opportunities.search(fields=["nope"])
+        mock_httpx_client.post.assert_not_called()
+
+
+class TestOpportunityLazy:
+    """Tests for Opportunity.list_lazy() / search_lazy()."""
+
+    def test_list_lazy_validates_rows_on_first_access(
+        self, client, mock_httpx_client, sample_list_response
+    ):
+        sample_list_response["items"].append({"id": "not-a-uuid"})
+        mock_response = Mock()
+        mock_response.raise_for_status = Mock()
+        mock_response.json = Mock(return_value=sample_list_response)
+        mock_httpx_client.get = Mock(return_value=mock_response)
+
+        result = client.opportunities.list_lazy(page=1)
+
+        assert isinstance(result, LazyListResult)
+        assert len(result.rows) == 3
+        first = result.rows[0]
+        assert isinstance(first, OpportunityBase)
+        assert result.rows[0] is first
+        assert isinstance(result.rows[2], ParseFailure)
+        assert result.rows[2].index == 2
+
+    def test_search_lazy_projects_fields(
+        self, client, mock_httpx_client, sample_search_response
+    ):
+        mock_response = Mock()
+        mock_response.raise_for_status = Mock()
+        mock_response.json = Mock(return_value=sample_search_response)
+        mock_httpx_client.post = Mock(return_value=mock_response)
+
+        result = client.opportunities.search_lazy(
+            search="health", page=1, fields=["id", "title"]
+        )
+
+        assert isinstance(result, LazySearchResult)
+        row = result.rows[0]
+        assert type(row).projected_fields == ("id", "title")
+        assert row.title == "Test Opportunity"
+        assert result.filter_info.filters == {}
+        call = mock_httpx_client.post.call_args[1]
+        assert call["json"]["search"] == "health"
+        assert call["params"]["fields"] == "id,title"
+
+    def test_unknown_field_raises_before_request(self, client, mock_httpx_client):
+        mock_httpx_client.get = Mock()
+
+        with pytest.raises(ValueError, match="Unknown field"):
+            client.opportunities.list_lazy(fields=["nope"])
+        mock_httpx_client.get.assert_not_called()
+
+
+class TestOpportunitySyncSince:
+    """Tests for Opportunity.sync_since() delta sync."""
+
+    @staticmethod
+    def _rows(sample_opportunity_data, days: list[int]) -> list[dict]:
+        """Rows last modified on the given days of January 2025 (newest first)."""
+        return [
+            dict(
+                sample_opportunity_data,
+                id=str(uuid4()),
+                lastModifiedAt=f"2025-01-{day:02d}T00:00:00Z",
+            )
+            for day in days
+        ]
+
+    def test_stops_at_watermark_and_returns_newest(
+        self, client, mock_httpx_client, sample_opportunity_data
+    ):
+        rows = self._rows(sample_opportunity_data, [9, 8, 7, 5, 4, 3])
+        mock_httpx_client.post = TestOpportunityIterList._paged(
+            [rows[0:2], rows[2:4], rows[4:6]]
+        )
+
+        result = client.opportunities.sync_since(datetime(2025, 1, 7, tzinfo=UTC))
+
+        assert isinstance(result, SyncResult)
+        # The row modified exactly at the watermark is included again.
+        assert [opp.last_modified_at.day for opp in result.items] == [9, 8, 7]
+        assert result.watermark == datetime(2025, 1, 9, tzinfo=UTC)
+        # Page 3 is never requested: page 2 already crossed the watermark.
+        assert mock_httpx_client.post.call_count == 2
+
+    def test_nothing_changed_keeps_watermark(
+        self, client, mock_httpx_client, sample_opportunity_data
+    ):
+        rows = self._rows(sample_opportunity_data, [3, 2])
+        mock_httpx_client.post = TestOpportunityIterList._paged([rows])
+        watermark = datetime(2025, 1, 5)  # naive: taken as UTC
+
+        result = client.opportunities.sync_since(watermark)
+
+        assert result.items == []
+        assert result.watermark == datetime(2025, 1, 5, tzinfo=UTC)
+
+    def test_full_sync_without_watermark_collects_failures(
+        self, client, mock_httpx_client, sample_opportunity_data
+    ):
+        rows = self._rows(sample_opportunity_data, [4, 3])
+        rows.insert(1, {"id": "bad", "lastModifiedAt": "2025-01-04T00:00:00Z"})
+        mock_httpx_client.post = TestOpportunityIterList._paged([rows[:2], rows[2:]])
+
+        result = client.opportunities.sync_since(None)
+
+        assert len(result.items) == 2
+        assert [failure.index for failure in result.errors] == [1]
+        assert result.watermark == datetime(2025, 1, 4, tzinfo=UTC)
+
+
 class TestOpportunitySearch:
     """Tests for Opportunity.search()"""
 
@@ -1334,8 +1750,8 @@ class TestOpportunitySearch:
         assert mock_httpx_client.post.call_count == 3
         calls = mock_httpx_client.post.call_args_list
         assert calls[0][1]["params"]["page"] == 1
-        assert calls[1][1]["params"]["page"] == 2
-        assert calls[2][1]["params"]["page"] == 3
+        # Pages 2 and 3 are prefetched concurrently, so their order is not fixed.
+        assert sorted(call[1]["params"]["page"] for call in calls[1:]) == [2, 3]
 
     def test_search_all_opportunities_empty_result(self, client, mock_httpx_client):
         """Test fetching all opportunities when there are no results."""
@@ -1456,3 +1872,42 @@ class TestOpportunitySearch:
         # httpx encodes json= with the stdlib encoder, which rejects datetime.date.
         json.dumps(body)
         assert body["filters"]["closeDateRange"]["value"]["min"] == "2026-01-01"
+
+    @pytest.mark.parametrize(
+        ("status", "filters", "sorting"),
+        [
+            (None, None, None),
+            ([OppStatusOptions.OPEN, OppStatusOptions.FORECASTED], None, None),
+            (
+                None,
+                {
+                    "status": {"operator": "in", "value": ["open"]},
+                    "close_date_range": {
+                        "operator": "between",
+                        "value": {"min": "2026-01-01"},
+                    },
+                    "agency": {"operator": "in", "value": ["NSF"]},
+                    "legacyTag": {"operator": "eq", "value": "priority"},
+                },
+                OppSorting(sortBy=OppSortBy.CLOSE_DATE, sortOrder="asc"),
+            ),
+        ],
+    )
+    def test_search_body_matches_validated_request(self, status, filters, sorting):
+        """The body assembled from validated parts is the OpportunitySearchRequest wire.
+
+        The search body is no longer round-tripped through the request model;
+        this pins it to what that round trip would send, key order included.
+        """
+        client = AGENCY_PLUGIN.get_client(
+            Config(base_url="https://api.example.com", api_key="test-key")
+        )
+
+        body, _ = client.opportunities._search_request(
+            "local", status, filters, sorting
+        )
+
+        validated = OpportunitySearchRequest.model_validate(body).model_dump(
+            by_alias=True, exclude_unset=True, mode="json"
+        )
+        assert json.dumps(body) == json.dumps(validated)
@@ -0,0 +1,169 @@
+"""Tests for prepared searches."""
+
+import asyncio
+import dataclasses
+import json
+
+import httpx
+import pytest
+
+from common_grants_sdk.client import AsyncClient, PreparedSearch
+from common_grants_sdk.client.cache import ResponseCache
+from common_grants_sdk.extensions import FilterError, f
+from common_grants_sdk.schemas.pydantic.filters.opportunity import OppFilters
+from common_grants_sdk.schemas.pydantic.sorting import OppSortBy, OppSorting
+
+from .conftest import page_body
+
+FILTERS = {
+    "status": f.in_(["open"]),
+    "closeDateRange": f.between("2026-01-01", "2026-12-31"),
+    "legacyTag": f.eq("priority"),
+}
+
+
+def _recording(seen: list[httpx.Request]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(
+            200,
+            json=page_body(
+                [],
+                page=int(request.url.params["page"]),
+                total_pages=2,
+                page_size=10,
+                total_items=0,
+            ),
+        )
+
+    return handler
+
+
+class TestPreparedSearch:
+    """Tests for the PreparedSearch value."""
+
+    def test_equal_searches_hash_alike(self, make_client):
+        client = make_client(_recording([]))
+        sorting = OppSorting(sortBy=OppSortBy.CLOSE_DATE, sortOrder="asc")
+
+        first = client.opportunities.prepare("health", filters=FILTERS, sorting=sorting)
+        second = client.opportunities.prepare(
+            "health", filters=FILTERS, sorting=sorting
+        )
+        other = client.opportunities.prepare("housing", filters=FILTERS)
+
+        assert first == second
+        assert len({first, second, other}) == 2
+        assert first.key == second.key != other.key
+
+    def test_is_immutable(self, make_client):
+        prepared = make_client(_recording([])).opportunities.prepare("health")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            prepared.body = b"{}"  # type: ignore[misc]
+        prepared.request_data()["search"] = "changed"
+        assert prepared.request_data()["search"] == "health"
+
+    def test_filters_are_the_classified_filters(self, make_client):
+        prepared = make_client(_recording([])).opportunities.prepare(filters=FILTERS)
+
+        filters = prepared.filters
+        assert isinstance(filters, OppFilters)
+        assert filters.status is not None
+        assert filters.custom_filters is not None
+        assert "legacyTag" in filters.custom_filters
+        assert PreparedSearch.from_request({"search": ""}).filters is None
+
+    def test_filters_are_decoded_once(self, make_client, monkeypatch):
+        prepared = make_client(_recording([])).opportunities.prepare(filters=FILTERS)
+        filters = prepared.filters
+
+        def validate(*args, **kwargs):
+            raise AssertionError("prepared filters are not validated again")
+
+        monkeypatch.setattr(OppFilters, "model_validate", validate)
+        assert prepared.filters is filters
+        assert prepared.filters_body is prepared.filters_body
+
+    def test_invalid_filter_raises_at_prepare(self, make_client):
+        client = make_client(_recording([]))
+        with pytest.raises(FilterError):
+            client.opportunities.prepare(filters={"status": f.eq("open")})
+
+
+class TestSearchPrepared:
+    """Tests for running prepared searches."""
+
+    def test_sends_the_same_body_as_search(self, make_client):
+        seen: list[httpx.Request] = []
+        client = make_client(_recording(seen))
+
+        client.opportunities.search("health", page=1, filters=FILTERS)
+        prepared = client.opportunities.prepare("health", filters=FILTERS)
+        client.opportunities.search_prepared(prepared, page=1)
+
+        assert json.loads(seen[0].content) == json.loads(seen[1].content)
+
+    def test_sends_the_prepared_bytes(self, make_client):
+        seen: list[httpx.Request] = []
+        client = make_client(_recording(seen))
+        prepared = client.opportunities.prepare("health", filters=FILTERS)
+
+        result = client.opportunities.search_prepared(prepared, page=1)
+
+        assert seen[0].content == prepared.body
+        assert seen[0].headers["Content-Type"] == "application/json"
+        assert result.filter_info.filters == prepared.filters_body
+
+    def test_cached_on_the_prepared_bytes(self, make_client):
+        seen: list[httpx.Request] = []
+        client = make_client(_recording(seen), cache=ResponseCache())
+        prepared = client.opportunities.prepare("health", filters=FILTERS)
+        other = client.opportunities.prepare("housing", filters=FILTERS)
+
+        client.opportunities.search_prepared(prepared, page=1)
+        client.opportunities.search_prepared(prepared, page=1)
+        client.opportunities.search_prepared(other, page=1)
+
+        assert [json.loads(request.content)["search"] for request in seen] == [
+            "health",
+            "housing",
+        ]
+
+    def test_runs_any_page_without_classifying_again(self, monkeypatch, make_client):
+        seen: list[httpx.Request] = []
+        client = make_client(_recording(seen))
+        prepared = client.opportunities.prepare("health", filters=FILTERS)
+
+        def classify(filters):
+            raise AssertionError("prepared searches are not classified again")
+
+        monkeypatch.setattr(client._search_classifier, "classify", classify)
+        first = client.opportunities.search_prepared(prepared, page=1)
+        second = client.opportunities.search_prepared(prepared, page=2, page_size=5)
+
+        assert [request.url.params["page"] for request in seen] == ["1", "2"]
+        assert seen[1].url.params["pageSize"] == "5"
+        assert seen[0].content == seen[1].content
+        assert first.pagination_info.page == 1
+        assert second.pagination_info.page == 2
+
+    def test_async(self, make_client):
+        seen: list[httpx.Request] = []
+
+        async def run():
+            async with make_client(_recording(seen), AsyncClient) as client:
+                prepared = client.opportunities.prepare("health", filters=FILTERS)
+                return await client.opportunities.search_prepared(
+                    prepared, page=2, fields=["id", "title"]
+                )
+
+        result = asyncio.run(run())
+
+        assert result.pagination_info.page == 2
+        assert seen[0].headers["Content-Type"] == "application/json"
+        assert seen[0].url.params["fields"] == "id,title"
+        assert json.loads(seen[0].content)["filters"]["customFilters"]["legacyTag"] == {
+            "operator": "eq",
+            "value": "priority",
+        }
@@ -0,0 +1,89 @@
+"""Tests for projected Opportunity models."""
+
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+from pydantic import field_validator
+
+from common_grants_sdk.client.projection import (
+    fields_param,
+    projected_model,
+    projection_fields,
+)
+from common_grants_sdk.schemas.pydantic.models import OpportunityBase
+
+
+def _row(**overrides) -> dict:
+    now = datetime.now(UTC).isoformat()
+    row = {
+        "id": str(uuid4()),
+        "title": "Test Opportunity",
+        "description": "Test description",
+        "status": {"value": "open"},
+        "createdAt": now,
+        "lastModifiedAt": now,
+    }
+    row.update(overrides)
+    return row
+
+
+class _ShoutedTitle(OpportunityBase):
+    @field_validator("title")
+    @classmethod
+    def _shout(cls, title: str) -> str:
+        return title.upper()
+
+
+class TestProjectionFields:
+    """Tests for field-name normalization."""
+
+    def test_aliases_and_names_normalize_to_schema_order(self):
+        assert projection_fields(
+            OpportunityBase, ["lastModifiedAt", "title", "id"]
+        ) == ("last_modified_at", "id", "title")
+
+    def test_fields_param_uses_wire_names(self):
+        assert fields_param(OpportunityBase, ["title", "key_dates"]) == "title,keyDates"
+
+    def test_unknown_field_rejected(self):
+        with pytest.raises(ValueError, match="Unknown field 'nope'"):
+            projection_fields(OpportunityBase, ["id", "nope"])
+
+
+class TestProjectedModel:
+    """Tests for models holding a subset of a schema's fields."""
+
+    def test_validates_only_selected_fields(self):
+        model = projected_model(OpportunityBase, ["id", "title"])
+
+        # A bad description would fail OpportunityBase, but is not projected.
+        item = model.model_validate(_row(description=None))
+
+        assert item.title == "Test Opportunity"
+        assert model.projected_fields == ("id", "title")
+        assert item.description is None
+        assert isinstance(item, OpportunityBase)
+
+    def test_selected_fields_still_validated(self):
+        model = projected_model(OpportunityBase, ["id"])
+        with pytest.raises(ValueError):
+            model.model_validate(_row(id="not-a-uuid"))
+
+    def test_keeps_the_schema_validators(self):
+        model = projected_model(_ShoutedTitle, ["id", "title"])
+
+        item = model.model_validate(_row(title="quiet"))
+
+        assert item.title == "QUIET"
+        assert isinstance(item, _ShoutedTitle)
+
+    def test_dumps_only_projected_fields_with_wire_aliases(self):
+        model = projected_model(OpportunityBase, ["lastModifiedAt"])
+        item = model.model_validate(_row())
+        assert set(item.model_dump(by_alias=True)) == {"lastModifiedAt"}
+
+    def test_equivalent_field_lists_share_one_model(self):
+        assert projected_model(OpportunityBase, ["title", "id"]) is projected_model(
+            OpportunityBase, ["id", "title"]
+        )
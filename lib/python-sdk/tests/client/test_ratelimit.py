@@ -0,0 +1,128 @@
+"""Tests for the client-side rate limiter."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from common_grants_sdk.client import AsyncClient
+from common_grants_sdk.client.config import Config
+from common_grants_sdk.client.ratelimit import RateLimiter
+
+
+class _Peak:
+    """Tracks the most requests a handler saw in progress at once."""
+
+    def __init__(self):
+        self.current = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def enter(self):
+        with self._lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+
+    def leave(self):
+        with self._lock:
+            self.current -= 1
+
+
+class TestTokenBucket:
+    """Tests for RateLimiter pacing."""
+
+    def test_burst_then_paced(self):
+        limiter = RateLimiter(rate=10, burst=2)
+
+        waits = [limiter._reserve() for _ in range(4)]
+
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2] == pytest.approx(0.1, abs=0.01)
+        assert waits[3] == pytest.approx(0.2, abs=0.01)
+
+    def test_burst_defaults_to_rate(self):
+        assert RateLimiter(rate=2.5).burst == 3
+        assert RateLimiter(max_in_flight=4).burst == 1
+
+    def test_retry_after_pauses_everyone(self):
+        limiter = RateLimiter(rate=100)
+        limiter.observe(httpx.Response(429, headers={"Retry-After": "2"}))
+
+        assert limiter._reserve() == pytest.approx(2.0, abs=0.05)
+
+    def test_invalid_limits(self):
+        with pytest.raises(ValueError, match="rate must be positive"):
+            RateLimiter(rate=0)
+        with pytest.raises(ValueError, match="max_in_flight must be at least 1"):
+            RateLimiter(max_in_flight=0)
+
+
+class TestClientRateLimit:
+    """Tests for rate-limited requests through the clients."""
+
+    def test_max_in_flight_is_shared_across_clients_and_threads(self, make_client):
+        limiter = RateLimiter(max_in_flight=2)
+        peak = _Peak()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            peak.enter()
+            time.sleep(0.02)
+            peak.leave()
+            return httpx.Response(200, json={"ok": True})
+
+        clients = [make_client(handler, rate_limit=limiter) for _ in range(3)]
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            list(pool.map(lambda n: clients[n % 3].get("/things"), range(12)))
+
+        assert peak.peak == 2
+
+    def test_requests_are_paced(self, make_client):
+        client = make_client(
+            lambda request: httpx.Response(200, json={}),
+            rate_limit=RateLimiter(rate=50, burst=1),
+        )
+
+        start = time.monotonic()
+        for _ in range(4):
+            client.get("/things")
+
+        assert time.monotonic() - start >= 0.05
+
+    def test_async_client_respects_max_in_flight(self, make_client):
+        limiter = RateLimiter(max_in_flight=3)
+        peak = _Peak()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            peak.enter()
+            await asyncio.sleep(0.01)
+            peak.leave()
+            return httpx.Response(200, json={"ok": True})
+
+        async def run():
+            async with make_client(handler, AsyncClient, rate_limit=limiter) as client:
+                await asyncio.gather(*(client.get("/things") for _ in range(10)))
+
+        asyncio.run(run())
+        assert peak.peak == 3
+
+
+class TestConfigRateLimit:
+    """Tests for configuring the limiter from the environment."""
+
+    def test_env_limiter_is_shared(self, monkeypatch):
+        monkeypatch.setenv("CG_API_RATE_LIMIT", "5")
+        monkeypatch.setenv("CG_API_MAX_IN_FLIGHT", "2")
+        first = Config(base_url="https://api.example.com", api_key="key")
+        second = Config(base_url="https://api.example.com", api_key="key")
+
+        assert first.rate_limit is not None
+        assert first.rate_limit is second.rate_limit
+        assert first.rate_limit.rate == 5.0
+        assert first.rate_limit.max_in_flight == 2
+
+    def test_off_by_default(self):
+        config = Config(base_url="https://api.example.com", api_key="key")
+        assert config.rate_limit is None
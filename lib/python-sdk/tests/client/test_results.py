@@ -1,8 +1,10 @@
 """Tests for parse_batch row-level error partitioning."""
 
-from pydantic import BaseModel
+import pytest
+from pydantic import BaseModel, ValidationError
 
-from common_grants_sdk.client import ParseFailure, parse_batch
+from common_grants_sdk.client import LazyRows, ParseFailure, parse_batch
+from common_grants_sdk.client.results import iter_batch
 
 
 class _Row(BaseModel):
@@ -25,3 +27,56 @@ def test_parse_batch_all_valid_has_no_errors():
     items, errors = parse_batch([{"n": 1}, {"n": 2}], _Row)
     assert [item.n for item in items] == [1, 2]
     assert errors == []
+
+
+def test_iter_batch_keeps_row_order_and_offsets_failures():
+    rows = list(iter_batch([{"n": 1}, {"n": "bad"}, {"n": 3}], _Row, offset=10))
+
+    assert rows[0] == _Row(n=1)
+    assert isinstance(rows[1], ParseFailure)
+    assert rows[1].index == 11
+    assert rows[2] == _Row(n=3)
+
+
+def test_parse_batch_localizes_several_failures_like_per_row_validation():
+    rows = [{"n": "a"}, {"n": 2}, {"n": 3}, {}, {"n": 5}]
+
+    items, errors = parse_batch(rows, _Row)
+
+    assert [item.n for item in items] == [2, 3, 5]
+    assert [error.index for error in errors] == [0, 3]
+    # Messages match validating the row on its own, not the batch's list path.
+    for error in errors:
+        with pytest.raises(ValidationError) as exc_info:
+            _Row.model_validate(error.raw)
+        assert error.message == str(exc_info.value)
+
+
+def test_parse_batch_accepts_already_parsed_rows():
+    row = _Row(n=1)
+
+    items, errors = parse_batch([row, {"n": 2}], _Row)
+
+    assert items[0] is row
+    assert errors == []
+
+
+def test_lazy_rows_validate_each_row_once_on_access():
+    rows = LazyRows([{"n": 1}, {"n": "bad"}, {"n": 3}], _Row)
+
+    first = rows[0]
+    assert first == _Row(n=1)
+    assert rows[0] is first
+    assert rows._parsed[2] is None  # never read, never validated
+    assert isinstance(rows[-2], ParseFailure)
+    assert rows[-2].index == 1
+    assert rows.raw(1) == {"n": "bad"}
+
+
+def test_lazy_rows_slice_and_materialize():
+    rows = LazyRows([{"n": 1}, {"n": "bad"}, {"n": 3}], _Row)
+
+    assert rows[::2] == [_Row(n=1), _Row(n=3)]
+    items, errors = rows.materialize()
+    assert [item.n for item in items] == [1, 3]
+    assert [error.index for error in errors] == [1]
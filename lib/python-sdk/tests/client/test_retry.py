@@ -0,0 +1,202 @@
+"""Tests for the retry policy and retrying client requests."""
+
+import asyncio
+from email.utils import format_datetime
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from common_grants_sdk.client import AsyncClient
+from common_grants_sdk.client.exceptions import APIError
+from common_grants_sdk.client.retry import RetryPolicy
+
+from .conftest import page_body
+
+NO_WAIT = RetryPolicy(backoff=0, jitter=False)
+
+
+def _overloaded(status: int = 503, **headers: str) -> httpx.Response:
+    return httpx.Response(
+        status,
+        headers=headers,
+        json={"status": status, "message": "Overloaded", "errors": []},
+    )
+
+
+class TestRetryPolicy:
+    """Tests for RetryPolicy delay computation."""
+
+    def test_backoff_doubles_up_to_max(self):
+        policy = RetryPolicy(backoff=1.0, max_backoff=3.0, jitter=False)
+        assert [policy.delay(n) for n in (1, 2, 3, 4)] == [1.0, 2.0, 3.0, 3.0]
+
+    def test_jitter_stays_within_backoff(self):
+        policy = RetryPolicy(backoff=1.0)
+        assert all(0 <= policy.delay(3) <= 4.0 for _ in range(50))
+
+    def test_retry_after_seconds_and_http_date(self):
+        policy = RetryPolicy(jitter=False)
+        assert policy.delay(1, _overloaded(429, **{"Retry-After": "7"})) == 7.0
+
+        when = format_datetime(datetime.now(UTC) + timedelta(seconds=30), usegmt=True)
+        delay = policy.delay(1, _overloaded(503, **{"Retry-After": when}))
+        assert 28.0 <= delay <= 30.0
+
+    def test_invalid_max_attempts(self):
+        with pytest.raises(ValueError, match="max_attempts must be at least 1"):
+            RetryPolicy(max_attempts=0)
+
+
+class TestClientRetry:
+    """Tests for retries through BaseClient/AsyncBaseClient requests."""
+
+    def test_transient_failure_mid_pagination_retries_that_page(self, make_client):
+        calls: list[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            page = int(request.url.params["page"])
+            calls.append(page)
+            if page == 3 and calls.count(3) == 1:
+                return _overloaded(503)
+            return httpx.Response(
+                200, json=page_body([{"page": page}], page=page, total_pages=4)
+            )
+
+        result = make_client(handler, retry=NO_WAIT, max_concurrency=1).list("/items")
+
+        assert [item["page"] for item in result.items] == [1, 2, 3, 4]
+        assert calls == [1, 2, 3, 3, 4]
+
+    def test_search_post_is_retried(self, make_client):
+        attempts = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            attempts.append(request)
+            if len(attempts) == 1:
+                raise httpx.ConnectError("connection reset", request=request)
+            return httpx.Response(200, json=page_body([{"page": 1}]))
+
+        result = make_client(handler, retry=NO_WAIT, max_concurrency=1).search(
+            "/items/search", {}, page=1
+        )
+
+        assert len(result.items) == 1
+        assert len(attempts) == 2
+
+    def test_plain_post_is_not_retried(self, make_client):
+        attempts = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            attempts.append(request)
+            return _overloaded(503)
+
+        response = make_client(handler, retry=NO_WAIT).post("/items", json={})
+
+        assert response.status_code == 503
+        assert len(attempts) == 1
+
+    def test_gives_up_after_max_attempts(self, make_client):
+        attempts = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            attempts.append(request)
+            return _overloaded(503)
+
+        with pytest.raises(APIError) as exc_info:
+            make_client(handler, retry=NO_WAIT).get_item("/items", "abc")
+
+        assert exc_info.value.error.status == 503
+        assert len(attempts) == NO_WAIT.max_attempts
+
+    def test_non_retryable_status_fails_immediately(self, make_client):
+        attempts = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            attempts.append(request)
+            return _overloaded(404)
+
+        with pytest.raises(APIError):
+            make_client(handler, retry=NO_WAIT).get_item("/items", "abc")
+        assert len(attempts) == 1
+
+    @pytest.mark.parametrize(
+        "error", [httpx.ReadTimeout, httpx.ConnectError, httpx.RemoteProtocolError]
+    )
+    def test_transient_network_errors_are_retried(self, make_client, error):
+        attempts = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            attempts.append(request)
+            if len(attempts) == 1:
+                raise error("flaky network", request=request)
+            return httpx.Response(200, json={"status": 200, "data": {}})
+
+        make_client(handler, retry=NO_WAIT).get_item("/items", "abc")
+
+        assert len(attempts) == 2
+
+    @pytest.mark.parametrize(
+        "error", [httpx.UnsupportedProtocol, httpx.ProxyError, httpx.WriteError]
+    )
+    def test_other_network_errors_fail_immediately(self, make_client, error):
+        attempts = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            attempts.append(request)
+            raise error("not transient", request=request)
+
+        with pytest.raises(APIError, match="not transient"):
+            make_client(handler, retry=NO_WAIT).get_item("/items", "abc")
+        assert len(attempts) == 1
+
+    def test_waits_retry_after_within_budget(self, make_client):
+        responses = iter(
+            [
+                _overloaded(429, **{"Retry-After": "2"}),
+                _overloaded(429, **{"Retry-After": "2"}),
+                httpx.Response(200, json={"status": 200, "data": {}}),
+            ]
+        )
+        policy = RetryPolicy(max_attempts=5, budget=3.0)
+
+        with patch("common_grants_sdk.client.retry.time.sleep") as sleep:
+            with pytest.raises(APIError) as exc_info:
+                make_client(lambda request: next(responses), retry=policy).get_item(
+                    "/items", "abc"
+                )
+
+        # The second 2s wait would exceed the 3s budget, so the 429 is final.
+        sleep.assert_called_once_with(2.0)
+        assert exc_info.value.error.status == 429
+
+    def test_retry_off_by_default(self, make_client):
+        attempts = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            attempts.append(request)
+            return _overloaded(503)
+
+        with pytest.raises(APIError):
+            make_client(handler, retry=None).get_item("/items", "abc")
+        assert len(attempts) == 1
+
+    def test_async_client_retries(self, make_client):
+        attempts = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            attempts.append(request)
+            if len(attempts) < 3:
+                return _overloaded(502)
+            return httpx.Response(200, json=page_body([{"page": 1}]))
+
+        async def run():
+            async with make_client(
+                handler, AsyncClient, retry=NO_WAIT, max_concurrency=1
+            ) as client:
+                return await client.search("/items/search", {}, page=1)
+
+        result = asyncio.run(run())
+        assert len(result.items) == 1
+        assert len(attempts) == 3
@@ -11,7 +11,10 @@ from pydantic import ValidationError
 
 from common_grants_sdk.extensions import PluginRoutes, ResourceRoutes
 from common_grants_sdk.extensions.filters import (
+    AD_HOC_VALUE_EXPECTATION,
+    VALID_FILTER_MODELS,
     classify_filters,
+    compile_classifier,
     f,
     validate_filter_call,
     validate_routes,
@@ -521,6 +524,75 @@ def test_classify_unmatched_route_treats_registered_name_as_adhoc(resource, meth
     assert exc.value.path == "filters.agency"
 
 
+# ---------------------------------------------------------------------------
+# compile_classifier: memoized per (routes, resource, method)
+# ---------------------------------------------------------------------------
+
+
+def test_compile_classifier_is_memoized_per_route():
+    """Equal routes share one compiled classifier; other methods get their own."""
+    routes = PluginRoutes(opportunities=ResourceRoutes(search=OppSearchFilters))
+    classifier = compile_classifier(SAMPLE_ROUTES, "opportunities", "search")
+
+    assert compile_classifier(routes, "opportunities", "search") is classifier
+    assert compile_classifier(SAMPLE_ROUTES, "opportunities", "list") is not classifier
+    assert set(classifier.registered) == {"agency", "fundingProgram"}
+
+
+def test_compiled_classifier_matches_classify_filters():
+    """The compiled classifier buckets filters exactly as classify_filters does."""
+    filters = {
+        "status": f.in_(["open"]),
+        "closeDateRange": f.between("2026-01-01", "2026-12-31"),
+        "agency": f.in_(["NSF"]),
+        "legacyTag": f.eq("priority"),
+    }
+    classifier = compile_classifier(SAMPLE_ROUTES, "opportunities", "search")
+
+    assert classifier.classify(filters) == classify_filters(
+        SAMPLE_ROUTES, "opportunities", "search", filters
+    )
+
+
+def test_classify_default_fields_match_a_validated_opp_filters():
+    """Standard filters, validated once per field, equal a fully validated OppFilters."""
+    filters = {
+        "status": {"operator": "in", "value": ["open"]},
+        "close_date_range": {
+            "operator": "between",
+            "value": {"min": "2026-01-01", "max": "2026-12-31"},
+        },
+        "maxAwardAmountRange": {
+            "operator": "between",
+            "value": {
+                "min": {"amount": "1", "currency": "USD"},
+                "max": {"amount": "9", "currency": "USD"},
+            },
+        },
+    }
+    result = classify_filters(SAMPLE_ROUTES, "opportunities", "search", filters)
+
+    expected = OppFilters.model_validate(
+        {
+            "status": filters["status"],
+            "closeDateRange": filters["close_date_range"],
+            "maxAwardAmountRange": filters["maxAwardAmountRange"],
+        }
+    )
+    assert result == expected
+    assert isinstance(result.status, StringArrayFilter)
+    assert result.close_date_range is not None
+    assert result.close_date_range.value.min == date(2026, 1, 1)
+
+
+def test_compiled_classifier_still_validates_registered_filters():
+    """Compiling the table once does not skip per-call validation."""
+    classifier = compile_classifier(SAMPLE_ROUTES, "opportunities", "search")
+    with pytest.raises(FilterError) as exc:
+        classifier.classify({"agency": f.eq("NSF")})
+    assert exc.value.path == "filters.agency"
+
+
 # ---------------------------------------------------------------------------
 # Registration-time validation (validate_routes) — RAISES FilterError
 # ---------------------------------------------------------------------------
@@ -626,6 +698,57 @@ def test_validate_filter_call_adhoc_incompatible_value_returns_error():
     assert error.path == "filters.legacyTag"
 
 
+_ADHOC_SAMPLE_VALUES = [
+    "v",
+    "42",
+    "2026-01-01",
+    42,
+    1.5,
+    0,
+    True,
+    ["a", "b"],
+    [1, 2],
+    ("a",),
+    [],
+    {"min": 0, "max": 10},
+    {"min": "2026-01-01", "max": "2026-12-31"},
+    {
+        "min": {"amount": "1", "currency": "USD"},
+        "max": {"amount": "9", "currency": "USD"},
+    },
+    {"amount": "100", "currency": "USD"},
+    date(2026, 1, 1),
+    None,
+]
+
+
+@pytest.mark.parametrize("operator", sorted(AD_HOC_VALUE_EXPECTATION))
+def test_validate_filter_call_adhoc_dispatch_matches_full_scan(operator):
+    """The (operator, value shape) dispatch picks the model the full scan would.
+
+    For every operator and a spread of value shapes, ad-hoc validation accepts
+    exactly when some valid filter model does, with the first such model's
+    coerced value.
+    """
+    for raw in _ADHOC_SAMPLE_VALUES:
+        payload = {"operator": operator, "value": raw}
+        expected = None
+        for model in VALID_FILTER_MODELS:
+            try:
+                expected = model.model_validate(payload).model_dump()
+            except ValidationError:
+                continue
+            break
+
+        value, error = validate_filter_call(None, "x", payload)
+
+        if expected is None:
+            assert value is None and error is not None, payload
+        else:
+            assert value is not None, payload
+            assert value.model_dump() == expected, payload
+
+
 def test_validate_filter_call_money_comparison_passes_valid_money():
     """A moneyComparison filter accepts a comparison operator and a Money value.
 